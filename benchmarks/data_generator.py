@@ -0,0 +1,49 @@
+from src.model import RegionDirection
+from datetime import date, timedelta
+from pathlib import Path
+import random
+
+PRODUCTS = [f"Widget {chr(ord('A') + i)}" for i in range(12)]
+MINUTES_PER_DAY = 24 * 60
+
+def generate_day(path: Path, rows: int, rng: random.Random, delimiter: str = ";") -> None:
+    """Writes one synthetic daily sales file in the hour;sales_amount;product;region format.
+
+    Args:
+        path (Path): Target CSV file.
+        rows (int): Number of rows, at most one per minute of the day.
+        rng (random.Random): Random generator.
+        delimiter (str, optional): CSV delimiter. Defaults to ';'.
+
+    Raises:
+        ValueError: If more rows than minutes in a day are requested.
+    """
+    if rows > MINUTES_PER_DAY:
+        raise ValueError(f"A day holds at most {MINUTES_PER_DAY} rows, got {rows}")
+    regions = [region.value for region in RegionDirection]
+    lines = [delimiter.join(["hour", "sales_amount", "product", "region"])]
+    for minute in sorted(rng.sample(range(MINUTES_PER_DAY), rows)):
+        amount = round(rng.lognormvariate(4.5, 0.6), 2)
+        lines.append(delimiter.join([
+            f"{minute // 60:02d}:{minute % 60:02d}", f"{amount}", rng.choice(PRODUCTS), rng.choice(regions)
+        ]))
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+def generate_archive(directory: Path, days: int, rows: int, seed: int = 42, start: date = date(2020, 1, 1)) -> int:
+    """Writes N consecutive daily files with M rows each.
+
+    Args:
+        directory (Path): Target directory, created if missing.
+        days (int): Number of daily files.
+        rows (int): Rows per file.
+        seed (int, optional): Random seed, so runs are comparable. Defaults to 42.
+        start (date, optional): Date of the first file. Defaults to 2020-01-01.
+
+    Returns:
+        int: Total number of generated rows.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
+    for offset in range(days):
+        generate_day(directory / f"{start + timedelta(days=offset)}.csv", rows, rng)
+    return days * rows
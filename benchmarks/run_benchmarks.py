@@ -0,0 +1,212 @@
+from benchmarks.data_generator import generate_archive
+from src.file_watcher import HourlySalesCsvHandler
+from src.io.pandas_reader import PandasCsvReader
+from src.io.mmap_reader import MmapCsvReader
+from src.ui_data_service import UIDataService
+from src.parser import HourlySalesCsvParser
+from src.service import SalesService
+from src.io.reader import CsvReader
+from src.model import SalesStore
+from collections.abc import Callable, Sequence
+from contextlib import redirect_stdout
+from functools import partial
+from datetime import datetime, time
+from time import perf_counter
+from pathlib import Path
+import tracemalloc
+import statistics
+import subprocess
+import tempfile
+import platform
+import argparse
+import logging
+import json
+import os
+
+DEFAULT_SCALES = ["30x24", "365x96", "1000x288"]
+
+def parse_scale(scale: str) -> tuple[int, int]:
+    """Parses a 'DAYSxROWS' scale string.
+
+    Args:
+        scale (str): Scale such as '365x96'.
+
+    Returns:
+        tuple[int, int]: Number of days and rows per day.
+    """
+    days, rows = scale.lower().split("x")
+    return int(days), int(rows)
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Returns the nearest-rank percentile of the samples.
+
+    Args:
+        samples (list[float]): Measured values.
+        fraction (float): Percentile between 0 and 1.
+
+    Returns:
+        float: The percentile, 0 if there are no samples.
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+def peak_alloc_mb(call: Callable[[], object]) -> float:
+    """Runs a call once under tracemalloc and returns the peak memory it allocated.
+
+    The peak covers only this call, unlike the resident set size of the process, which
+    never decreases and so carries the peak of earlier benchmarks into later ones.
+
+    Args:
+        call (Callable[[], object]): Call to trace.
+
+    Returns:
+        float: Peak traced allocation in MiB.
+    """
+    tracemalloc.start()
+    try:
+        call()
+        return tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    finally:
+        tracemalloc.stop()
+
+def measure(name: str, scale: str, calls: Sequence[Callable[[], object]], rows_per_call: int) -> dict:
+    """Runs each call once and summarizes latency, throughput and memory.
+
+    Memory is traced in an extra run of the last call after the timed runs, so the
+    tracing overhead does not distort the latencies.
+
+    Args:
+        name (str): Benchmark name.
+        scale (str): Scale the data was generated with.
+        calls (Sequence[Callable[[], object]]): Calls to time, one sample each.
+        rows_per_call (int): Rows processed by a single call, used for rows/s.
+
+    Returns:
+        dict: Machine readable result.
+    """
+    samples = []
+    for call in calls:
+        started = perf_counter()
+        call()
+        samples.append(perf_counter() - started)
+    total = sum(samples)
+    return {
+        "name": name,
+        "scale": scale,
+        "samples": len(samples),
+        "rows_per_s": rows_per_call * len(samples) / total if total else 0.0,
+        "p50_ms": percentile(samples, 0.5) * 1000,
+        "p99_ms": percentile(samples, 0.99) * 1000,
+        "mean_ms": statistics.fmean(samples) * 1000 if samples else 0.0,
+        "peak_alloc_mb": peak_alloc_mb(calls[-1]) if calls else 0.0,
+    }
+
+def run_scale(scale: str, repeat: int) -> list[dict]:
+    """Runs every benchmark against a freshly generated archive.
+
+    Args:
+        scale (str): Scale such as '365x96'.
+        repeat (int): Number of samples for report benchmarks.
+
+    Returns:
+        list[dict]: One result per benchmark.
+    """
+    days, rows = parse_scale(scale)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        total_rows = generate_archive(directory, days, rows)
+        files = sorted(directory.glob("*.csv"))
+        reader = CsvReader[time]()
+        parser = HourlySalesCsvParser(reader=reader, key_name="hour")
+        key_func = parser.key_func
+        pandas_reader = PandasCsvReader[time]()
+        mmap_reader = MmapCsvReader()
+
+        results.append(measure("csv_reader_read", scale, [partial(reader.read, f, key_func) for f in files], rows))
+        results.append(measure("csv_model_parser_parse", scale, [partial(parser.parse, f) for f in files], rows))
+        results.append(measure("pandas_reader_read_day", scale, [partial(pandas_reader.read_day, f) for f in files], rows))
+        results.append(measure("mmap_reader_read_day", scale, [partial(mmap_reader.read_day, f) for f in files], rows))
+
+        handlers: list[HourlySalesCsvHandler] = []
+        def initialize() -> None:
+            with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+                handlers.append(HourlySalesCsvHandler(store=SalesStore(days={}), parser=parser, watch_path=directory))
+        results.append(measure("handler_initialize_from_directory", scale, [initialize], total_rows))
+
+        # A new service per call starts with an empty ReportCache, so every sample
+        # computes the reports instead of returning the memoized ones.
+        handler = handlers[0]
+        results.append(measure(
+            "generate_report", scale, [lambda: SalesService(handler).generate_report()] * repeat, total_rows
+        ))
+        service = SalesService(handler)
+        results.append(measure("generate_report_cached", scale, [service.generate_report] * repeat, total_rows))
+        for report in ["report_total_price_per_day", "report_calculate_avg_sales",
+                       "report_sales_trend", "report_detect_outliers"]:
+            calls = [
+                partial(lambda name: getattr(UIDataService(SalesService(handler)), name)(), report)
+                for _ in range(repeat)
+            ]
+            results.append(measure(f"ui_{report}", scale, calls, total_rows))
+    return results
+
+def git_commit() -> str:
+    """Returns the current git commit or 'unknown'."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return "unknown"
+
+def compare(current: list[dict], baseline_path: Path) -> None:
+    """Prints the p50 change of every benchmark against a previous result file.
+
+    Args:
+        current (list[dict]): Results of this run.
+        baseline_path (Path): JSON file written by an earlier run.
+    """
+    baseline = {(r["name"], r["scale"]): r for r in json.loads(baseline_path.read_text())["results"]}
+    for result in current:
+        previous = baseline.get((result["name"], result["scale"]))
+        if previous is None or not previous["p50_ms"]:
+            continue
+        change = (result["p50_ms"] - previous["p50_ms"]) / previous["p50_ms"] * 100
+        print(f"{result['name']:<40} {result['scale']:>10} p50 {change:+7.1f}%")
+
+def main() -> None:
+    """Runs the benchmark suite and writes machine readable results."""
+    arg_parser = argparse.ArgumentParser(description="Benchmark ingestion, reporting and UI data paths")
+    arg_parser.add_argument("--scales", nargs="+", default=DEFAULT_SCALES, help="DAYSxROWS scales to run")
+    arg_parser.add_argument("--repeat", type=int, default=20, help="Samples for report benchmarks")
+    arg_parser.add_argument("--output", type=Path, default=None, help="JSON result file")
+    arg_parser.add_argument("--compare", type=Path, default=None, help="Earlier JSON result to compare with")
+    args = arg_parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    commit = git_commit()
+    results = [result for scale in args.scales for result in run_scale(scale, args.repeat)]
+    for result in results:
+        print(
+            f"{result['name']:<40} {result['scale']:>10} {result['rows_per_s']:>14,.0f} rows/s "
+            f"p50 {result['p50_ms']:>9.3f} ms p99 {result['p99_ms']:>9.3f} ms alloc {result['peak_alloc_mb']:>7.1f} MiB"
+        )
+
+    output = args.output or Path("benchmarks") / "results" / f"{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        "commit": commit,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "results": results,
+    }, indent=2))
+    print(f"Results written to {output}")
+
+    if args.compare is not None:
+        compare(results, args.compare)
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,6 @@
 from src.config import parse_arguments, setup_logging
-from src.file_watcher import HourlySalesCsvHandler
-from src.parser import HourlySalesCsvParser
-from watchdog.observers import Observer
 from src.service import SalesService
-from src.io.reader import CsvReader
-from src.model import SalesStore
-from datetime import time
+from src.runtime import SalesRuntime
 import logging
 import signal
 import threading
@@ -46,24 +41,14 @@ def main() -> None:
     logger.info(f"Starting CSV Sales in {watch_dir.resolve()}")
     logger.info(f"Starting login in {log_file.resolve()}")
 
-    store = SalesStore(days = {})
-    reader = CsvReader[time]()
-    parser = HourlySalesCsvParser(reader=reader, key_name=args.key_name)
-    handler = HourlySalesCsvHandler(store=store, parser=parser, watch_path=watch_dir)
-    service = SalesService(handler)
-
-    observer = Observer()
-    observer.schedule(handler, path=str(watch_dir), recursive=False)
-    observer.start()
-    logger.info(f"Watching {watch_dir} for Csv files")
+    runtime = SalesRuntime(args)
+    runtime.start()
 
     try:
-        run_menu(service)
+        run_menu(runtime.service)
 
     finally:
-        logger.info(f"Stopped observer ...")
-        observer.stop()
-        observer.join()
+        runtime.stop()
         logger.info(f"Shutdown complete")
 
 if __name__ == '__main__':
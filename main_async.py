@@ -0,0 +1,59 @@
+from src.config import parse_arguments, setup_logging
+from src.async_runtime import AsyncSalesRuntime
+import asyncio
+import logging
+import signal
+import sys
+
+def handle_shutdown_signal(stop_event: asyncio.Event) -> None:
+    logging.info("Received shutdown signal")
+    stop_event.set()
+
+async def run_menu(runtime: AsyncSalesRuntime, stop_event: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    lines: asyncio.Queue[str] = asyncio.Queue()
+    loop.add_reader(sys.stdin, lambda: lines.put_nowait(sys.stdin.readline()))
+    try:
+        while True:
+            print('\nPress Enter to generate report | Ctrl + C / CMD to exit')
+            if not await lines.get():
+                stop_event.set()
+                return
+            await runtime.generate_report()
+    finally:
+        loop.remove_reader(sys.stdin)
+
+
+async def main() -> None:
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, handle_shutdown_signal, stop_event)
+
+
+    args = parse_arguments()
+    watch_dir = args.dir
+    watch_dir.mkdir(exist_ok=True)
+
+    log_file = watch_dir / "logs" / args.logfile
+    setup_logging(log_file)
+
+    logger = logging.getLogger(__name__)
+    logger.info(f"Starting CSV Sales in {watch_dir.resolve()}")
+    logger.info(f"Starting login in {log_file.resolve()}")
+
+    runtime = await AsyncSalesRuntime.create(args)
+    await runtime.start()
+    menu = asyncio.create_task(run_menu(runtime, stop_event))
+
+    try:
+        await stop_event.wait()
+
+    finally:
+        menu.cancel()
+        await runtime.stop()
+        logger.info(f"Shutdown complete")
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,175 @@
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Hashable
+from src.runtime import SalesRuntime
+from src.service import SalesService
+from src.metrics import METRICS
+from time import perf_counter
+from typing import Callable
+import argparse
+import threading
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+type QueuedTask = tuple[float, Callable[[], None]]
+
+class AsyncEventBridge:
+    """Forwards ingestion tasks from the observer and coalescer threads into asyncio queues.
+
+    Tasks are sharded by path so that all tasks of a file land in the same queue in
+    the order they were submitted. When a shard is full the submitting thread waits for
+    free capacity, which applies backpressure instead of dropping events.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, shards: int, maxsize: int) -> None:
+        """Initializes the bridge.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): Loop owning the queues.
+            shards (int): Number of queues.
+            maxsize (int): Maximum number of waiting events across all queues.
+        """
+        self.loop = loop
+        shard_size = max(1, maxsize // shards)
+        self.queues: list[asyncio.Queue[QueuedTask]] = [asyncio.Queue(maxsize=shard_size) for _ in range(shards)]
+
+    @property
+    def pending(self) -> int:
+        """int: Tasks waiting in the queues."""
+        return sum(events.qsize() for events in self.queues)
+
+    def submit(self, key: Hashable, task: Callable[[], None]) -> None:
+        """Hands a task to the loop, blocking the calling thread while its shard is full.
+
+        Args:
+            key (Hashable): Key selecting the shard, usually the file path.
+            task (Callable[[], None]): Work to run on the parsing pool.
+        """
+        if self.loop.is_closed():
+            logger.warning(f"Event loop closed, running task for {key} on {threading.current_thread().name}")
+            task()
+            return
+        asyncio.run_coroutine_threadsafe(self.put(key, task), self.loop).result()
+
+    async def put(self, key: Hashable, task: Callable[[], None]) -> None:
+        """Enqueues a task on the shard of its key, waiting for free capacity.
+
+        Args:
+            key (Hashable): Key selecting the shard, usually the file path.
+            task (Callable[[], None]): Work to run on the parsing pool.
+        """
+        tasks = self.queues[hash(key) % len(self.queues)]
+        if tasks.full():
+            METRICS.increment("event_queue_blocked_total")
+        await tasks.put((perf_counter(), task))
+
+class AsyncSalesRuntime:
+    """Runs the sales pipeline on an asyncio event loop.
+
+    The file handler submits all its work to an AsyncEventBridge: the observer thread
+    submits the handling of every file event and the coalescer thread the parsing of
+    every settled file. One consumer task per queue runs each task on a bounded thread pool,
+    so the loop never blocks on file I/O or parsing and the tasks of a file still run
+    in order. Reports are generated off the loop and can be awaited.
+    """
+
+    def __init__(self, args: argparse.Namespace, loop: asyncio.AbstractEventLoop) -> None:
+        """Builds the pipeline and loads the watch directory.
+
+        The initial load blocks, so use create from a running loop.
+
+        Args:
+            args (argparse.Namespace): Arguments returned by parse_arguments. ingest_workers
+                sets the number of queues and parsing threads, at least 1.
+            loop (asyncio.AbstractEventLoop): Loop running the consumers.
+        """
+        self.loop = loop
+        self.workers = max(1, args.ingest_workers)
+        self.bridge = AsyncEventBridge(loop, self.workers, args.ingest_queue_size)
+        self.runtime = SalesRuntime(args, submit=self.bridge.submit)
+        self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="async-ingestion")
+        self._consumers: list[asyncio.Task[None]] = []
+
+    @classmethod
+    async def create(cls, args: argparse.Namespace) -> "AsyncSalesRuntime":
+        """Builds the runtime on a worker thread, so the initial load does not block the loop.
+
+        Args:
+            args (argparse.Namespace): Arguments returned by parse_arguments.
+
+        Returns:
+            AsyncSalesRuntime: Runtime bound to the running loop.
+        """
+        return await asyncio.to_thread(cls, args, asyncio.get_running_loop())
+
+    @property
+    def service(self) -> SalesService:
+        """SalesService: Service answering report queries."""
+        return self.runtime.service
+
+    async def start(self) -> None:
+        """Starts the consumers and watching the directory for CSV files."""
+        self._consumers = [
+            self.loop.create_task(self._consume(events), name=f"ingestion-{i}")
+            for i, events in enumerate(self.bridge.queues)
+        ]
+        self.runtime.start()
+
+    async def stop(self) -> None:
+        """Stops the producers, runs the queued tasks, cancels the consumers and stops the runtime.
+
+        Queued event tasks may still submit paths to the coalescer, so the queues are
+        drained before the coalescer is flushed, and drained again while the consumers
+        are still running to take the parses the flush submits.
+        """
+        await asyncio.to_thread(self._stop_observer)
+        await self._join()
+        await asyncio.to_thread(self._stop_coalescer)
+        await self._join()
+        for consumer in self._consumers:
+            consumer.cancel()
+        await asyncio.gather(*self._consumers, return_exceptions=True)
+        self.executor.shutdown()
+        await asyncio.to_thread(self.runtime.stop)
+
+    async def generate_report(self) -> dict:
+        """Generates the complete report on a worker thread.
+
+        Reports run on the default executor, so they never wait behind queued file events.
+
+        Returns:
+            dict: The report returned by SalesService.generate_report.
+        """
+        return await asyncio.to_thread(self.service.generate_report)
+
+    async def _join(self) -> None:
+        """Waits until every queued task has run."""
+        for tasks in self.bridge.queues:
+            await tasks.join()
+
+    def _stop_observer(self) -> None:
+        """Stops the observer, so no new file events are submitted."""
+        self.runtime.observer.stop()
+        self.runtime.observer.join()
+
+    def _stop_coalescer(self) -> None:
+        """Stops the coalescer and submits the files still waiting in it."""
+        if self.runtime.handler.coalescer is not None:
+            self.runtime.handler.coalescer.stop()
+
+    async def _consume(self, tasks: asyncio.Queue[QueuedTask]) -> None:
+        """Consumer loop running the tasks of a single queue on the parsing pool.
+
+        Args:
+            tasks (asyncio.Queue[QueuedTask]): The queue and the time each task was enqueued.
+        """
+        while True:
+            queued_at, task = await tasks.get()
+            METRICS.observe("event_queue_seconds", perf_counter() - queued_at)
+            try:
+                await self.loop.run_in_executor(self.executor, task)
+            except Exception as e:
+                logger.error(f"Ingestion task failed {e}")
+            finally:
+                tasks.task_done()
@@ -0,0 +1,147 @@
+from src.hourly_profile import HOURS
+from src.index import DayStats
+from src.metrics import METRICS
+from collections.abc import Callable
+from typing import NamedTuple
+from datetime import date
+from enum import StrEnum
+import threading
+import logging
+import queue
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+class Verbosity(StrEnum):
+    """How much the change reporter prints per changed day."""
+    QUIET = "quiet"
+    SUMMARY = "summary"
+    DETAIL = "detail"
+
+
+class DayChange(NamedTuple):
+    """Statistics of a day before and after a change.
+
+    Attributes:
+        day (date): The changed day.
+        previous (DayStats | None): Statistics before the change, None if the day is new.
+        current (DayStats | None): Statistics after the change, None if the day was removed.
+    """
+    day: date
+    previous: DayStats | None
+    current: DayStats | None
+
+
+def render_change(change: DayChange, verbosity: Verbosity) -> list[str]:
+    """Formats the delta of one changed day.
+
+    The summary line holds the rows added or removed and the new total; the detail
+    level adds one line per hour whose rows or total changed.
+
+    Args:
+        change (DayChange): The change to format.
+        verbosity (Verbosity): Level of detail.
+
+    Returns:
+        list[str]: Lines to print, empty when quiet.
+    """
+    if verbosity is Verbosity.QUIET:
+        return []
+    previous, current = change.previous, change.current
+    action = "created" if previous is None else "removed" if current is None else "updated"
+    rows = current.count if current is not None else 0
+    total = current.total if current is not None else 0.0
+    row_delta = rows - (previous.count if previous is not None else 0)
+    total_delta = total - (previous.total if previous is not None else 0.0)
+    lines = [f"{change.day} {action}: {rows} rows ({row_delta:+d}), total {total:.2f} ({total_delta:+.2f})"]
+    if verbosity is Verbosity.DETAIL:
+        lines.extend(_hour_deltas(previous, current))
+    return lines
+
+def _hour_deltas(previous: DayStats | None, current: DayStats | None) -> list[str]:
+    """Formats the rows and total delta of every hour that changed."""
+    rows = _hour_column(current, "counts") - _hour_column(previous, "counts")
+    totals = _hour_column(current, "totals") - _hour_column(previous, "totals")
+    return [
+        f"  {hour:02d}:00 {int(rows[hour]):+d} rows, {float(totals[hour]):+.2f}"
+        for hour in np.flatnonzero((rows != 0) | (totals != 0))
+    ]
+
+def _hour_column(stats: DayStats | None, column: str) -> np.ndarray:
+    """Returns the per-hour counts or totals of a day, zeros when it has none."""
+    if stats is None or stats.hours is None:
+        return np.zeros(HOURS)
+    return getattr(stats.hours, column)
+
+
+class ChangeReporter:
+    """Prints a short delta for every changed day from a background thread.
+
+    report() only enqueues the change, so the ingestion threads never format or write
+    to the console. When the queue is full the change is dropped instead of blocking.
+    """
+
+    def __init__(
+            self,
+            verbosity: Verbosity = Verbosity.SUMMARY,
+            write: Callable[[str], None] = print,
+            queue_size: int = 1000,
+    ) -> None:
+        """Initializes the reporter and starts its background thread unless it is quiet.
+
+        Args:
+            verbosity (Verbosity, optional): Level of detail. Defaults to Verbosity.SUMMARY.
+            write (Callable[[str], None], optional): Function printing one line. Defaults to print.
+            queue_size (int, optional): Maximum number of changes waiting to be printed. Defaults to 1000.
+        """
+        self.verbosity = verbosity
+        self.write = write
+        self._queue: queue.Queue[DayChange | str | None] = queue.Queue(maxsize=queue_size)
+        self._thread: threading.Thread | None = None
+        if verbosity is not Verbosity.QUIET:
+            self._thread = threading.Thread(target=self._run, name="change-reporter", daemon=True)
+            self._thread.start()
+
+    def report(self, change: DayChange) -> None:
+        """Schedules the delta of a changed day for printing.
+
+        Args:
+            change (DayChange): The change to print.
+        """
+        self._enqueue(change)
+
+    def loaded(self, days: int, rows: int) -> None:
+        """Schedules a one-line summary of the initial load.
+
+        Args:
+            days (int): Number of loaded days.
+            rows (int): Number of loaded rows.
+        """
+        self._enqueue(f"Loaded {days} days with {rows} rows")
+
+    def stop(self) -> None:
+        """Prints the pending changes and stops the background thread."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def _enqueue(self, item: DayChange | str) -> None:
+        """Puts an item on the queue without blocking the caller."""
+        if self._thread is None:
+            return
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            METRICS.increment("change_reports_dropped_total")
+
+    def _run(self) -> None:
+        """Background loop printing queued changes until the stop sentinel arrives."""
+        while (item := self._queue.get()) is not None:
+            try:
+                lines = [item] if isinstance(item, str) else render_change(item, self.verbosity)
+                for line in lines:
+                    self.write(line)
+            except Exception as e:
+                logger.error(f"Cannot report change {e}")
@@ -0,0 +1,124 @@
+from time import monotonic
+from typing import Callable
+from pathlib import Path
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+type FileState = tuple[int, int] | None
+
+class EventCoalescer:
+    """Coalesces bursts of file events into a single callback per settled write.
+
+    Every submitted path waits for a quiet window without new events. After the window
+    the file is checked again and the callback fires only once its size and modification
+    time stopped changing; otherwise the path waits for another window.
+    """
+
+    def __init__(self, callback: Callable[[Path], None], quiet_window: float) -> None:
+        """Initializes the coalescer and starts its background thread.
+
+        Args:
+            callback (Callable[[Path], None]): Function called once per settled path.
+            quiet_window (float): Seconds without events or file changes before a path settles.
+        """
+        self.callback = callback
+        self.quiet_window = quiet_window
+        self._pending: dict[Path, tuple[float, FileState]] = {}
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="event-coalescer", daemon=True)
+        self._thread.start()
+
+    def submit(self, path: Path) -> None:
+        """Registers an event for a path and restarts its quiet window.
+
+        Args:
+            path (Path): Path of the changed file.
+        """
+        state = self._file_state(path)
+        with self._condition:
+            self._pending[path] = (monotonic() + self.quiet_window, state)
+            self._condition.notify()
+
+    def discard(self, path: Path) -> None:
+        """Drops a pending path, e.g. after the file was deleted.
+
+        Args:
+            path (Path): Path of the file.
+        """
+        with self._condition:
+            self._pending.pop(path, None)
+
+    @property
+    def pending(self) -> int:
+        """int: Number of paths waiting to settle."""
+        return len(self._pending)
+
+    def flush(self) -> None:
+        """Fires the callback for every pending path immediately."""
+        with self._condition:
+            paths = list(self._pending)
+            self._pending.clear()
+        for path in paths:
+            self._fire(path)
+
+    def stop(self) -> None:
+        """Stops the background thread and flushes pending paths."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        self._thread.join()
+        self.flush()
+
+    def _run(self) -> None:
+        """Background loop firing callbacks for settled paths."""
+        while True:
+            with self._condition:
+                if self._stopped:
+                    return
+                now = monotonic()
+                due = [path for path, (deadline, _) in self._pending.items() if deadline <= now]
+                if not due:
+                    deadlines = [deadline for deadline, _ in self._pending.values()]
+                    self._condition.wait(timeout=min(deadlines) - now if deadlines else None)
+                    continue
+                settled = []
+                for path in due:
+                    _, previous = self._pending[path]
+                    current = self._file_state(path)
+                    if current == previous:
+                        del self._pending[path]
+                        settled.append(path)
+                    else:
+                        self._pending[path] = (now + self.quiet_window, current)
+            for path in settled:
+                self._fire(path)
+
+    def _fire(self, path: Path) -> None:
+        """Calls the callback for a path, logging any error.
+
+        Args:
+            path (Path): The settled path.
+        """
+        try:
+            self.callback(path)
+        except Exception as e:
+            logger.error(f"Error while processing {path.name} {e}")
+
+    @staticmethod
+    def _file_state(path: Path) -> FileState:
+        """Returns the size and modification time of a file or None if it is missing.
+
+        Args:
+            path (Path): Path of the file.
+
+        Returns:
+            FileState: Size and modification time in nanoseconds.
+        """
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
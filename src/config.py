@@ -12,12 +12,27 @@ CSV_DELIMITER = os.getenv("CSV_DELIMITER", ";")
 DATA_PATTERN = os.getenv("DATA_PATTERN", "%Y-%m-%d")
 TIME_FORMAT = os.getenv("TIME_FORMAT", "%H:%M")
 KEY_NAME = os.getenv("KEY_NAME", "hour")
+LOAD_WORKERS = int(os.getenv("LOAD_WORKERS", "1"))
+SNAPSHOT_ENABLED = os.getenv("SNAPSHOT_ENABLED", "true").lower() == "true"
+SNAPSHOT_FILE = os.getenv("SNAPSHOT_FILE", "store.snapshot")
+QUIET_WINDOW = float(os.getenv("QUIET_WINDOW", "0.5"))
+INGEST_WORKERS = int(os.getenv("INGEST_WORKERS", "2"))
+INGEST_QUEUE_SIZE = int(os.getenv("INGEST_QUEUE_SIZE", "1000"))
+INGEST_ENGINE = os.getenv("INGEST_ENGINE", "csv")
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "false").lower() == "true"
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))
+METRICS_INTERVAL = float(os.getenv("METRICS_INTERVAL", "10"))
+METRICS_FILE = os.getenv("METRICS_FILE", "metrics.json")
+PROFILE_ENABLED = os.getenv("PROFILE_ENABLED", "false").lower() == "true"
+PROFILE_RATE = float(os.getenv("PROFILE_RATE", "1.0"))
+REPORT_VERBOSITY = os.getenv("REPORT_VERBOSITY", "summary")
+ARCHIVE_ENABLED = os.getenv("ARCHIVE_ENABLED", "true").lower() == "true"
 
 def parse_arguments() -> argparse.Namespace:
     """Parses command-line arguments for the CSV sales watcher script.
 
     Returns:
-        argparse.Namespace: Parsed arguments including directory, log file, and key name.
+        argparse.Namespace: Parsed arguments including directory, log file, key name and load workers.
     """
     arg_parser = argparse.ArgumentParser(description="Watch directory for Csv Sales files")
     arg_parser.add_argument(
@@ -38,6 +53,78 @@ def parse_arguments() -> argparse.Namespace:
         default=KEY_NAME,
         help="Key name used in row parsing (default: hour)"
     )
+    arg_parser.add_argument(
+        "--workers",
+        type=int,
+        default=LOAD_WORKERS,
+        help="Number of processes parsing files during the initial load, 1 disables parallel loading (default: 1)"
+    )
+    arg_parser.add_argument(
+        "--snapshot",
+        action=argparse.BooleanOptionalAction,
+        default=SNAPSHOT_ENABLED,
+        help="Reuse parsed files from the snapshot in <dir>/cache on start-up (default: enabled)"
+    )
+    arg_parser.add_argument(
+        "--quiet-window",
+        type=float,
+        default=QUIET_WINDOW,
+        help="Seconds a file must stay unchanged before it is parsed, 0 parses on every event (default: 0.5)"
+    )
+    arg_parser.add_argument(
+        "--ingest-workers",
+        type=int,
+        default=INGEST_WORKERS,
+        help="Number of threads ingesting file events, 0 ingests on the observer thread (default: 2)"
+    )
+    arg_parser.add_argument(
+        "--ingest-queue-size",
+        type=int,
+        default=INGEST_QUEUE_SIZE,
+        help="Maximum number of queued file events before the observer is slowed down (default: 1000)"
+    )
+    arg_parser.add_argument(
+        "--engine",
+        choices=["csv", "pandas", "mmap"],
+        default=INGEST_ENGINE,
+        help="CSV ingestion engine: row-by-row csv module, vectorized pandas or memory-mapped byte scanning (default: csv)"
+    )
+    arg_parser.add_argument(
+        "--metrics",
+        action=argparse.BooleanOptionalAction,
+        default=METRICS_ENABLED,
+        help="Record timers and counters of the hot paths and dump them to <dir>/logs (default: disabled)"
+    )
+    arg_parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=METRICS_PORT,
+        help="Serve Prometheus metrics on http://127.0.0.1:<port>/metrics, 0 disables the endpoint (default: 0)"
+    )
+    arg_parser.add_argument(
+        "--profile",
+        action=argparse.BooleanOptionalAction,
+        default=PROFILE_ENABLED,
+        help="Write cProfile and tracemalloc profiles of loads and reports to <dir>/logs/profiles (default: disabled)"
+    )
+    arg_parser.add_argument(
+        "--profile-rate",
+        type=float,
+        default=PROFILE_RATE,
+        help="Fraction of operations profiled when --profile is set, between 0 and 1 (default: 1.0)"
+    )
+    arg_parser.add_argument(
+        "--verbosity",
+        choices=["quiet", "summary", "detail"],
+        default=REPORT_VERBOSITY,
+        help="Console output per changed day: nothing, rows and total, or also changed hours (default: summary)"
+    )
+    arg_parser.add_argument(
+        "--archive",
+        action=argparse.BooleanOptionalAction,
+        default=ARCHIVE_ENABLED,
+        help="Load days archived in <dir>/archive that have no CSV file on start-up (default: enabled)"
+    )
 
     return arg_parser.parse_args()
 
@@ -0,0 +1,165 @@
+from src.model import PRODUCTS, REGIONS, REGION_CODES, RegionDirection, SalesDay
+from collections.abc import Collection, Iterable, Iterator, Sequence
+from datetime import date
+from enum import StrEnum
+from array import array
+import numpy as np
+
+class Dimension(StrEnum):
+    """Dimensions the sales cube can be grouped by."""
+    DAY = "day"
+    PRODUCT = "product"
+    REGION = "region"
+
+class CubeCell:
+    """Sum and count of the sales falling into one cell of the cube.
+
+    Attributes:
+        count (int): Number of sales.
+        total (float): Sum of sales amounts.
+    """
+
+    __slots__ = ("count", "total")
+
+    def __init__(self, count: int = 0, total: float = 0.0) -> None:
+        self.count = count
+        self.total = total
+
+    @property
+    def mean(self) -> float:
+        """float: Average sales amount. Returns 0 if there are no sales."""
+        return self.total / self.count if self.count else 0
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CubeCell):
+            return NotImplemented
+        return self.count == other.count and self.total == other.total
+
+    def __repr__(self) -> str:
+        return f"CubeCell(count={self.count}, total={self.total})"
+
+type CubeKey = tuple[date | str | RegionDirection, ...]
+
+class DayCube:
+    """Sales of a single day aggregated per (product code, region code).
+
+    Cells are kept in parallel typed arrays, so a day costs a few bytes per product
+    and region combination regardless of how many rows it has.
+
+    Attributes:
+        products (array[int]): Product code of each cell.
+        regions (array[int]): Region code of each cell.
+        counts (array[int]): Number of sales in each cell.
+        totals (array[float]): Sum of sales amounts in each cell.
+    """
+
+    __slots__ = ("products", "regions", "counts", "totals")
+
+    def __init__(self) -> None:
+        self.products = array("I")
+        self.regions = array("B")
+        self.counts = array("I")
+        self.totals = array("d")
+
+    @classmethod
+    def from_sales_day(cls, sales_day: SalesDay) -> "DayCube":
+        """Aggregates the rows of a day with one vectorized group-by.
+
+        Args:
+            sales_day (SalesDay): Columnar sales of one day.
+
+        Returns:
+            DayCube: Sum and count per product and region.
+        """
+        if not len(sales_day):
+            return cls()
+        return cls._grouped(
+            np.frombuffer(sales_day.products, dtype=np.uint32),
+            np.frombuffer(sales_day.regions, dtype=np.uint8),
+            np.ones(len(sales_day)),
+            np.frombuffer(sales_day.amounts, dtype=np.float64),
+        )
+
+    def combined(self, other: "DayCube") -> "DayCube":
+        """Returns a cube holding the sales of both cubes, e.g. after rows were appended to a day.
+
+        Costs O(cells) instead of a pass over the rows of the day.
+
+        Args:
+            other (DayCube): Cube of further sales of the same day.
+
+        Returns:
+            DayCube: Sum and count per product and region of both cubes.
+        """
+        if not len(other):
+            return self
+        if not len(self):
+            return other
+        return DayCube._grouped(
+            np.concatenate([np.frombuffer(self.products, dtype=np.uint32), np.frombuffer(other.products, dtype=np.uint32)]),
+            np.concatenate([np.frombuffer(self.regions, dtype=np.uint8), np.frombuffer(other.regions, dtype=np.uint8)]),
+            np.concatenate([np.frombuffer(self.counts, dtype=np.uint32), np.frombuffer(other.counts, dtype=np.uint32)]),
+            np.concatenate([np.frombuffer(self.totals, dtype=np.float64), np.frombuffer(other.totals, dtype=np.float64)]),
+        )
+
+    @classmethod
+    def _grouped(cls, products: np.ndarray, regions: np.ndarray, counts: np.ndarray, totals: np.ndarray) -> "DayCube":
+        """Groups counts and totals by product and region with np.unique and np.bincount."""
+        cells, inverse = np.unique(products.astype(np.int64) * len(REGIONS) + regions, return_inverse=True)
+        cube = cls()
+        cube.products = array("I", (cells // len(REGIONS)).astype(np.uint32).tobytes())
+        cube.regions = array("B", (cells % len(REGIONS)).astype(np.uint8).tobytes())
+        cube.counts = array("I", np.bincount(inverse, weights=counts, minlength=len(cells)).astype(np.uint32).tobytes())
+        cube.totals = array("d", np.bincount(inverse, weights=totals, minlength=len(cells)).tobytes())
+        return cube
+
+    def cells(self) -> Iterator[tuple[int, int, int, float]]:
+        """Yields (product code, region code, count, total) of every cell."""
+        return zip(self.products, self.regions, self.counts, self.totals)
+
+    def __len__(self) -> int:
+        return len(self.products)
+
+
+def slice_cube(
+        cubes: Iterable[tuple[date, DayCube]],
+        group_by: Sequence[Dimension] = (),
+        products: Collection[str] | None = None,
+        regions: Collection[RegionDirection] | None = None,
+) -> dict[CubeKey, CubeCell]:
+    """Filters and groups day cubes without touching the underlying rows.
+
+    Args:
+        cubes (Iterable[tuple[date, DayCube]]): Cubes of the days to include.
+        group_by (Sequence[Dimension], optional): Dimensions of the result keys, in order.
+            Defaults to a single total over everything.
+        products (Collection[str] | None, optional): Products to keep. Defaults to all.
+        regions (Collection[RegionDirection] | None, optional): Regions to keep. Defaults to all.
+
+    Returns:
+        dict[CubeKey, CubeCell]: Sum and count per group, keyed by one value per dimension.
+    """
+    product_codes = None
+    if products is not None:
+        product_codes = {code for code in map(PRODUCTS.lookup, products) if code is not None}
+    region_codes = {REGION_CODES[region] for region in regions} if regions is not None else None
+
+    result: dict[CubeKey, CubeCell] = {}
+    for day, cube in cubes:
+        for product, region, count, total in cube.cells():
+            if product_codes is not None and product not in product_codes:
+                continue
+            if region_codes is not None and region not in region_codes:
+                continue
+            key = tuple(
+                day if dimension is Dimension.DAY
+                else PRODUCTS.decode(product) if dimension is Dimension.PRODUCT
+                else REGIONS[region]
+                for dimension in group_by
+            )
+            cell = result.get(key)
+            if cell is None:
+                cell = result[key] = CubeCell()
+            cell.count += count
+            cell.total += total
+    return result
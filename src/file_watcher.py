@@ -1,26 +1,71 @@
 from watchdog.events import FileSystemEventHandler, FileSystemEvent
-from src.model import HourlySales, SalesDay, SalesStore
-from collections.abc import MutableMapping
+from src.model import HourlySales, Period, SalesDay, SalesStore
+from src.index import DayStats, SalesIndex, SortedDays, TotalsRanking
+from src.hourly_profile import HourlyProfile
+from src.change_reporter import ChangeReporter, DayChange
+from collections.abc import Collection, Mapping, MutableMapping
+from collections import deque
 from datetime import datetime, date, time
-from src.utils import show_sales_store
-from src.parser import CsvModelParser
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from src.coalescer import EventCoalescer
+from src.ingestion import IngestionQueue, SubmitTask
+from src.parser import CsvModelParser, parse_batch, parse_file, read_sales_day
+from src.io.reader import SalesDayReader
+from src.io.tail import FileTail, ingested_prefix, read_appended
+from src.io.archive import ARCHIVE_SUFFIXES, import_day
+from src.snapshot import Fingerprint, StoreSnapshot
+from src.metrics import METRICS
+from src.profiling import PROFILER
+from src.store import VersionedStore
+from types import MappingProxyType
+from time import perf_counter
 from pydantic import BaseModel
-from typing import Callable
+from typing import Callable, NamedTuple
+from functools import partial
 from pathlib import Path
+from multiprocessing.context import BaseContext
+import multiprocessing
+import os
+import threading
 import logging
+import pickle
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
-class CsvHandler[T: BaseModel, K, I, V: BaseModel](FileSystemEventHandler):
+def _load_context(parse: Callable[[Path], object]) -> BaseContext:
+    """Returns the multiprocessing context starting the initial load workers.
+
+    The forkserver forks every worker from one clean process that already imported the
+    modules of the parse function and its arguments, so the workers neither inherit the
+    threads of this process nor import those modules each. Platforms without it spawn
+    the workers.
+
+    Args:
+        parse (Callable[[Path], object]): Function the workers run.
+
+    Returns:
+        BaseContext: The context for the process pool.
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context("forkserver")
+    target, arguments = (parse.func, parse.args) if isinstance(parse, partial) else (parse, ())
+    context.set_forkserver_preload(sorted({target.__module__, *(type(argument).__module__ for argument in arguments)}))
+    return context
+
+class CsvHandler[T: BaseModel, K, I, V](FileSystemEventHandler):
     """Generic CSV file handler for file system events (create, delete, modify).
 
     This class processes CSV files and stores parsed data into a dictionary-like store.
+    The version attribute is incremented on every change of the store; initializing is
+    True while the files already present in the watched directory are loaded.
 
     Type Args:
         T (BaseModel): The type of parsed model per item.
         K: The key type for the store.
         I: The key type for inner data within each file.
-        V (BaseModel): The value type stored for each file.
+        V: The value type stored for each file.
     """
 
     def __init__(
@@ -30,24 +75,117 @@ class CsvHandler[T: BaseModel, K, I, V: BaseModel](FileSystemEventHandler):
         key_func: Callable[[Path], K],
         value_func: Callable[[dict[I, T]], V],
         watch_path: Path,
+        workers: int = 1,
+        snapshot: StoreSnapshot[V] | None = None,
+        quiet_window: float = 0.0,
+        ingest_workers: int = 0,
+        ingest_queue_size: int = 1000,
+        change_log_size: int = 1024,
+        submit: SubmitTask | None = None,
     ) -> None:
         """Initializes the handler and preloads existing CSV files in the directory.
 
+        Watchdog callbacks only enqueue work when ingest_workers is positive; parsing then
+        happens on the ingestion worker threads instead of the observer thread.
+
         Args:
             store (MutableMapping[K, V]): A mapping that holds parsed results.
             parser (CsvModelParser[I, T]): Parser used to read and convert CSV to models.
             key_func (Callable[[Path], K]): Function to extract key from file path.
             value_func (Callable[[dict[I, T]], V]): Function to convert parsed rows to value.
             watch_path (Path): Directory path to initialize from and watch.
+            workers (int, optional): Number of processes parsing files during the initial load.
+                Values above 1 enable parallel loading. Defaults to 1.
+            snapshot (StoreSnapshot[V] | None, optional): Cache of parsed files reused for
+                files whose fingerprint did not change. Defaults to None.
+            quiet_window (float, optional): Seconds a file must stay unchanged before create and
+                modify events are parsed. 0 parses on every event. Defaults to 0.
+            ingest_workers (int, optional): Number of ingestion worker threads. 0 handles events
+                on the observer thread. Defaults to 0.
+            ingest_queue_size (int, optional): Maximum number of queued ingestion tasks. Defaults to 1000.
+            change_log_size (int, optional): Number of recent changes remembered for
+                changes_since. Defaults to 1024.
+            submit (SubmitTask | None, optional): Function running ingestion tasks keyed by path,
+                e.g. on an asyncio loop, used instead of the ingestion workers. Defaults to None.
         """
         self.store = store
         self.parser = parser
         self.key_func = key_func
         self.value_func = value_func
+        self.workers = workers
+        self.store_snapshot = snapshot
+        self.version = 0
+        self._changes: deque[tuple[int, Collection[K]]] = deque(maxlen=change_log_size)
+        self._write_lock = threading.RLock()
+        self.coalescer = EventCoalescer(self._settled, quiet_window) if quiet_window > 0 else None
+        self.ingestion = IngestionQueue(ingest_workers, ingest_queue_size) if ingest_workers > 0 and submit is None else None
+        self.submit = submit
+        self.initializing = True
         self._initialize_from_directory(watch_path)
+        self.initializing = False
 
     def on_created(self, event: FileSystemEvent):
         """Triggered when a new file is created in the watched directory."""
+        METRICS.increment("watchdog_events_total", event="created")
+        self._submit(Path(str(event.src_path)), lambda: self._handle_created(event))
+
+    def on_deleted(self, event: FileSystemEvent):
+        """Triggered when a file is deleted from the watched directory."""
+        METRICS.increment("watchdog_events_total", event="deleted")
+        self._submit(Path(str(event.src_path)), lambda: self._handle_deleted(event))
+
+    def on_modified(self, event: FileSystemEvent):
+        """Triggered when a file is modified in the watched directory."""
+        METRICS.increment("watchdog_events_total", event="modified")
+        self._submit(Path(str(event.src_path)), lambda: self._handle_modified(event))
+
+    def changes_since(self, version: int) -> set[K] | None:
+        """Returns the keys changed after the given version.
+
+        Args:
+            version (int): Version the caller has already seen.
+
+        Returns:
+            set[K] | None: Keys stored or removed since that version, or None when the
+                change log no longer reaches back that far.
+        """
+        with self._write_lock:
+            if version > self.version:
+                return None
+            if version < self.version and (not self._changes or self._changes[0][0] > version + 1):
+                return None
+            return {key for changed_at, keys in self._changes if changed_at > version for key in keys}
+
+    def close(self) -> None:
+        """Processes pending events, then stops the coalescer and the ingestion workers.
+
+        Queued events are handled first, since they may still submit paths to the
+        coalescer; its flush then queues the parses of the pending paths, which run
+        before the workers stop.
+        """
+        if self.ingestion is not None:
+            self.ingestion.join()
+        if self.coalescer is not None:
+            self.coalescer.stop()
+        if self.ingestion is not None:
+            self.ingestion.stop()
+
+    def _submit(self, path: Path, task: Callable[[], None]) -> None:
+        """Runs a task with the submit function, on the ingestion queue or directly without either.
+
+        Args:
+            path (Path): Path of the affected file, used to keep its tasks in order.
+            task (Callable[[], None]): Work to run.
+        """
+        if self.submit is not None:
+            self.submit(path, task)
+        elif self.ingestion is None:
+            task()
+        else:
+            self.ingestion.submit(path, task)
+
+    def _handle_created(self, event: FileSystemEvent) -> None:
+        """Handles a file creation event."""
         if self._should_ignore(event):
             return
         path = Path(str(event.src_path))
@@ -55,24 +193,26 @@ class CsvHandler[T: BaseModel, K, I, V: BaseModel](FileSystemEventHandler):
         if key in self.store:
             logger.warning(f"Key {key} already exists skipping")
             return
+        if self.coalescer is not None:
+            self.coalescer.submit(path)
+            return
         self._add_or_update(path, key, created=True)
-        show_sales_store(self.store)
 
-    def on_deleted(self, event: FileSystemEvent):
-        """Triggered when a file is deleted from the watched directory."""
+    def _handle_deleted(self, event: FileSystemEvent) -> None:
+        """Handles a file deletion event."""
         if self._should_ignore(event):
             return
         path = Path(str(event.src_path))
         key = self.key_func(path)
-        if key in self.store:
-            del self.store[key]
+        if self.coalescer is not None:
+            self.coalescer.discard(path)
+        if self._remove(key):
             logger.info(f"Key {key} deleted")
         else:
             logger.warning(f"Key {key} does not exist")
-        show_sales_store(self.store)
 
-    def on_modified(self, event: FileSystemEvent):
-        """Triggered when a file is modified in the watched directory."""
+    def _handle_modified(self, event: FileSystemEvent) -> None:
+        """Handles a file modification event."""
         if event.is_directory:
             return
 
@@ -80,14 +220,33 @@ class CsvHandler[T: BaseModel, K, I, V: BaseModel](FileSystemEventHandler):
         key = self.key_func(path)
 
         if not path.name.endswith("csv"):
-            if key in self.store:
-                del self.store[key]
+            if self._remove(key):
                 logger.info(f"Deleted {key} when file name does not end with .csv")
-            show_sales_store(self.store)
             return
 
+        if self.coalescer is not None:
+            self.coalescer.submit(path)
+            return
         self._add_or_update(path, key, created=False)
-        show_sales_store(self.store)
+
+    def _settled(self, path: Path) -> None:
+        """Called by the coalescer once a path settled; schedules its ingestion.
+
+        Args:
+            path (Path): Path to the settled CSV file.
+        """
+        self._submit(path, lambda: self._ingest_settled(path))
+
+    def _ingest_settled(self, path: Path) -> None:
+        """Parses a file once its coalesced events settled.
+
+        Args:
+            path (Path): Path to the settled CSV file.
+        """
+        if not path.exists():
+            return
+        key = self._extract_key(path)
+        self._add_or_update(path, key, created=key not in self.store)
 
     def _should_ignore(self, event: FileSystemEvent) -> bool:
         """Determines whether a file system event should be ignored.
@@ -127,14 +286,191 @@ class CsvHandler[T: BaseModel, K, I, V: BaseModel](FileSystemEventHandler):
             key (K): The key under which data is stored.
             created (bool): Flag to distinguish between creation and modification.
         """
+        with PROFILER.profile("add_or_update"):
+            try:
+                with METRICS.timer("file_load_seconds"):
+                    value, rows = self._load(path)
+                with METRICS.timer("store_update_seconds"):
+                    self._set(key, value)
+                METRICS.increment("rows_ingested_total", rows)
+                action = "created" if created else "updated"
+                logger.info(f"{action} {key} with {rows} entries")
+            except Exception as e:
+                METRICS.increment("ingest_errors_total")
+                logger.error(f"Error file in {path.name} while adding or updating {e}")
+
+    def _load(self, path: Path) -> tuple[V, int]:
+        """Parses a file and converts it into a store value.
+
+        Args:
+            path (Path): Path to the CSV file.
+
+        When a snapshot is configured, unchanged files are served from it without parsing.
+
+        Returns:
+            tuple[V, int]: The value to store and the number of parsed rows.
+        """
+        cached, fingerprint = self._cached(path)
+        if cached is not None:
+            return cached
+        value, rows = self._parse(path)
+        self._remember(path, fingerprint, value, rows)
+        return value, rows
+
+    def _cached(self, path: Path) -> tuple[tuple[V, int] | None, Fingerprint | None]:
+        """Looks a file up in the snapshot, without parsing it.
+
+        Args:
+            path (Path): Path to the CSV file.
+
+        Returns:
+            tuple[tuple[V, int] | None, Fingerprint | None]: The cached value and its row count
+                or None on a miss, and the fingerprint of the file or None without a snapshot.
+        """
+        if self.store_snapshot is None:
+            return None, None
+        fingerprint = self.store_snapshot.fingerprint(path)
+        cached = self.store_snapshot.get(path, fingerprint)
+        if cached is not None:
+            METRICS.increment("snapshot_hits_total")
+        return cached, fingerprint
+
+    def _remember(self, path: Path, fingerprint: Fingerprint | None, value: V, rows: int) -> None:
+        """Records a parsed file in the snapshot, if one is configured.
+
+        Args:
+            path (Path): Path to the CSV file.
+            fingerprint (Fingerprint | None): Fingerprint returned by _cached.
+            value (V): Parsed value.
+            rows (int): Number of parsed rows.
+        """
+        if self.store_snapshot is not None and fingerprint is not None:
+            self.store_snapshot.put(path, fingerprint, value, rows)
+
+    def _parse(self, path: Path) -> tuple[V, int]:
+        """Parses a file with the parser and converts the rows with value_func.
+
+        Args:
+            path (Path): Path to the CSV file.
+
+        Returns:
+            tuple[V, int]: The parsed value and the number of parsed rows.
+        """
+        return parse_file(self.parser, self.value_func, path)
+
+    def _parse_task(self) -> Callable[[Path], tuple[V, int]]:
+        """Returns a function parsing a file like _parse, to be pickled for a worker process.
+
+        Returns:
+            Callable[[Path], tuple[V, int]]: Parse function without a reference to the handler.
+        """
+        return partial(parse_file, self.parser, self.value_func)
+
+    def save_snapshot(self) -> None:
+        """Persists the snapshot of parsed files, if one is configured."""
+        if self.store_snapshot is None:
+            return
         try:
-            parser_data: dict[I, T] = self.parser.parse(path)
-            value = self.value_func(parser_data)
-            self.store[key] = value
-            action = "created" if created else "updated"
-            logger.info(f"{action} {key} with {len(parser_data)} entries")
+            self.store_snapshot.save()
         except Exception as e:
-            logger.error(f"Error file in {path.name} while adding or updating {e}")
+            logger.error(f"Cannot save snapshot {e}")
+
+    def _published_store(self) -> Mapping[K, V]:
+        """Returns an immutable view of the store.
+
+        VersionedStore publishes its views in O(1); other mappings are copied.
+
+        Returns:
+            Mapping[K, V]: View that is not affected by later writes.
+        """
+        if isinstance(self.store, VersionedStore):
+            return self.store.snapshot()[1]
+        return MappingProxyType(dict(self.store))
+
+    def _set(self, key: K, value: V, appended_from: int | None = None) -> None:
+        """Stores a value and notifies about the change while holding the write lock.
+
+        Args:
+            key (K): The key under which data is stored.
+            value (V): The value to store.
+            appended_from (int | None, optional): Number of leading rows the value shares with
+                the previous value when rows were only appended, None otherwise. Defaults to None.
+        """
+        with self._write_lock:
+            self.store[key] = value
+            self._changed(key, value, appended_from)
+
+    def _remove(self, key: K) -> bool:
+        """Removes a key and notifies about the change while holding the write lock.
+
+        Args:
+            key (K): The key to remove.
+
+        Returns:
+            bool: True if the key was present, False otherwise.
+        """
+        with self._write_lock:
+            if key not in self.store:
+                return False
+            del self.store[key]
+            self._changed(key, None)
+            return True
+
+    def _changed(self, key: K, value: V | None, appended_from: int | None = None) -> None:
+        """Bumps the store version and notifies subclasses about a changed key.
+
+        Args:
+            key (K): The changed key.
+            value (V | None): The stored value or None when the key was removed.
+            appended_from (int | None, optional): Number of leading rows shared with the
+                previous value when rows were only appended. Defaults to None.
+        """
+        self.version += 1
+        self._changes.append((self.version, (key,)))
+        self._on_change(key, value, appended_from)
+
+    def _set_many(self, values: Mapping[K, V]) -> None:
+        """Stores several values as a single change while holding the write lock.
+
+        The store is updated and published once, the version is bumped once and
+        subclasses are notified once with the whole batch, so loading n files does
+        not republish the store and its derived state n times.
+
+        Args:
+            values (Mapping[K, V]): Values to store by key.
+        """
+        if not values:
+            return
+        with self._write_lock:
+            self.store.update(values)
+            self.version += 1
+            self._changes.append((self.version, tuple(values)))
+            self._on_batch(values)
+
+    def _on_change(self, key: K, value: V | None, appended_from: int | None = None) -> None:
+        """Hook called after a key has been stored or removed.
+
+        Subclasses override it to keep derived indexes in sync with the store.
+
+        Args:
+            key (K): The changed key.
+            value (V | None): The stored value or None when the key was removed.
+            appended_from (int | None, optional): Number of leading rows shared with the
+                previous value when rows were only appended. Defaults to None.
+        """
+        pass
+
+    def _on_batch(self, values: Mapping[K, V]) -> None:
+        """Hook called after several keys have been stored as one change.
+
+        Calls _on_change for every key; subclasses override it to update their derived
+        indexes in one pass.
+
+        Args:
+            values (Mapping[K, V]): The stored values by key.
+        """
+        for key, value in values.items():
+            self._on_change(key, value)
 
     def _initialize_from_directory(self, watch_path: Path) -> None:
         """Initializes the store from all CSV files in the given directory.
@@ -146,32 +482,193 @@ class CsvHandler[T: BaseModel, K, I, V: BaseModel](FileSystemEventHandler):
             logger.error(f"Watch path {watch_path} does not exist")
             return
 
-        for path in watch_path.iterdir():
-            if not path.is_file() or path.suffix != ".csv":
-                continue
+        with PROFILER.profile("initialize_from_directory"):
+            paths = self._initial_paths(watch_path)
+            workers = min(self.workers, os.cpu_count() or 1)
+            if workers > 1:
+                self._set_many(self._initialize_parallel(paths, workers))
+            else:
+                self._set_many(self._initialize_serial(paths))
+
+        logger.info(f"Initialized {len(self.store)} entries")
+        self.save_snapshot()
+
+
+    def _initial_paths(self, watch_path: Path) -> list[Path]:
+        """Returns the files loaded on start-up.
+
+        Args:
+            watch_path (Path): Watched directory.
+
+        Returns:
+            list[Path]: CSV files in the directory.
+        """
+        return [path for path in watch_path.iterdir() if path.is_file() and path.suffix == ".csv"]
 
+    def _initialize_serial(self, paths: list[Path]) -> dict[K, V]:
+        """Parses files one after another into a plain dict, which is published at once.
+
+        Args:
+            paths (list[Path]): Files to load.
+
+        Returns:
+            dict[K, V]: Loaded values by key.
+        """
+        loaded: dict[K, V] = {}
+        for path in paths:
             try:
                 key = self._extract_key(path)
-                self._add_or_update(path, key, created=True)
-                logger.info(f"Initialized {key}")
+                with METRICS.timer("file_load_seconds"):
+                    value, rows = self._load(path)
+                loaded[key] = value
+                METRICS.increment("rows_ingested_total", rows)
+                logger.info(f"Initialized {key} with {rows} entries")
             except Exception as e:
+                METRICS.increment("ingest_errors_total")
                 logger.error(f"Error in file {path.name} while initializing {e}")
+        return loaded
 
-        logger.info(f"Initialized {len(self.store)} entries")
-        show_sales_store(self.store)
+    def _initialize_parallel(self, paths: list[Path], workers: int) -> dict[K, V]:
+        """Parses files in worker processes into a plain dict, which is published at once.
+
+        Parsing holds the GIL, so threads would not run it in parallel. Files served from
+        the snapshot or an archive are loaded in this process; the others are parsed in
+        batches by a process pool, which ships the parsed values back pickled. Handlers
+        whose parser or value_func cannot be pickled load their files serially.
+
+        Args:
+            paths (list[Path]): Files to load.
+            workers (int): Number of worker processes, at most the number of CPUs.
+
+        Returns:
+            dict[K, V]: Loaded values by key.
+        """
+        parse = self._parse_task()
+        try:
+            pickle.dumps(parse)
+        except Exception as e:
+            logger.warning(f"Cannot parse files in worker processes, loading them serially {e}")
+            return self._initialize_serial(paths)
+
+        started = perf_counter()
+        loaded: dict[K, V] = {}
+        total_rows = 0
+        keys: dict[Path, K] = {}
+        fingerprints: dict[Path, Fingerprint | None] = {}
+        for path in paths:
+            try:
+                key = self._extract_key(path)
+                cached, fingerprint = self._cached(path)
+            except Exception as e:
+                METRICS.increment("ingest_errors_total")
+                logger.error(f"Error in file {path.name} while initializing {e}")
+                continue
+            if cached is None:
+                keys[path] = key
+                fingerprints[path] = fingerprint
+            else:
+                loaded[key] = cached[0]
+                total_rows += cached[1]
+
+        if keys:
+            pending = list(keys)
+            workers = min(workers, len(pending))
+            size = -(-len(pending) // (workers * 4))
+            batches = [pending[start:start + size] for start in range(0, len(pending), size)]
+            with ProcessPoolExecutor(max_workers=workers, mp_context=_load_context(parse)) as executor:
+                futures = [executor.submit(parse_batch, parse, batch) for batch in batches]
+                for future in as_completed(futures):
+                    for path, result in future.result():
+                        if isinstance(result, Exception):
+                            METRICS.increment("ingest_errors_total")
+                            logger.error(f"Error in file {path.name} while initializing {result}")
+                            continue
+                        value, rows, elapsed = result
+                        self._remember(path, fingerprints[path], value, rows)
+                        loaded[keys[path]] = value
+                        total_rows += rows
+                        METRICS.observe("file_load_seconds", elapsed)
+                        logger.info(f"Parsed {path.name} with {rows} entries in {elapsed:.3f}s")
+        METRICS.increment("rows_ingested_total", total_rows)
+
+        elapsed = perf_counter() - started
+        throughput = total_rows / elapsed if elapsed else 0
+        logger.info(
+            f"Loaded {len(loaded)} files ({total_rows} rows) with {workers} workers "
+            f"in {elapsed:.3f}s ({throughput:.0f} rows/s)"
+        )
+        return loaded
+
+
+class SalesSnapshot(NamedTuple):
+    """Consistent, immutable view of the sales store and its aggregate index.
+
+    Attributes:
+        version (int): Handler version the view was taken at.
+        days (Mapping[date, SalesDay]): Sales per day.
+        stats (Mapping[date, DayStats]): Aggregate statistics per day.
+        ranking (TotalsRanking): Days ordered by their total sales.
+        dates (SortedDays): Days ordered by date.
+        rollups (Mapping[Period, Mapping[date, DayStats]]): Statistics per period bucket.
+        profile (HourlyProfile): Typical day across all days.
+    """
+    version: int
+    days: Mapping[date, SalesDay]
+    stats: Mapping[date, DayStats]
+    ranking: TotalsRanking
+    dates: SortedDays
+    rollups: Mapping[Period, Mapping[date, DayStats]]
+    profile: HourlyProfile
 
 
 class HourlySalesCsvHandler(CsvHandler[HourlySales, date, time, SalesDay]):
-    """Concrete implementation of CsvHandler for processing HourlySales CSV files."""
+    """Concrete implementation of CsvHandler for processing HourlySales CSV files.
+
+    After the initial load, every parsed file remembers the offset and hash of its
+    complete lines. When a file is modified and that prefix is unchanged, only the
+    appended lines are parsed and aggregated; otherwise the file is parsed in full.
+    """
 
-    def __init__(self, store: SalesStore, parser: CsvModelParser[time, HourlySales], watch_path: Path) -> None:
+    def __init__(
+            self,
+            store: SalesStore,
+            parser: CsvModelParser[time, HourlySales],
+            watch_path: Path,
+            workers: int = 1,
+            snapshot: StoreSnapshot[SalesDay] | None = None,
+            quiet_window: float = 0.0,
+            ingest_workers: int = 0,
+            ingest_queue_size: int = 1000,
+            day_reader: SalesDayReader | None = None,
+            reporter: ChangeReporter | None = None,
+            archive: Path | None = None,
+            submit: SubmitTask | None = None,
+    ) -> None:
         """Initializes the handler for hourly sales files.
 
         Args:
             store (SalesStore): The main data store to populate.
             parser (CsvModelParser[time, HourlySales]): Parser for hourly sales rows.
             watch_path (Path): Directory to watch for CSV files.
+            workers (int, optional): Number of processes used for the initial load. Defaults to 1.
+            snapshot (StoreSnapshot[SalesDay] | None, optional): Cache of parsed days. Defaults to None.
+            quiet_window (float, optional): Seconds a file must stay unchanged before parsing. Defaults to 0.
+            ingest_workers (int, optional): Number of ingestion worker threads. Defaults to 0.
+            ingest_queue_size (int, optional): Maximum number of queued ingestion tasks. Defaults to 1000.
+            day_reader (SalesDayReader | None, optional): Reader loading whole files into columns,
+                used instead of streaming rows through the parser. Defaults to None.
+            reporter (ChangeReporter | None, optional): Reporter printing the delta of every
+                changed day after the initial load. Defaults to None.
+            archive (Path | None, optional): Directory of columnar day files written by
+                src.io.archive, loaded on start-up for days without a CSV file. Defaults to None.
+            submit (SubmitTask | None, optional): Function running ingestion tasks instead of the
+                ingestion workers. Defaults to None.
         """
+        self.index = SalesIndex()
+        self.day_reader = day_reader
+        self.reporter = reporter
+        self.archive = archive
+        self._tails: dict[date, FileTail] = {}
 
         def key_func(path: Path) -> date:
             return datetime.strptime(path.stem, "%Y-%m-%d").date()
@@ -184,5 +681,191 @@ class HourlySalesCsvHandler(CsvHandler[HourlySales, date, time, SalesDay]):
             parser = parser,
             key_func= key_func,
             value_func = value_func,
-            watch_path=watch_path
-        )
\ No newline at end of file
+            watch_path=watch_path,
+            workers=workers,
+            snapshot=snapshot,
+            quiet_window=quiet_window,
+            ingest_workers=ingest_workers,
+            ingest_queue_size=ingest_queue_size,
+            submit=submit,
+        )
+        if self.reporter is not None:
+            self.reporter.loaded(len(self.index.days), sum(stats.count for stats in self.index.days.values()))
+
+    def close(self) -> None:
+        """Processes pending events, then prints the pending changes and stops the reporter."""
+        super().close()
+        if self.reporter is not None:
+            self.reporter.stop()
+
+    def _on_change(self, key: date, value: SalesDay | None, appended_from: int | None = None) -> None:
+        """Keeps the aggregate index in sync with the store and reports the change.
+
+        Only the statistics before and after the change are handed to the reporter,
+        which formats them on its own thread.
+
+        Args:
+            key (date): The changed day.
+            value (SalesDay | None): New contents of the day or None when it was removed.
+            appended_from (int | None, optional): Number of rows the day held before rows were
+                appended, None when it was replaced. Defaults to None.
+        """
+        previous = self.index.days.get(key)
+        if value is not None and appended_from is not None:
+            self.index.append(key, value, appended_from)
+        else:
+            self.index.apply(key, value)
+        if value is None:
+            self._tails.pop(key, None)
+        if self.reporter is not None and not self.initializing:
+            self.reporter.report(DayChange(key, previous, self.index.days.get(key)))
+
+    def _on_batch(self, values: Mapping[date, SalesDay]) -> None:
+        """Rebuilds the aggregate index once for a batch of stored days and reports them.
+
+        Args:
+            values (Mapping[date, SalesDay]): The stored days.
+        """
+        previous = {key: self.index.days.get(key) for key in values} if self.reporter is not None else {}
+        self.index.apply_many(values)
+        if self.reporter is not None and not self.initializing:
+            for key in values:
+                self.reporter.report(DayChange(key, previous[key], self.index.days.get(key)))
+
+    def _initial_paths(self, watch_path: Path) -> list[Path]:
+        """Returns the CSV files of the watched directory and the archived days without one.
+
+        Args:
+            watch_path (Path): Watched directory.
+
+        Returns:
+            list[Path]: CSV files followed by archive files.
+        """
+        paths = super()._initial_paths(watch_path)
+        if self.archive is None or not self.archive.is_dir():
+            return paths
+        stems = {path.stem for path in paths}
+        archived: dict[str, Path] = {}
+        for path in sorted(self.archive.iterdir()):
+            if path.is_file() and path.suffix in ARCHIVE_SUFFIXES and path.stem not in stems:
+                archived.setdefault(path.stem, path)
+        return paths + list(archived.values())
+
+    def _cached(self, path: Path) -> tuple[tuple[SalesDay, int] | None, Fingerprint | None]:
+        """Reads archive files directly, bypassing the snapshot, and looks other files up like CsvHandler.
+
+        Args:
+            path (Path): Path to a CSV or archive file.
+
+        Returns:
+            tuple[tuple[SalesDay, int] | None, Fingerprint | None]: The day and its number of rows
+                or None if the file must be parsed, and the fingerprint of the file if it was computed.
+        """
+        if path.suffix in ARCHIVE_SUFFIXES:
+            sales_day = import_day(path)
+            return (sales_day, len(sales_day)), None
+        return super()._cached(path)
+
+    def _parse(self, path: Path) -> tuple[SalesDay, int]:
+        """Loads a file with the day reader or streams validated rows into a columnar SalesDay.
+
+        Args:
+            path (Path): Path to the CSV file.
+
+        Returns:
+            tuple[SalesDay, int]: The parsed day and its number of rows.
+        """
+        tail = None if self.initializing else ingested_prefix(path, self.parser.reader.delimiter)
+        sales_day, rows = read_sales_day(self.parser, self.day_reader, path)
+        if tail is not None:
+            self._tails[self.key_func(path)] = tail._replace(rows=rows)
+        return sales_day, rows
+
+    def _parse_task(self) -> Callable[[Path], tuple[SalesDay, int]]:
+        """Returns a function loading a file with the parser or the day reader in a worker process.
+
+        Returns:
+            Callable[[Path], tuple[SalesDay, int]]: Parse function without a reference to the handler.
+        """
+        return partial(read_sales_day, self.parser, self.day_reader)
+
+    def _add_or_update(self, path: Path, key: date, *, created: bool) -> None:
+        """Ingests only the appended rows of a modified file when possible, else parses it in full.
+
+        Args:
+            path (Path): Path to the CSV file.
+            key (date): The day stored for the file.
+            created (bool): Flag to distinguish between creation and modification.
+        """
+        if not created and self._append(path, key):
+            return
+        self._tails.pop(key, None)
+        super()._add_or_update(path, key, created=created)
+
+    def _append(self, path: Path, key: date) -> bool:
+        """Parses and stores the lines appended to a file since it was last parsed.
+
+        Falls back when the file was not parsed since the initial load, its ingested
+        prefix changed, the store no longer holds the ingested rows or an appended row
+        repeats a time of the day, which would replace an earlier sale.
+
+        Args:
+            path (Path): Path to the CSV file.
+            key (date): The day stored for the file.
+
+        Returns:
+            bool: True if the appended rows were stored, False if the file must be parsed in full.
+        """
+        tail = self._tails.get(key)
+        if tail is None:
+            return False
+        with PROFILER.profile("append_rows"):
+            try:
+                with METRICS.timer("file_append_seconds"):
+                    appended_tail = read_appended(path, tail)
+                    if appended_tail is None:
+                        METRICS.increment("append_fallbacks_total")
+                        return False
+                    lines, next_tail = appended_tail
+                    appended = SalesDay.from_rows(self.parser.parse_lines(lines, tail.header, path.name))
+            except Exception as e:
+                logger.warning(f"Cannot append rows of {path.name}, parsing it in full {e}")
+                return False
+            if not len(appended):
+                self._tails[key] = next_tail
+                return True
+            with self._write_lock:
+                previous = self.store.get(key)
+                if previous is None or len(previous) != tail.rows or np.isin(
+                    np.frombuffer(appended.minutes, dtype=np.uint16),
+                    np.frombuffer(previous.minutes, dtype=np.uint16),
+                ).any():
+                    METRICS.increment("append_fallbacks_total")
+                    return False
+                sales_day = previous.extended(appended)
+                self._set(key, sales_day, appended_from=len(previous))
+                self._tails[key] = next_tail._replace(rows=len(sales_day))
+        METRICS.increment("rows_ingested_total", len(appended))
+        logger.info(f"appended {len(appended)} entries to {key}")
+        return True
+
+    def snapshot(self) -> SalesSnapshot:
+        """Returns a consistent view of the store and the index in O(1).
+
+        The write lock is held only while the published views are read, so
+        readers never block writers for the duration of a report.
+
+        Returns:
+            SalesSnapshot: Immutable view of the current store version.
+        """
+        with self._write_lock:
+            _, stats = self.index.days.snapshot()
+            return SalesSnapshot(
+                self.version,
+                self._published_store(),
+                stats,
+                self.index.ranking,
+                self.index.dates,
+                self.index.rollup_views(),
+                self.index.profile,
+            )
\ No newline at end of file
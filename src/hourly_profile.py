@@ -0,0 +1,151 @@
+from collections.abc import Iterable
+from src.model import SalesDay
+import numpy as np
+
+HOURS = 24
+
+class DayHours:
+    """Total sales and number of sales per hour of a single day.
+
+    Attributes:
+        totals (np.ndarray): Sum of sales amounts per hour, 24 values.
+        counts (np.ndarray): Number of sales per hour, 24 values.
+    """
+
+    __slots__ = ("totals", "counts")
+
+    def __init__(self, totals: np.ndarray, counts: np.ndarray) -> None:
+        self.totals = totals
+        self.counts = counts
+
+    @classmethod
+    def from_sales_day(cls, sales_day: SalesDay) -> "DayHours":
+        """Buckets the sales of a day by hour with one vectorized pass.
+
+        Args:
+            sales_day (SalesDay): Columnar sales of one day.
+
+        Returns:
+            DayHours: Totals and counts per hour.
+        """
+        hours = np.frombuffer(sales_day.minutes, dtype=np.uint16) // 60
+        amounts = np.frombuffer(sales_day.amounts, dtype=np.float64)
+        return cls(
+            np.bincount(hours, weights=amounts, minlength=HOURS),
+            np.bincount(hours, minlength=HOURS),
+        )
+
+
+class HourlyProfile:
+    """Typical day: mean and variance of the daily total of every hour across all days.
+
+    Each day contributes one sample per hour, 0 for hours without sales. Days are added
+    and removed with Welford's algorithm, so the profile never rescans the store.
+    Updates return a new profile, so a published profile can be read during ingestion.
+
+    Attributes:
+        days (int): Number of days in the profile.
+        mean (np.ndarray): Average daily total per hour.
+        m2 (np.ndarray): Sum of squared differences from the mean per hour.
+        counts (np.ndarray): Number of sales per hour across all days.
+    """
+
+    __slots__ = ("days", "mean", "m2", "counts")
+
+    def __init__(self) -> None:
+        self.days = 0
+        self.mean = np.zeros(HOURS)
+        self.m2 = np.zeros(HOURS)
+        self.counts = np.zeros(HOURS, dtype=np.int64)
+
+    @classmethod
+    def from_hours(cls, days: Iterable[DayHours]) -> "HourlyProfile":
+        """Builds a profile of many days, updating one set of arrays in place.
+
+        Args:
+            days (Iterable[DayHours]): Hours of every day.
+
+        Returns:
+            HourlyProfile: Profile of all the days.
+        """
+        profile = cls()
+        for hours in days:
+            profile._add(hours)
+        return profile
+
+    def updated(self, removed: DayHours | None, added: DayHours | None) -> "HourlyProfile":
+        """Returns a profile where one day was replaced, added or removed.
+
+        Args:
+            removed (DayHours | None): Previous hours of the changed day, None if it is new.
+            added (DayHours | None): New hours of the changed day, None if it was removed.
+
+        Returns:
+            HourlyProfile: The updated profile.
+        """
+        profile = HourlyProfile()
+        profile.days = self.days
+        profile.mean = self.mean.copy()
+        profile.m2 = self.m2.copy()
+        profile.counts = self.counts.copy()
+        if removed is not None:
+            profile._remove(removed)
+        if added is not None:
+            profile._add(added)
+        return profile
+
+    @property
+    def stdev(self) -> np.ndarray:
+        """np.ndarray: Sample standard deviation of the daily total per hour, 0 below two days."""
+        if self.days < 2:
+            return np.zeros(HOURS)
+        return np.sqrt(np.maximum(self.m2 / (self.days - 1), 0.0))
+
+    def peak_hours(self, n: int) -> list[tuple[int, float]]:
+        """Returns the hours with the highest average daily total.
+
+        Args:
+            n (int): Number of hours.
+
+        Returns:
+            list[tuple[int, float]]: (hour, average total) pairs, highest first.
+        """
+        if not self.days:
+            return []
+        order = np.argsort(-self.mean, kind="stable")[:max(n, 0)]
+        return [(int(hour), float(self.mean[hour])) for hour in order]
+
+    def anomaly_scores(self, hours: DayHours) -> np.ndarray:
+        """Scores every hour of a day by its distance from the profile in standard deviations.
+
+        Args:
+            hours (DayHours): Hours of the scored day.
+
+        Returns:
+            np.ndarray: Z-score per hour, 0 where the profile has no spread.
+        """
+        stdev = self.stdev
+        scores = np.zeros(HOURS)
+        np.divide(hours.totals - self.mean, stdev, out=scores, where=stdev > 0)
+        return scores
+
+    def _add(self, hours: DayHours) -> None:
+        """Adds the hours of one day."""
+        self.days += 1
+        delta = hours.totals - self.mean
+        self.mean += delta / self.days
+        self.m2 += delta * (hours.totals - self.mean)
+        self.counts += hours.counts
+
+    def _remove(self, hours: DayHours) -> None:
+        """Removes the hours of one day by reversing Welford's update."""
+        self.days -= 1
+        self.counts -= hours.counts
+        if not self.days:
+            self.mean = np.zeros(HOURS)
+            self.m2 = np.zeros(HOURS)
+            return
+        previous_mean = self.mean - (hours.totals - self.mean) / self.days
+        self.m2 -= (hours.totals - previous_mean) * (hours.totals - self.mean)
+        self.m2 = np.maximum(self.m2, 0.0)
+        self.mean = previous_mean
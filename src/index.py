@@ -0,0 +1,522 @@
+from collections.abc import Iterable, Iterator, Mapping
+from src.store import VersionedStore
+from src.hourly_profile import DayHours, HourlyProfile
+from src.cube import DayCube
+from src.model import Period, SalesDay
+from datetime import date, timedelta
+from math import ceil, inf, sqrt
+from bisect import bisect_left, bisect_right
+import numpy as np
+
+class DayStats:
+    """Aggregate statistics of all sales amounts recorded on a single day.
+
+    Mean and variance are maintained with Welford's online algorithm, which needs a
+    single pass and stays numerically stable for large amounts.
+
+    Attributes:
+        count (int): Number of sales rows.
+        total (float): Sum of sales amounts.
+        mean (float): Average sales amount, 0 if there are no sales.
+        m2 (float): Sum of squared differences from the mean.
+        min (float): Smallest sales amount.
+        max (float): Largest sales amount.
+        outliers (tuple[float, ...]): Sales above mean + stdev, in row order.
+        cube (DayCube | None): Sum and count per product and region, None for merged statistics.
+        hours (DayHours | None): Totals and counts per hour of the day, None for merged statistics.
+    """
+
+    __slots__ = ("count", "total", "mean", "m2", "min", "max", "outliers", "cube", "hours")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = inf
+        self.max = -inf
+        self.outliers: tuple[float, ...] = ()
+        self.cube: DayCube | None = None
+        self.hours: DayHours | None = None
+
+    @classmethod
+    def from_amounts(cls, amounts: Iterable[float]) -> "DayStats":
+        """Builds statistics from sales amounts in a single pass.
+
+        Args:
+            amounts (Iterable[float]): Sales amounts of one day.
+
+        Returns:
+            DayStats: Aggregated statistics.
+        """
+        stats = cls()
+        for amount in amounts:
+            stats.add(amount)
+        return stats
+
+    @classmethod
+    def from_sales_day(cls, sales_day: SalesDay) -> "DayStats":
+        """Builds statistics, the outliers, the product/region cube and the hours of a day.
+
+        The outliers are found with one vectorized comparison over the amounts column.
+
+        Args:
+            sales_day (SalesDay): Columnar sales of one day.
+
+        Returns:
+            DayStats: Aggregated statistics including the outliers, the cube and the hours.
+        """
+        stats = cls.from_amounts(sales_day.amounts)
+        stats.cube = DayCube.from_sales_day(sales_day)
+        stats.hours = DayHours.from_sales_day(sales_day)
+        threshold = stats.outlier_threshold
+        if stats.max > threshold:
+            amounts = np.frombuffer(sales_day.amounts, dtype=np.float64)
+            stats.outliers = tuple(amounts[amounts > threshold].tolist())
+        return stats
+
+    @classmethod
+    def merge(cls, parts: Iterable["DayStats"]) -> "DayStats":
+        """Combines statistics of disjoint sets of sales, e.g. the days of a month.
+
+        Uses the parallel variant of Welford's algorithm, so no sales are rescanned.
+
+        Args:
+            parts (Iterable[DayStats]): Statistics to combine.
+
+        Returns:
+            DayStats: Statistics of all sales together, without outliers.
+        """
+        merged = cls()
+        for part in parts:
+            if not part.count:
+                continue
+            count = merged.count + part.count
+            delta = part.mean - merged.mean
+            merged.mean += delta * part.count / count
+            merged.m2 += part.m2 + delta * delta * merged.count * part.count / count
+            merged.count = count
+            merged.total += part.total
+            merged.min = min(merged.min, part.min)
+            merged.max = max(merged.max, part.max)
+        return merged
+
+    def extended(self, sales_day: SalesDay, start: int) -> "DayStats":
+        """Returns the statistics of a day after rows were appended to it.
+
+        Welford's update visits only the appended rows, and their cube and hours are
+        combined with the existing ones. The outliers are selected again with one
+        vectorized comparison, because the threshold moves with the mean.
+
+        Args:
+            sales_day (SalesDay): The day including the appended rows.
+            start (int): Number of leading rows already covered by these statistics.
+
+        Returns:
+            DayStats: Statistics of the whole day.
+        """
+        if self.cube is None or self.hours is None:
+            return DayStats.from_sales_day(sales_day)
+        appended = sales_day.tail(start)
+        stats = DayStats()
+        stats.count, stats.total, stats.mean, stats.m2 = self.count, self.total, self.mean, self.m2
+        stats.min, stats.max = self.min, self.max
+        for amount in appended.amounts:
+            stats.add(amount)
+        stats.cube = self.cube.combined(DayCube.from_sales_day(appended))
+        appended_hours = DayHours.from_sales_day(appended)
+        stats.hours = DayHours(self.hours.totals + appended_hours.totals, self.hours.counts + appended_hours.counts)
+        threshold = stats.outlier_threshold
+        if stats.max > threshold:
+            amounts = np.frombuffer(sales_day.amounts, dtype=np.float64)
+            stats.outliers = tuple(amounts[amounts > threshold].tolist())
+        return stats
+
+    def add(self, amount: float) -> None:
+        """Adds a single sales amount to the statistics.
+
+        Args:
+            amount (float): Sales amount.
+        """
+        self.count += 1
+        self.total += amount
+        delta = amount - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (amount - self.mean)
+        if amount < self.min:
+            self.min = amount
+        if amount > self.max:
+            self.max = amount
+
+    @property
+    def variance(self) -> float:
+        """float: Sample variance. Returns 0 if there are less than two sales."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        """float: Sample standard deviation. Returns 0 if there are less than two sales."""
+        return sqrt(self.variance)
+
+    @property
+    def outlier_threshold(self) -> float:
+        """float: Sales above mean + 1 standard deviation are outliers."""
+        return self.mean + 1 * self.stdev
+
+
+class TotalsRanking:
+    """Immutable ranking of daily totals kept in a bisect-maintained sorted array.
+
+    Days are ordered by total descending; days with equal totals keep the order in
+    which they were first added. Updates return a new ranking, so a published ranking
+    can be read while ingestion continues. Lookups and rank queries take O(log n).
+    """
+
+    __slots__ = ("_order", "_days", "_keys", "_next_sequence")
+
+    def __init__(self) -> None:
+        self._order: list[tuple[float, int]] = []
+        self._days: list[date] = []
+        self._keys: dict[date, tuple[float, int]] = {}
+        self._next_sequence = 0
+
+    @classmethod
+    def from_totals(cls, totals: Iterable[tuple[date, float]]) -> "TotalsRanking":
+        """Builds a ranking of many days with a single sort.
+
+        Args:
+            totals (Iterable[tuple[date, float]]): (date, total) pairs in the order the days were added.
+
+        Returns:
+            TotalsRanking: Ranking of all the days.
+        """
+        ranking = cls()
+        ranking._keys = {day: (-total, sequence) for sequence, (day, total) in enumerate(totals)}
+        ranked = sorted(ranking._keys.items(), key=lambda item: item[1])
+        ranking._order = [key for _, key in ranked]
+        ranking._days = [day for day, _ in ranked]
+        ranking._next_sequence = len(ranking._keys)
+        return ranking
+
+    def updated(self, day: date, total: float | None) -> "TotalsRanking":
+        """Returns a ranking where the total of a day was replaced or removed.
+
+        Args:
+            day (date): The changed day.
+            total (float | None): New total of the day or None when it was removed.
+
+        Returns:
+            TotalsRanking: The updated ranking.
+        """
+        ranking = TotalsRanking()
+        ranking._order = list(self._order)
+        ranking._days = list(self._days)
+        ranking._keys = dict(self._keys)
+        ranking._next_sequence = self._next_sequence
+
+        key = ranking._keys.pop(day, None)
+        if key is not None:
+            position = bisect_left(ranking._order, key)
+            del ranking._order[position]
+            del ranking._days[position]
+        if total is None:
+            return ranking
+
+        sequence = key[1] if key is not None else ranking._next_sequence
+        if key is None:
+            ranking._next_sequence += 1
+        new_key = (-total, sequence)
+        position = bisect_left(ranking._order, new_key)
+        ranking._order.insert(position, new_key)
+        ranking._days.insert(position, day)
+        ranking._keys[day] = new_key
+        return ranking
+
+    def page(self, offset: int, limit: int) -> list[tuple[date, float]]:
+        """Returns a slice of days ordered by total descending.
+
+        Args:
+            offset (int): Number of top days to skip.
+            limit (int): Maximum number of days to return.
+
+        Returns:
+            list[tuple[date, float]]: (date, total) pairs of the page.
+        """
+        end = offset + max(limit, 0)
+        return [(day, -key[0]) for day, key in zip(self._days[offset:end], self._order[offset:end])]
+
+    def top(self, n: int) -> list[tuple[date, float]]:
+        """Returns the n days with the highest totals, highest first."""
+        return self.page(0, n)
+
+    def bottom(self, n: int) -> list[tuple[date, float]]:
+        """Returns the n days with the lowest totals, lowest first."""
+        start = max(len(self._days) - max(n, 0), 0)
+        return self.page(start, len(self._days) - start)[::-1]
+
+    def rank(self, day: date) -> int | None:
+        """Returns the 1-based position of a day by total descending.
+
+        Args:
+            day (date): The requested day.
+
+        Returns:
+            int | None: Rank of the day or None if it has no sales.
+        """
+        key = self._keys.get(day)
+        return bisect_left(self._order, key) + 1 if key is not None else None
+
+    def percentile(self, fraction: float) -> float:
+        """Returns the daily total at a percentile using the nearest-rank method.
+
+        Args:
+            fraction (float): Percentile between 0 and 1.
+
+        Returns:
+            float: Total at the percentile, 0 if there are no days.
+
+        Raises:
+            ValueError: If fraction is outside [0, 1].
+        """
+        if not 0 <= fraction <= 1:
+            raise ValueError(f"Percentile {fraction} must be between 0 and 1")
+        if not self._order:
+            return 0.0
+        ascending_rank = max(ceil(fraction * len(self._order)), 1)
+        return -self._order[len(self._order) - ascending_rank][0]
+
+    def __len__(self) -> int:
+        return len(self._days)
+
+    def __iter__(self) -> Iterator[tuple[date, float]]:
+        return iter(self.page(0, len(self._days)))
+
+
+class SortedDays:
+    """Immutable ascending list of days, kept sorted with bisect.
+
+    Range lookups cost O(log n + k) for k days in the range, independent of the size
+    of the archive. Updates return a new instance, like TotalsRanking.
+    """
+
+    __slots__ = ("_days",)
+
+    def __init__(self, days: list[date] | None = None) -> None:
+        self._days = days or []
+
+    def updated(self, day: date, present: bool) -> "SortedDays":
+        """Returns a copy where the day was added or removed.
+
+        Args:
+            day (date): The changed day.
+            present (bool): Whether the day now holds sales.
+
+        Returns:
+            SortedDays: The updated days, or self when nothing changed.
+        """
+        position = bisect_left(self._days, day)
+        found = position < len(self._days) and self._days[position] == day
+        if found == present:
+            return self
+        days = list(self._days)
+        if present:
+            days.insert(position, day)
+        else:
+            del days[position]
+        return SortedDays(days)
+
+    def between(self, start: date | None = None, end: date | None = None) -> list[date]:
+        """Returns the days within an inclusive range in ascending order.
+
+        Args:
+            start (date | None, optional): First day, None for no lower bound.
+            end (date | None, optional): Last day, None for no upper bound.
+
+        Returns:
+            list[date]: Days in the range.
+        """
+        low = bisect_left(self._days, start) if start is not None else 0
+        high = bisect_right(self._days, end) if end is not None else len(self._days)
+        return self._days[low:high]
+
+    @property
+    def first(self) -> date | None:
+        """date | None: Earliest day or None when there are no days."""
+        return self._days[0] if self._days else None
+
+    @property
+    def last(self) -> date | None:
+        """date | None: Latest day or None when there are no days."""
+        return self._days[-1] if self._days else None
+
+    def __len__(self) -> int:
+        return len(self._days)
+
+    def __iter__(self) -> Iterator[date]:
+        return iter(self._days)
+
+
+class SalesIndex:
+    """Per-day aggregate index kept in sync with the sales store.
+
+    Statistics and outliers are recomputed only for the day that changed, so reports
+    over unchanged days reuse the cached values.
+
+    Attributes:
+        days (VersionedStore[date, DayStats]): Statistics of every day holding at least one sale.
+        ranking (TotalsRanking): Days ordered by their total sales.
+        dates (SortedDays): Days ordered by date, for range queries.
+        rollups (dict[Period, VersionedStore[date, DayStats]]): Statistics per week, month,
+            quarter and year, keyed by the first day of the period.
+        profile (HourlyProfile): Typical day across all days.
+    """
+
+    def __init__(self) -> None:
+        self.days: VersionedStore[date, DayStats] = VersionedStore()
+        self.ranking = TotalsRanking()
+        self.dates = SortedDays()
+        self.profile = HourlyProfile()
+        self.rollups: dict[Period, VersionedStore[date, DayStats]] = {period: VersionedStore() for period in Period}
+
+    @classmethod
+    def from_store(cls, store: Mapping[date, SalesDay]) -> "SalesIndex":
+        """Builds an index for an already populated store.
+
+        Args:
+            store (Mapping[date, SalesDay]): Mapping from date to SalesDay.
+
+        Returns:
+            SalesIndex: Index covering every day in the store.
+        """
+        index = cls()
+        index.apply_many(store)
+        return index
+
+    def apply_many(self, days: Mapping[date, SalesDay | None]) -> None:
+        """Updates the index after many days have been added, replaced or removed.
+
+        The statistics of the changed days are computed into a plain dict, then the
+        ranking, dates, profile and rollups are rebuilt from it in one pass and every
+        structure is published once. This costs O(n) for the batch, whereas applying
+        the days one by one copies every published structure per day.
+
+        Args:
+            days (Mapping[date, SalesDay | None]): New contents per day, None for removed days.
+        """
+        stats = dict(self.days)
+        for day, sales_day in days.items():
+            if sales_day is None or not len(sales_day):
+                stats.pop(day, None)
+            else:
+                stats[day] = DayStats.from_sales_day(sales_day)
+
+        dates = sorted(stats)
+        rollups: dict[Period, dict[date, DayStats]] = {}
+        levels: list[tuple[Period, Period | None]] = [
+            (Period.WEEK, None), (Period.MONTH, None), (Period.QUARTER, Period.MONTH), (Period.YEAR, Period.QUARTER),
+        ]
+        for period, parent in levels:
+            source = stats if parent is None else rollups[parent]
+            parts: dict[date, list[DayStats]] = {}
+            for day in dates if parent is None else sorted(source):
+                parts.setdefault(period.bucket(day), []).append(source[day])
+            rollups[period] = {bucket: DayStats.merge(merged) for bucket, merged in parts.items()}
+
+        self.days = VersionedStore(stats)
+        self.ranking = TotalsRanking.from_totals((day, day_stats.total) for day, day_stats in stats.items())
+        self.dates = SortedDays(dates)
+        self.profile = HourlyProfile.from_hours(day_stats.hours for day_stats in stats.values() if day_stats.hours is not None)
+        self.rollups = {period: VersionedStore(buckets) for period, buckets in rollups.items()}
+
+    def apply(self, day: date, sales_day: SalesDay | None) -> None:
+        """Updates the index after a day has been added, replaced or removed.
+
+        Args:
+            day (date): The changed day.
+            sales_day (SalesDay | None): New contents of the day or None when it was removed.
+        """
+        if sales_day is None or not len(sales_day):
+            previous = self.days.pop(day, None)
+            if previous is not None:
+                self.ranking = self.ranking.updated(day, None)
+                self.dates = self.dates.updated(day, False)
+                self.profile = self.profile.updated(previous.hours, None)
+                self._roll_up(day)
+            return
+        self._store(day, self.days.get(day), DayStats.from_sales_day(sales_day))
+
+    def append(self, day: date, sales_day: SalesDay, start: int) -> None:
+        """Updates the index after rows were appended to a day.
+
+        Only the appended rows are aggregated; when the index does not hold exactly the
+        first start rows of the day, the day is recomputed like in apply.
+
+        Args:
+            day (date): The changed day.
+            sales_day (SalesDay): New contents of the day.
+            start (int): Number of leading rows the day held before the append.
+        """
+        previous = self.days.get(day)
+        if previous is None or previous.count != start:
+            self.apply(day, sales_day)
+            return
+        self._store(day, previous, previous.extended(sales_day, start))
+
+    def rollup_views(self) -> dict[Period, Mapping[date, DayStats]]:
+        """Returns the published, read-only statistics of every period.
+
+        Returns:
+            dict[Period, Mapping[date, DayStats]]: Statistics per period bucket.
+        """
+        return {period: store.snapshot()[1] for period, store in self.rollups.items()}
+
+    def _store(self, day: date, previous: DayStats | None, stats: DayStats) -> None:
+        """Stores the new statistics of a day and updates the derived indexes.
+
+        Args:
+            day (date): The changed day.
+            previous (DayStats | None): Statistics before the change, None if the day is new.
+            stats (DayStats): Statistics after the change.
+        """
+        self.days[day] = stats
+        self.profile = self.profile.updated(previous.hours if previous is not None else None, stats.hours)
+        self.ranking = self.ranking.updated(day, stats.total)
+        self.dates = self.dates.updated(day, True)
+        self._roll_up(day)
+
+    def _roll_up(self, day: date) -> None:
+        """Recomputes the week, month, quarter and year containing a changed day.
+
+        Weeks and months are merged from their days, quarters from their months and
+        years from their quarters, so an update touches at most 31 statistics per level.
+
+        Args:
+            day (date): The changed day.
+        """
+        week = Period.WEEK.bucket(day)
+        self._set_bucket(Period.WEEK, week, self._days_between(week, Period.WEEK.next(week)))
+        month = Period.MONTH.bucket(day)
+        self._set_bucket(Period.MONTH, month, self._days_between(month, Period.MONTH.next(month)))
+
+        for period, parent in [(Period.QUARTER, Period.MONTH), (Period.YEAR, Period.QUARTER)]:
+            bucket = period.bucket(day)
+            end = period.next(bucket)
+            parts = []
+            child = bucket
+            while child < end:
+                child_stats = self.rollups[parent].get(child)
+                if child_stats is not None:
+                    parts.append(child_stats)
+                child = parent.next(child)
+            self._set_bucket(period, bucket, parts)
+
+    def _days_between(self, start: date, end: date) -> list[DayStats]:
+        """Returns the statistics of the days in [start, end)."""
+        return [self.days[day] for day in self.dates.between(start, end - timedelta(days=1))]
+
+    def _set_bucket(self, period: Period, bucket: date, parts: list[DayStats]) -> None:
+        """Stores the merged statistics of a bucket or removes it when it has no days."""
+        if parts:
+            self.rollups[period][bucket] = DayStats.merge(parts)
+        else:
+            self.rollups[period].pop(bucket, None)
@@ -0,0 +1,138 @@
+from collections.abc import Hashable
+from pydantic import BaseModel
+from time import perf_counter
+from typing import Callable
+import threading
+import logging
+import queue
+
+logger = logging.getLogger(__name__)
+
+type SubmitTask = Callable[[Hashable, Callable[[], None]], None]
+
+class IngestionStats(BaseModel):
+    """Snapshot of ingestion queue metrics.
+
+    Attributes:
+        depth (int): Tasks waiting in the queues.
+        in_flight (int): Tasks currently being processed.
+        submitted (int): Tasks submitted since start.
+        processed (int): Tasks finished since start.
+        failed (int): Tasks that raised an exception.
+        blocked (int): Submissions that had to wait for free queue capacity.
+        blocked_seconds (float): Total time submitters waited for free queue capacity.
+    """
+    depth: int
+    in_flight: int
+    submitted: int
+    processed: int
+    failed: int
+    blocked: int
+    blocked_seconds: float
+
+class IngestionQueue:
+    """Bounded queue running ingestion tasks on a pool of worker threads.
+
+    Tasks are sharded by key so that all tasks of the same file run on the same worker
+    in submission order. When a shard is full, submit blocks, which applies backpressure
+    to the caller and is recorded in the blocked metrics.
+    """
+
+    def __init__(self, workers: int, maxsize: int) -> None:
+        """Initializes the queue and starts the worker threads.
+
+        Args:
+            workers (int): Number of worker threads.
+            maxsize (int): Maximum number of waiting tasks across all workers.
+        """
+        shard_size = max(1, maxsize // workers)
+        self._queues: list[queue.Queue[Callable[[], None] | None]] = [
+            queue.Queue(maxsize=shard_size) for _ in range(workers)
+        ]
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._submitted = 0
+        self._processed = 0
+        self._failed = 0
+        self._blocked = 0
+        self._blocked_seconds = 0.0
+        self._threads = [
+            threading.Thread(target=self._work, args=(q,), name=f"ingestion-{i}", daemon=True)
+            for i, q in enumerate(self._queues)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, key: Hashable, task: Callable[[], None]) -> None:
+        """Enqueues a task, blocking while the target shard is full.
+
+        Args:
+            key (Hashable): Key selecting the shard, usually the file path.
+            task (Callable[[], None]): Work to run on a worker thread.
+        """
+        shard = self._queues[hash(key) % len(self._queues)]
+        try:
+            shard.put_nowait(task)
+        except queue.Full:
+            started = perf_counter()
+            shard.put(task)
+            with self._lock:
+                self._blocked += 1
+                self._blocked_seconds += perf_counter() - started
+        with self._lock:
+            self._submitted += 1
+
+    def stats(self) -> IngestionStats:
+        """Returns the current queue metrics.
+
+        Returns:
+            IngestionStats: Snapshot of the metrics.
+        """
+        with self._lock:
+            return IngestionStats(
+                depth=sum(q.qsize() for q in self._queues),
+                in_flight=self._in_flight,
+                submitted=self._submitted,
+                processed=self._processed,
+                failed=self._failed,
+                blocked=self._blocked,
+                blocked_seconds=self._blocked_seconds,
+            )
+
+    def join(self) -> None:
+        """Blocks until every submitted task has been processed."""
+        for q in self._queues:
+            q.join()
+
+    def stop(self) -> None:
+        """Processes the remaining tasks and stops the worker threads."""
+        for q in self._queues:
+            q.put(None)
+        for thread in self._threads:
+            thread.join()
+
+    def _work(self, tasks: "queue.Queue[Callable[[], None] | None]") -> None:
+        """Worker loop running tasks from a single shard.
+
+        Args:
+            tasks (queue.Queue[Callable[[], None] | None]): The shard, None stops the worker.
+        """
+        while True:
+            task = tasks.get()
+            if task is None:
+                tasks.task_done()
+                return
+            with self._lock:
+                self._in_flight += 1
+            failed = False
+            try:
+                task()
+            except Exception as e:
+                failed = True
+                logger.error(f"Ingestion task failed {e}")
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+                    self._processed += 1
+                    self._failed += failed
+                tasks.task_done()
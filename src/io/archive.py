@@ -0,0 +1,197 @@
+from src.model import SalesDay, PRODUCTS, REGIONS
+from src.io.mmap_reader import MmapCsvReader
+from src.config import CSV_DELIMITER, KEY_NAME, WATCH_DIR
+from collections.abc import Mapping
+from datetime import date, datetime
+from enum import StrEnum
+from pathlib import Path
+from array import array
+import numpy as np
+import argparse
+import logging
+
+try:
+    import pyarrow as pa  # type: ignore[import-untyped]
+    import pyarrow.parquet as pq  # type: ignore[import-untyped]
+    HAS_PYARROW = True
+except ImportError:  # pragma: no cover
+    HAS_PYARROW = False
+
+logger = logging.getLogger(__name__)
+
+class ArchiveFormat(StrEnum):
+    """Columnar file formats a SalesDay can be archived in."""
+    PARQUET = "parquet"
+    NPZ = "npz"
+
+    @property
+    def suffix(self) -> str:
+        """str: File suffix of the format."""
+        return f".{self.value}"
+
+ARCHIVE_SUFFIXES = tuple(archive_format.suffix for archive_format in ArchiveFormat)
+
+def default_format() -> ArchiveFormat:
+    """Returns Parquet when pyarrow is installed, otherwise NumPy npz.
+
+    Returns:
+        ArchiveFormat: Format used when none is requested.
+    """
+    return ArchiveFormat.PARQUET if HAS_PYARROW else ArchiveFormat.NPZ
+
+def export_day(sales_day: SalesDay, path: Path) -> None:
+    """Writes a day to a columnar file, choosing the format from the suffix.
+
+    Minutes, amounts and regions are stored as typed columns; products are stored as
+    codes local to the file plus the list of their names. The file is replaced atomically.
+
+    Args:
+        sales_day (SalesDay): Day to write.
+        path (Path): Target file ending in '.parquet' or '.npz'.
+
+    Raises:
+        ValueError: If the suffix is not an archive format or Parquet is requested without pyarrow.
+    """
+    archive_format = _format_of(path)
+    product_codes, local_products = np.unique(np.frombuffer(sales_day.products, dtype=np.uint32), return_inverse=True)
+    names = [PRODUCTS.decode(int(code)) for code in product_codes]
+    minutes = np.frombuffer(sales_day.minutes, dtype=np.uint16)
+    amounts = np.frombuffer(sales_day.amounts, dtype=np.float64)
+    regions = np.frombuffer(sales_day.regions, dtype=np.uint8)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    if archive_format is ArchiveFormat.PARQUET:
+        if not HAS_PYARROW:
+            raise ValueError("Writing Parquet archives requires pyarrow")
+        table = pa.table({
+            "minute": pa.array(minutes),
+            "amount": pa.array(amounts),
+            "product": pa.DictionaryArray.from_arrays(
+                pa.array(local_products.astype(np.int32)), pa.array(names, type=pa.string())
+            ),
+            "region": pa.array(regions),
+        })
+        pq.write_table(table, tmp_path)
+    else:
+        with tmp_path.open("wb") as file:
+            np.savez(
+                file,
+                minutes=minutes,
+                amounts=amounts,
+                products=local_products.astype(np.uint32),
+                product_names=np.array(names, dtype=str),
+                regions=regions,
+            )
+    tmp_path.replace(path)
+
+def import_day(path: Path) -> SalesDay:
+    """Reads a day written by export_day, one read per column and without text parsing.
+
+    Args:
+        path (Path): File ending in '.parquet' or '.npz'.
+
+    Returns:
+        SalesDay: The archived day.
+
+    Raises:
+        ValueError: If the suffix is not an archive format, Parquet is requested without
+            pyarrow or the file holds an unknown region code.
+    """
+    if _format_of(path) is ArchiveFormat.PARQUET:
+        if not HAS_PYARROW:
+            raise ValueError("Reading Parquet archives requires pyarrow")
+        table = pq.read_table(path)
+        products = table.column("product").combine_chunks()
+        minutes = table.column("minute").to_numpy()
+        amounts = table.column("amount").to_numpy()
+        local_products = products.indices.to_numpy(zero_copy_only=False)
+        names = products.dictionary.to_pylist()
+        regions = table.column("region").to_numpy()
+    else:
+        with np.load(path, allow_pickle=False) as data:
+            minutes = data["minutes"]
+            amounts = data["amounts"]
+            local_products = data["products"]
+            names = data["product_names"].tolist()
+            regions = data["regions"]
+
+    if len(regions) and int(regions.max()) >= len(REGIONS):
+        raise ValueError(f"Unknown region code in archive {path.name}")
+    codes = np.array([PRODUCTS.encode(name) for name in names], dtype=np.uint32)
+    return SalesDay.from_columns(
+        array("H", minutes.astype(np.uint16).tobytes()),
+        array("d", amounts.astype(np.float64).tobytes()),
+        array("I", codes[local_products].tobytes()),
+        array("B", regions.astype(np.uint8).tobytes()),
+    )
+
+def export_store(days: Mapping[date, SalesDay], directory: Path, archive_format: ArchiveFormat | None = None) -> list[Path]:
+    """Writes every day of a store to '<directory>/<YYYY-MM-DD>.<format>'.
+
+    Args:
+        days (Mapping[date, SalesDay]): Days to archive.
+        directory (Path): Target directory.
+        archive_format (ArchiveFormat | None, optional): Format to write. Defaults to default_format().
+
+    Returns:
+        list[Path]: Written files in date order.
+    """
+    archive_format = archive_format or default_format()
+    paths = []
+    for day in sorted(days):
+        path = directory / f"{day.isoformat()}{archive_format.suffix}"
+        export_day(days[day], path)
+        paths.append(path)
+    logger.info(f"Archived {len(paths)} days to {directory}")
+    return paths
+
+def import_store(directory: Path) -> dict[date, SalesDay]:
+    """Reads every archived day of a directory.
+
+    Args:
+        directory (Path): Directory written by export_store.
+
+    Returns:
+        dict[date, SalesDay]: Archived days.
+    """
+    return {
+        datetime.strptime(path.stem, "%Y-%m-%d").date(): import_day(path)
+        for path in sorted(directory.iterdir())
+        if path.is_file() and path.suffix in ARCHIVE_SUFFIXES
+    }
+
+def _format_of(path: Path) -> ArchiveFormat:
+    """Returns the archive format of a path from its suffix.
+
+    Raises:
+        ValueError: If the suffix is not an archive format.
+    """
+    if path.suffix not in ARCHIVE_SUFFIXES:
+        raise ValueError(f"Unknown archive format {path.suffix}")
+    return ArchiveFormat(path.suffix[1:])
+
+def main() -> None:
+    """Archives the CSV files of a watch directory into '<dir>/archive'."""
+    arg_parser = argparse.ArgumentParser(description="Archive daily sales CSV files in a columnar format")
+    arg_parser.add_argument("--dir", type=Path, default=WATCH_DIR, help="Directory holding the CSV files (default: ./data)")
+    arg_parser.add_argument("--format", choices=[f.value for f in ArchiveFormat], default=default_format().value,
+                            help="Archive format (default: parquet when pyarrow is installed, otherwise npz)")
+    arg_parser.add_argument("--before", type=date.fromisoformat, default=date.today(),
+                            help="Archive only days before this date, YYYY-MM-DD (default: today)")
+    args = arg_parser.parse_args()
+
+    reader = MmapCsvReader(key_name=KEY_NAME, delimiter=CSV_DELIMITER)
+    days: dict[date, SalesDay] = {}
+    for path in sorted(args.dir.glob("*.csv")):
+        try:
+            day = datetime.strptime(path.stem, "%Y-%m-%d").date()
+            if day < args.before:
+                days[day] = reader.read_day(path)
+        except (ValueError, KeyError, OSError) as e:
+            logger.error(f"Error in file {path.name} while archiving {e}")
+    for path in export_store(days, args.dir / "archive", ArchiveFormat(args.format)):
+        print(path)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+from src.model import SalesDay, PRODUCTS, REGIONS, REGION_CODES, RegionDirection
+from src.parser import HourlySalesCsvParser
+from src.io.reader import CsvReader, SalesDayReader
+from src.metrics import METRICS
+from collections.abc import Callable
+from datetime import time
+from pathlib import Path
+from array import array
+import numpy as np
+import traceback
+import mmap
+import csv
+
+AMOUNT_BYTES = np.frombuffer(b"0123456789.+-eE", dtype=np.uint8)
+
+class MmapCsvReader(SalesDayReader):
+    """Reader scanning a memory-mapped CSV file as bytes with numpy.
+
+    Line and field boundaries are found with vectorized searches over the mapped
+    bytes; hours are decoded from their digits, amounts are converted from fixed-width
+    byte fields, and products and regions are interned once per distinct value. No
+    Python object is created per row or field, and repeated reads of the same file
+    share the page cache instead of copying it into a Python buffer.
+
+    Files the byte scanner does not handle, such as quoted fields or ragged rows, and
+    files with invalid rows are read row by row with the csv engine, which either
+    loads them or raises the same error as CsvModelParser.parse.
+    """
+
+    def __init__(self, key_name: str = "hour", delimiter: str = ";") -> None:
+        """Initializes the reader.
+
+        Args:
+            key_name (str, optional): Column holding the HH:MM time. Defaults to 'hour'.
+            delimiter (str, optional): Single-byte delimiter used in the CSV file. Defaults to ';'.
+        """
+        self.key_name = key_name
+        self.delimiter = delimiter
+
+    def read_day(self, path: Path) -> SalesDay:
+        """Reads and validates a daily sales file from a memory map.
+
+        No view of the map outlives it: an error raised while scanning releases the frames
+        holding the buffer, so the map closes and the error is not replaced by a BufferError.
+
+        Args:
+            path (Path): Path to the CSV file.
+
+        Returns:
+            SalesDay: Columnar sales of the day. A repeated hour replaces the earlier sale in place.
+
+        Raises:
+            ValueError: If a row is invalid, with the same message as CsvModelParser.parse.
+        """
+        if not path.stat().st_size:
+            return SalesDay()
+        with path.open("rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            buffer = np.frombuffer(mapped, dtype=np.uint8)
+            try:
+                sales_day = self._scan(buffer)
+            except BaseException as e:
+                traceback.clear_frames(e.__traceback__)
+                raise
+            finally:
+                del buffer
+        if sales_day is None:
+            METRICS.increment("mmap_reader_fallbacks_total")
+            return self._read_rows(path)
+        return sales_day
+
+    def _scan(self, buffer: np.ndarray) -> SalesDay | None:
+        """Parses the mapped bytes with vectorized operations.
+
+        Args:
+            buffer (np.ndarray): Bytes of the file.
+
+        Returns:
+            SalesDay | None: Columnar sales, or None if the file must be read row by row.
+        """
+        if (buffer == ord('"')).any():
+            return None
+        newlines = np.flatnonzero(buffer == ord("\n"))
+        if not len(newlines) or newlines[-1] != len(buffer) - 1:
+            newlines = np.append(newlines, len(buffer))
+        starts = np.concatenate(([0], newlines[:-1] + 1))
+        ends = newlines.copy()
+        carriage = (ends > starts) & (buffer[np.maximum(ends - 1, 0)] == ord("\r"))
+        ends[carriage] -= 1
+
+        try:
+            header_line = bytes(buffer[starts[0]:ends[0]]).decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+        try:
+            header = next(csv.reader([header_line], delimiter=self.delimiter), [])
+        except csv.Error:
+            return None
+        columns = [self.key_name, "sales_amount", "product", "region"]
+        if not all(column in header for column in columns) or len(set(header)) != len(header):
+            return None
+
+        rows = ends[1:] > starts[1:]
+        starts, ends = starts[1:][rows], ends[1:][rows]
+        if not len(starts):
+            return SalesDay()
+
+        delimiters = np.flatnonzero(buffer == ord(self.delimiter))
+        first = np.searchsorted(delimiters, starts)
+        count = np.searchsorted(delimiters, ends) - first
+        if (count != len(header) - 1).any():
+            return None
+        positions = delimiters[first[:, None] + np.arange(len(header) - 1)]
+        field_starts = np.column_stack((starts, positions + 1))
+        field_ends = np.column_stack((positions, ends))
+
+        def field(column: str) -> tuple[np.ndarray, np.ndarray]:
+            index = header.index(column)
+            return field_starts[:, index], field_ends[:, index]
+
+        minutes = self._minutes(buffer, *field(self.key_name))
+        amounts = self._amounts(buffer, *field("sales_amount"))
+        if minutes is None or amounts is None:
+            return None
+        products = self._interned(buffer, *field("product"), PRODUCTS.encode)
+        regions = self._interned(buffer, *field("region"), self._region_code)
+        if products is None or regions is None:
+            return None
+
+        unique, first_seen = np.unique(minutes, return_index=True)
+        last_seen = len(minutes) - 1 - np.unique(minutes[::-1], return_index=True)[1]
+        order = np.argsort(first_seen, kind="stable")
+        keep = last_seen[order]
+        return SalesDay.from_columns(
+            array("H", unique[order].astype(np.uint16).tobytes()),
+            array("d", amounts[keep].tobytes()),
+            array("I", products[keep].astype(np.uint32).tobytes()),
+            array("B", regions[keep].astype(np.uint8).tobytes()),
+        )
+
+    @staticmethod
+    def _minutes(buffer: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray | None:
+        """Decodes 'H:MM' and 'HH:MM' fields into minutes of the day.
+
+        Returns:
+            np.ndarray | None: Minute of each row, None if a field has another format.
+        """
+        lengths = ends - starts
+        if not np.isin(lengths, (4, 5)).all():
+            return None
+        two_digits = lengths == 5
+        tens = np.where(two_digits, buffer[starts].astype(np.int64) - ord("0"), 0)
+        ones = buffer[starts + two_digits].astype(np.int64) - ord("0")
+        colon = buffer[ends - 3]
+        minute_tens = buffer[ends - 2].astype(np.int64) - ord("0")
+        minute_ones = buffer[ends - 1].astype(np.int64) - ord("0")
+        digits = np.stack((tens, ones, minute_tens, minute_ones))
+        hours = tens * 10 + ones
+        minutes = minute_tens * 10 + minute_ones
+        if (colon != ord(":")).any() or ((digits < 0) | (digits > 9)).any() or (hours > 23).any() or (minutes > 59).any():
+            return None
+        return hours * 60 + minutes
+
+    @staticmethod
+    def _fixed_width(buffer: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """Copies variable-length fields into a zero-padded 2D byte matrix, one row per field."""
+        width = max(int((ends - starts).max()), 1)
+        offsets = np.arange(width)
+        indices = np.minimum(starts[:, None] + offsets, len(buffer) - 1)
+        return np.where(offsets < (ends - starts)[:, None], buffer[indices], 0).astype(np.uint8)
+
+    def _amounts(self, buffer: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray | None:
+        """Converts the amount fields to floats in C.
+
+        Returns:
+            np.ndarray | None: Amount of each row, None if a field is not a positive number.
+        """
+        if (ends == starts).any():
+            return None
+        matrix = self._fixed_width(buffer, starts, ends)
+        if (np.isin(matrix, AMOUNT_BYTES).sum(axis=1) != ends - starts).any():
+            return None
+        try:
+            amounts = matrix.view(f"S{matrix.shape[1]}").ravel().astype(np.float64)
+        except ValueError:
+            return None
+        if not (np.isfinite(amounts) & (amounts > 0)).all():
+            return None
+        return amounts
+
+    def _interned(
+            self,
+            buffer: np.ndarray,
+            starts: np.ndarray,
+            ends: np.ndarray,
+            encode: Callable[[str], int | None],
+    ) -> np.ndarray | None:
+        """Maps every distinct field value to its code, decoding each value only once.
+
+        Returns:
+            np.ndarray | None: Code of each row, None if a value has no code.
+        """
+        matrix = self._fixed_width(buffer, starts, ends)
+        values, inverse = np.unique(matrix.view(f"S{matrix.shape[1]}").ravel(), return_inverse=True)
+        try:
+            codes = [encode(value.decode("utf-8")) for value in values.tolist()]
+        except UnicodeDecodeError:
+            return None
+        if any(code is None for code in codes):
+            return None
+        return np.array(codes, dtype=np.int64)[inverse.ravel()]
+
+    @staticmethod
+    def _region_code(name: str) -> int | None:
+        """Returns the code of a region name, None if it is not a region."""
+        return REGION_CODES[RegionDirection(name)] if name in REGIONS else None
+
+    def _read_rows(self, path: Path) -> SalesDay:
+        """Reads a file row by row with the csv engine.
+
+        Args:
+            path (Path): Path to the CSV file.
+
+        Returns:
+            SalesDay: Columnar sales of the day.
+
+        Raises:
+            ValueError: If a row is invalid.
+        """
+        parser = HourlySalesCsvParser(reader=CsvReader[time](delimiter=self.delimiter), key_name=self.key_name)
+        return SalesDay.from_rows(parser.parse_iter(path))
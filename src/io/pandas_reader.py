@@ -0,0 +1,170 @@
+from src.model import SalesDay, PRODUCTS, REGIONS
+from src.parser import HourlySalesCsvParser
+from src.io.reader import CsvReader, Reader, SalesDayReader
+from src.metrics import METRICS
+from pandas import DataFrame, Series
+from pandas.errors import EmptyDataError, ParserError
+from datetime import time
+from typing import Callable
+from pathlib import Path
+from array import array
+import pandas as pd
+import numpy as np
+import codecs
+
+class PandasCsvReader[K](Reader[K, dict[str, str]], SalesDayReader):
+    """Reader parsing a whole CSV file in one vectorized pass with pandas.
+
+    read_day converts hours, validates amounts and regions for all rows at once and returns
+    columnar arrays, skipping csv.DictReader, strptime and one pydantic model per row.
+    Files with invalid or ambiguous rows are read row by row with the csv engine, so they
+    load or fail exactly as with CsvModelParser.parse.
+    """
+
+    def __init__(self, key_name: str = "hour", delimiter: str = ";") -> None:
+        """Initializes the reader.
+
+        Args:
+            key_name (str, optional): Column holding the HH:MM time. Defaults to 'hour'.
+            delimiter (str, optional): Delimiter used in the CSV file. Defaults to ';'.
+        """
+        self.key_name = key_name
+        self.delimiter = delimiter
+
+    def read(self, path: Path, key_func: Callable[[dict[str, str]], K]) -> dict[K, dict[str, str]]:
+        """Reads a CSV file into a dictionary of raw rows.
+
+        Args:
+            path (Path): Path to the CSV file.
+            key_func (Callable[[dict[str, str]], K]): Function that generates a key from each row.
+
+        Returns:
+            dict[K, dict[str, str]]: A dictionary where the key is the result of key_func(row).
+        """
+        frame = self._read_frame(path)
+        result: dict[K, dict[str, str]] = {}
+        for position in range(len(frame)):
+            row = self._row(frame, position)
+            result[key_func(row)] = row
+        return result
+
+    def read_day(self, path: Path) -> SalesDay:
+        """Reads and validates a daily sales file in one vectorized pass.
+
+        Files the vectorized pass does not accept, such as files with empty or missing
+        fields, ragged rows, a byte order mark, a blank first line, which pandas would skip
+        to take the header from the next line, or a value pandas does not convert like
+        pydantic, are read row by row with the csv engine, which either loads them or
+        raises the same error as CsvModelParser.parse.
+
+        Args:
+            path (Path): Path to the CSV file.
+
+        Returns:
+            SalesDay: Columnar sales of the day. A repeated hour replaces the earlier sale in place.
+
+        Raises:
+            KeyError: If the key column is missing.
+            ValueError: If an hour or a row is invalid, with the same message as CsvModelParser.parse.
+        """
+        sales_day = self._vectorized(path)
+        if sales_day is None:
+            METRICS.increment("pandas_reader_fallbacks_total")
+            return self._read_rows(path)
+        return sales_day
+
+    def _vectorized(self, path: Path) -> SalesDay | None:
+        """Converts and validates all rows at once.
+
+        Args:
+            path (Path): Path to the CSV file.
+
+        Returns:
+            SalesDay | None: Columnar sales, or None if the file must be read row by row.
+        """
+        with path.open("rb") as file:
+            header_line = file.readline()
+        if header_line.startswith(codecs.BOM_UTF8) or (header_line and not header_line.rstrip(b"\r\n")):
+            return None
+        try:
+            frame = self._read_frame(path)
+        except ParserError:
+            return None
+        if frame.empty:
+            return SalesDay()
+        columns = [self.key_name, "sales_amount", "product", "region"]
+        if not all(column in frame.columns for column in columns) or frame.columns.duplicated().any():
+            return None
+        if (frame == "").to_numpy().any():
+            return None
+
+        parts = frame[self.key_name].str.extract(r"^(\d{1,2}):(\d{1,2})$")
+        hours = pd.to_numeric(parts[0], errors="coerce")
+        minutes_of_hour = pd.to_numeric(parts[1], errors="coerce")
+        amounts = pd.to_numeric(frame["sales_amount"], errors="coerce")
+        region_index = pd.Index([region.value for region in REGIONS])
+        region_codes = Series(region_index.get_indexer(pd.Index(frame["region"])), index=frame.index, dtype="int64")
+        invalid = (
+            hours.isna() | minutes_of_hour.isna() | (hours > 23) | (minutes_of_hour > 59)
+            | amounts.isna() | ~(amounts > 0) | (region_codes < 0)
+        )
+        if invalid.any():
+            return None
+        minutes = (hours * 60 + minutes_of_hour).astype("int64")
+
+        keep = ~minutes.duplicated(keep="last")
+        first_seen = Series(np.arange(len(frame)), index=frame.index).groupby(minutes).transform("min")
+        order = first_seen[keep].sort_values(kind="stable").index
+
+        product_codes, names = pd.factorize(frame["product"][order])
+        global_codes = np.array([PRODUCTS.encode(str(name)) for name in names], dtype=np.uint32)
+        return SalesDay.from_columns(
+            array("H", minutes[order].to_numpy(dtype=np.uint16).tobytes()),
+            array("d", amounts[order].to_numpy(dtype=np.float64).tobytes()),
+            array("I", global_codes[product_codes].tobytes()),
+            array("B", region_codes[order].to_numpy(dtype=np.uint8).tobytes()),
+        )
+
+    def _read_frame(self, path: Path) -> DataFrame:
+        """Reads the raw file as strings, with the first line as column names.
+
+        Missing trailing fields are read as empty strings, like empty fields. Rows with
+        more fields than the header raise ParserError instead of being shifted.
+
+        Args:
+            path (Path): Path to the CSV file.
+
+        Returns:
+            DataFrame: All columns as strings, empty for an empty file.
+
+        Raises:
+            ParserError: If a row has more fields than the header.
+        """
+        try:
+            raw = pd.read_csv(path, sep=self.delimiter, header=None, dtype=str, keep_default_na=False, encoding="utf-8")
+        except EmptyDataError:
+            return DataFrame()
+        return raw.iloc[1:].set_axis([str(name) for name in raw.iloc[0]], axis=1)
+
+    @staticmethod
+    def _row(frame: DataFrame, position: int) -> dict[str, str]:
+        """Rebuilds the row as csv.DictReader would return it."""
+        return {
+            str(column): (None if pd.isna(value) else value)  # type: ignore[misc]
+            for column, value in frame.iloc[position].items()
+        }
+
+    def _read_rows(self, path: Path) -> SalesDay:
+        """Reads a file row by row with the csv engine.
+
+        Args:
+            path (Path): Path to the CSV file.
+
+        Returns:
+            SalesDay: Columnar sales of the day.
+
+        Raises:
+            ValueError: If a row is invalid.
+        """
+        parser = HourlySalesCsvParser(reader=CsvReader[time](delimiter=self.delimiter), key_name=self.key_name)
+        return SalesDay.from_rows(parser.parse_iter(path))
@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Sequence
 from typing import Callable
+from src.model import SalesDay
+from src.metrics import METRICS
 from pathlib import Path
 import csv
 
@@ -24,6 +27,20 @@ class Reader[K, V](ABC):
         """
         pass #pragma: no cover
 
+    def iter_read(self, path: Path, key_func: Callable[[V], K]) -> Iterator[tuple[K, V]]:
+        """Reads data from the given path lazily, one record at a time.
+
+        The default implementation delegates to read; subclasses override it to stream.
+
+        Args:
+            path (Path): Path to the input file.
+            key_func (Callable[[V], K]): Function that generates a key from a single record.
+
+        Yields:
+            tuple[K, V]: Key and record, in file order. Keys may repeat.
+        """
+        yield from self.read(path, key_func).items()
+
 class CsvReader[K](Reader[K, dict[str, str]]):
     """Reader implementation for reading data from CSV files."""
 
@@ -46,11 +63,64 @@ class CsvReader[K](Reader[K, dict[str, str]]):
             dict[K, dict[str, str]]: A dictionary where the key is the result of key_func(row),
             and the value is the dictionary representing a CSV row.
         """
-        result: dict[K, dict[str, str]] = {}
+        with METRICS.timer("csv_reader_read_seconds"):
+            return dict(self.iter_read(path, key_func))
+
+    def iter_read(self, path: Path, key_func: Callable[[dict[str, str]], K]) -> Iterator[tuple[K, dict[str, str]]]:
+        """Streams rows of a CSV file without building an intermediate dictionary.
 
+        Args:
+            path (Path): Path to the CSV file.
+            key_func (Callable[[dict[str, str]], K]): Function that generates a key from each row.
+
+        Yields:
+            tuple[K, dict[str, str]]: Key and row, in file order. Keys may repeat.
+        """
         with path.open(newline='', encoding="utf-8") as csvfile:
             reader = csv.DictReader(csvfile, delimiter=self.delimiter)
             for row in reader:
-                key = key_func(row)
-                result[key] = row
-        return result
\ No newline at end of file
+                yield key_func(row), row
+        METRICS.increment("csv_rows_read_total", max(reader.line_num - 1, 0))
+
+    def iter_read_lines(
+            self,
+            lines: Iterable[str],
+            key_func: Callable[[dict[str, str]], K],
+            fieldnames: Sequence[str],
+    ) -> Iterator[tuple[K, dict[str, str]]]:
+        """Streams rows from lines without a header, e.g. the lines appended to a file.
+
+        Args:
+            lines (Iterable[str]): CSV lines, without the header line.
+            key_func (Callable[[dict[str, str]], K]): Function that generates a key from each row.
+            fieldnames (Sequence[str]): Column names taken from the header of the file.
+
+        Yields:
+            tuple[K, dict[str, str]]: Key and row, in order. Keys may repeat.
+        """
+        reader = csv.DictReader(lines, fieldnames=fieldnames, delimiter=self.delimiter)
+        for row in reader:
+            yield key_func(row), row
+        METRICS.increment("csv_rows_read_total", reader.line_num)
+
+class SalesDayReader(ABC):
+    """Abstract base class for readers loading a whole daily sales file into a columnar SalesDay.
+
+    Implementations must validate rows like HourlySales and report failures with the same
+    errors as CsvModelParser.parse.
+    """
+
+    @abstractmethod
+    def read_day(self, path: Path) -> SalesDay:
+        """Reads and validates a daily sales file.
+
+        Args:
+            path (Path): Path to the input file.
+
+        Returns:
+            SalesDay: Columnar sales of the day.
+
+        Raises:
+            ValueError: If a row is invalid.
+        """
+        pass #pragma: no cover
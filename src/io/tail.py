@@ -0,0 +1,91 @@
+from typing import NamedTuple
+from pathlib import Path
+import hashlib
+import csv
+
+CHUNK_SIZE = 1 << 20
+
+class FileTail(NamedTuple):
+    """Prefix of a CSV file that has already been ingested.
+
+    Attributes:
+        offset (int): Length of the prefix in bytes; the prefix always ends with a newline.
+        digest (str): BLAKE2 hash of the prefix.
+        header (tuple[str, ...]): Column names from the first line of the file.
+        rows (int): Number of rows in the store after the prefix was ingested.
+    """
+    offset: int
+    digest: str
+    header: tuple[str, ...]
+    rows: int
+
+
+def ingested_prefix(path: Path, delimiter: str = ";") -> FileTail | None:
+    """Describes the complete lines of a file before it is parsed.
+
+    The file is hashed in chunks, so memory stays bounded by the chunk size and the
+    longest line. A trailing line without a newline may still be written to, so it is
+    not part of the prefix and will be read again with the next appended lines. Hash
+    the file before parsing it: lines written in between are then parsed but not
+    covered by the prefix, so they are read again and trigger a full parse, instead of
+    being covered by the prefix without ever being parsed.
+
+    Args:
+        path (Path): Path to the CSV file.
+        delimiter (str, optional): CSV delimiter. Defaults to ';'.
+
+    Returns:
+        FileTail | None: The prefix with 0 rows, which the caller sets after parsing, or
+            None if the header line is incomplete.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    header: bytes | None = None
+    offset = 0
+    pending = b""
+    with path.open("rb") as file:
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+            pending += chunk
+            end = pending.rfind(b"\n") + 1
+            if not end:
+                continue
+            if header is None:
+                header = pending[:pending.find(b"\n")]
+            digest.update(pending[:end])
+            offset += end
+            pending = pending[end:]
+    if header is None:
+        return None
+    fields = next(csv.reader([header.decode("utf-8").rstrip("\r")], delimiter=delimiter))
+    return FileTail(offset, digest.hexdigest(), tuple(fields), 0)
+
+def read_appended(path: Path, tail: FileTail) -> tuple[list[str], FileTail] | None:
+    """Reads the complete lines appended to a file after its ingested prefix.
+
+    The prefix is hashed again in chunks and compared with the recorded digest, which
+    is much cheaper than parsing and validating it. The returned tail keeps the row
+    count of the given one; the caller updates it after storing the appended rows.
+
+    Args:
+        path (Path): Path to the CSV file.
+        tail (FileTail): Prefix ingested so far.
+
+    Returns:
+        tuple[list[str], FileTail] | None: Appended lines and the new prefix, or None if
+            the file shrank or its prefix changed and it must be parsed in full.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with path.open("rb") as file:
+        remaining = tail.offset
+        while remaining:
+            chunk = file.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                return None
+            digest.update(chunk)
+            remaining -= len(chunk)
+        if digest.hexdigest() != tail.digest:
+            return None
+        appended = file.read()
+    complete = appended[:appended.rfind(b"\n") + 1]
+    digest.update(complete)
+    lines = complete.decode("utf-8").splitlines()
+    return lines, tail._replace(offset=tail.offset + len(complete), digest=digest.hexdigest())
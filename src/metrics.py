@@ -0,0 +1,291 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, nullcontext
+from typing import ContextManager
+from time import perf_counter
+from pathlib import Path
+import threading
+import logging
+import bisect
+import json
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS: tuple[float, ...] = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+type Labels = tuple[tuple[str, str], ...]
+
+class Histogram:
+    """Cumulative histogram of observed values with fixed upper bounds.
+
+    Attributes:
+        buckets (tuple[float, ...]): Upper bounds of the buckets, the last bucket is +Inf.
+        counts (list[int]): Number of observations per bucket, not cumulative.
+        count (int): Number of observations.
+        total (float): Sum of all observed values.
+    """
+
+    __slots__ = ("buckets", "counts", "count", "total")
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        """Records a single value.
+
+        Args:
+            value (float): Observed value, e.g. a duration in seconds.
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+
+
+class MetricsRegistry:
+    """Process-wide counters, gauges and histograms for the hot paths.
+
+    While disabled every call returns immediately and timer() hands out a shared
+    no-op context manager, so instrumented code pays one attribute check.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._counters: dict[tuple[str, Labels], float] = {}
+        self._gauges: dict[tuple[str, Labels], float] = {}
+        self._histograms: dict[tuple[str, Labels], Histogram] = {}
+
+    def increment(self, name: str, value: float = 1, **labels: str) -> None:
+        """Adds to a counter.
+
+        Args:
+            name (str): Metric name.
+            value (float, optional): Amount to add. Defaults to 1.
+            **labels (str): Label values distinguishing series of the same metric.
+        """
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, **labels: str) -> None:
+        """Sets a gauge to the current value.
+
+        Args:
+            name (str): Metric name.
+            value (float): Current value.
+            **labels (str): Label values distinguishing series of the same metric.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._gauges[(name, tuple(sorted(labels.items())))] = value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Records a value in a histogram.
+
+        Args:
+            name (str): Metric name.
+            value (float): Observed value.
+            **labels (str): Label values distinguishing series of the same metric.
+        """
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(value)
+
+    def timer(self, name: str, **labels: str) -> ContextManager[None]:
+        """Measures the duration of a block in seconds into a histogram.
+
+        Args:
+            name (str): Metric name, by convention ending in '_seconds'.
+            **labels (str): Label values distinguishing series of the same metric.
+
+        Returns:
+            ContextManager[None]: Context manager timing its block.
+        """
+        if not self.enabled:
+            return _NO_TIMER
+        return self._timed(name, labels)
+
+    @contextmanager
+    def _timed(self, name: str, labels: dict[str, str]) -> Iterator[None]:
+        """Times a block and records the duration."""
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, perf_counter() - started, **labels)
+
+    def reset(self) -> None:
+        """Drops every recorded value."""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+
+    def to_dict(self) -> dict:
+        """Returns all metrics as JSON serializable data.
+
+        Returns:
+            dict: Counters, gauges and histograms keyed by name and labels.
+        """
+        with self._lock:
+            return {
+                "counters": [_series(name, labels, value=value) for (name, labels), value in self._counters.items()],
+                "gauges": [_series(name, labels, value=value) for (name, labels), value in self._gauges.items()],
+                "histograms": [
+                    _series(
+                        name,
+                        labels,
+                        count=histogram.count,
+                        sum=histogram.total,
+                        buckets=dict(zip([*map(str, histogram.buckets), "+Inf"], histogram.counts)),
+                    )
+                    for (name, labels), histogram in self._histograms.items()
+                ],
+            }
+
+    def render_prometheus(self) -> str:
+        """Renders all metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: Exposition text.
+        """
+        lines: list[str] = []
+        with self._lock:
+            for kind, series in (("counter", self._counters), ("gauge", self._gauges)):
+                for name in sorted({name for name, _ in series}):
+                    lines.append(f"# TYPE {name} {kind}")
+                    for (series_name, labels), value in series.items():
+                        if series_name == name:
+                            lines.append(f"{name}{_format_labels(labels)} {value}")
+            for name in sorted({name for name, _ in self._histograms}):
+                lines.append(f"# TYPE {name} histogram")
+                for (series_name, labels), histogram in self._histograms.items():
+                    if series_name != name:
+                        continue
+                    cumulative = 0
+                    for bound, count in zip([*map(str, histogram.buckets), "+Inf"], histogram.counts):
+                        cumulative += count
+                        lines.append(f"{name}_bucket{_format_labels(labels + (('le', bound),))} {cumulative}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {histogram.total}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _series(name: str, labels: Labels, **values: object) -> dict:
+    """Builds the JSON entry of one series."""
+    return {"name": name, "labels": dict(labels), **values}
+
+def _format_labels(labels: Labels) -> str:
+    """Formats labels as {key="value",...} or an empty string."""
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{value}"' for key, value in labels) + "}"
+
+_NO_TIMER: ContextManager[None] = nullcontext()
+
+METRICS = MetricsRegistry()
+
+
+class MetricsExporter:
+    """Periodically dumps the registry as JSON and optionally serves it over HTTP.
+
+    The HTTP endpoint binds to localhost and answers GET /metrics with the
+    Prometheus text format.
+    """
+
+    def __init__(
+            self,
+            registry: MetricsRegistry,
+            path: Path,
+            interval: float,
+            port: int = 0,
+            collect: Callable[[], None] | None = None,
+    ) -> None:
+        """Initializes the exporter.
+
+        Args:
+            registry (MetricsRegistry): Registry to export.
+            path (Path): JSON file rewritten on every dump.
+            interval (float): Seconds between dumps.
+            port (int, optional): Local HTTP port, 0 disables the endpoint. Defaults to 0.
+            collect (Callable[[], None] | None, optional): Called before every export to
+                refresh gauges. Defaults to None.
+        """
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        self.port = port
+        self.collect = collect
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._server: ThreadingHTTPServer | None = None
+
+    def start(self) -> None:
+        """Starts the dump thread and the HTTP endpoint."""
+        self._thread = threading.Thread(target=self._run, name="metrics-exporter", daemon=True)
+        self._thread.start()
+        if self.port:
+            self._server = ThreadingHTTPServer(("127.0.0.1", self.port), self._handler())
+            threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True).start()
+            logger.info(f"Serving metrics on http://127.0.0.1:{self.port}/metrics")
+
+    def stop(self) -> None:
+        """Stops the exporter and writes a final dump."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        self.dump()
+
+    def dump(self) -> None:
+        """Writes the current metrics to the JSON file atomically."""
+        try:
+            if self.collect is not None:
+                self.collect()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(self.registry.to_dict(), indent=2), encoding="utf-8")
+            tmp_path.replace(self.path)
+        except Exception as e:
+            logger.error(f"Cannot write metrics {e}")
+
+    def _run(self) -> None:
+        """Dumps the metrics every interval until stopped."""
+        while not self._stop.wait(self.interval):
+            self.dump()
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        """Creates the request handler class bound to this exporter."""
+        exporter = self
+
+        class MetricsRequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path != "/metrics":
+                    self.send_error(404)
+                    return
+                if exporter.collect is not None:
+                    exporter.collect()
+                body = exporter.registry.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        return MetricsRequestHandler
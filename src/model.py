@@ -1,6 +1,10 @@
-from pydantic import BaseModel, Field
-from datetime import date, time
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation, field_validator
+from src.store import VersionedStore
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping
+from datetime import date, time, timedelta
 from enum import StrEnum
+from array import array
+import threading
 
 class RegionDirection(StrEnum):
     """Enumeration for possible sales regions."""
@@ -9,6 +13,50 @@ class RegionDirection(StrEnum):
     EAST = "East"
     SOUTH = "South"
 
+class Period(StrEnum):
+    """Calendar periods sales days are rolled up into."""
+    WEEK = "week"
+    MONTH = "month"
+    QUARTER = "quarter"
+    YEAR = "year"
+
+    def bucket(self, day: date) -> date:
+        """Returns the first day of the period containing a day.
+
+        Args:
+            day (date): Any day.
+
+        Returns:
+            date: Monday of the ISO week, or the first day of the month, quarter or year.
+        """
+        match self:
+            case Period.WEEK:
+                return day - timedelta(days=day.weekday())
+            case Period.MONTH:
+                return day.replace(day=1)
+            case Period.QUARTER:
+                return date(day.year, (day.month - 1) // 3 * 3 + 1, 1)
+            case Period.YEAR:
+                return date(day.year, 1, 1)
+
+    def next(self, bucket: date) -> date:
+        """Returns the first day of the following period.
+
+        Args:
+            bucket (date): First day of a period.
+
+        Returns:
+            date: First day of the next period.
+        """
+        match self:
+            case Period.WEEK:
+                return bucket + timedelta(days=7)
+            case Period.MONTH | Period.QUARTER:
+                months = bucket.month - 1 + (1 if self is Period.MONTH else 3)
+                return date(bucket.year + months // 12, months % 12 + 1, 1)
+            case Period.YEAR:
+                return date(bucket.year + 1, 1, 1)
+
 class HourlySales(BaseModel):
     """Model representing sales data for a specific hour.
 
@@ -21,18 +69,245 @@ class HourlySales(BaseModel):
     product: str = Field(...)
     region: RegionDirection
 
-class SalesDay(BaseModel):
-    """Model representing all sales within a single day, grouped by hour.
+class ProductDictionary:
+    """Thread-safe dictionary interning product names to compact integer codes."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._codes: dict[str, int] = {}
+        self._names: list[str] = []
+
+    def encode(self, name: str) -> int:
+        """Returns the code of a product name, assigning a new one if needed.
+
+        Args:
+            name (str): Product name.
+
+        Returns:
+            int: Product code.
+        """
+        code = self._codes.get(name)
+        if code is None:
+            with self._lock:
+                code = self._codes.setdefault(name, len(self._names))
+                if code == len(self._names):
+                    self._names.append(name)
+        return code
+
+    def lookup(self, name: str) -> int | None:
+        """Returns the code of a product name without interning unknown names.
+
+        Args:
+            name (str): Product name.
+
+        Returns:
+            int | None: Product code or None if the product was never seen.
+        """
+        return self._codes.get(name)
+
+    def decode(self, code: int) -> str:
+        """Returns the product name for a code.
+
+        Args:
+            code (int): Product code.
+
+        Returns:
+            str: Product name.
+        """
+        return self._names[code]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+PRODUCTS = ProductDictionary()
+REGIONS: tuple[RegionDirection, ...] = tuple(RegionDirection)
+REGION_CODES: dict[RegionDirection, int] = {region: code for code, region in enumerate(REGIONS)}
+
+class SalesDay:
+    """Columnar representation of all sales within a single day.
+
+    Rows are kept in parallel typed arrays instead of one HourlySales model per hour.
+    Product names are interned in PRODUCTS and regions are stored as their index in REGIONS.
 
     Attributes:
-        data (dict[time, HourlySales]): A mapping from time to HourlySales.
+        minutes (array[int]): Minute of the day of each sale.
+        amounts (array[float]): Sales amount of each sale.
+        products (array[int]): Product code of each sale.
+        regions (array[int]): Region code of each sale.
     """
-    data: dict[time, HourlySales]
+
+    __slots__ = ("minutes", "amounts", "products", "regions")
+
+    def __init__(self, data: Mapping[time, HourlySales] | None = None) -> None:
+        """Initializes the day, optionally from validated HourlySales models.
+
+        Args:
+            data (Mapping[time, HourlySales] | None, optional): A mapping from time to HourlySales.
+        """
+        self.minutes = array("H")
+        self.amounts = array("d")
+        self.products = array("I")
+        self.regions = array("B")
+        if data:
+            for hour, sales in data.items():
+                self.append(hour, sales)
+
+    @classmethod
+    def from_columns(
+            cls,
+            minutes: array[int],
+            amounts: array[float],
+            products: array[int],
+            regions: array[int],
+    ) -> "SalesDay":
+        """Creates a day directly from already encoded columns.
+
+        Args:
+            minutes (array[int]): Minute of the day of each sale.
+            amounts (array[float]): Sales amount of each sale.
+            products (array[int]): Product code of each sale.
+            regions (array[int]): Region code of each sale.
+
+        Returns:
+            SalesDay: Day backed by the given columns.
+
+        Raises:
+            ValueError: If the columns have different lengths.
+        """
+        if not len(minutes) == len(amounts) == len(products) == len(regions):
+            raise ValueError("All SalesDay columns must have the same length")
+        sales_day = cls()
+        sales_day.minutes = minutes
+        sales_day.amounts = amounts
+        sales_day.products = products
+        sales_day.regions = regions
+        return sales_day
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple[time, HourlySales]]) -> "SalesDay":
+        """Builds a day from a stream of validated sales without an intermediate dict.
+
+        A repeated time replaces the earlier sale in place, like assigning to a dict.
+
+        Args:
+            rows (Iterable[tuple[time, HourlySales]]): Time and sale pairs in file order.
+
+        Returns:
+            SalesDay: Day holding one sale per distinct time.
+        """
+        sales_day = cls()
+        positions: dict[int, int] = {}
+        for hour, sales in rows:
+            minute = hour.hour * 60 + hour.minute
+            position = positions.get(minute)
+            if position is None:
+                positions[minute] = len(sales_day)
+                sales_day.append(hour, sales)
+            else:
+                sales_day.amounts[position] = sales.sales_amount
+                sales_day.products[position] = PRODUCTS.encode(sales.product)
+                sales_day.regions[position] = REGION_CODES[sales.region]
+        return sales_day
+
+    def append(self, hour: time, sales: HourlySales) -> None:
+        """Appends a single validated sale to the columns.
+
+        Args:
+            hour (time): Time of the sale.
+            sales (HourlySales): Validated sale.
+        """
+        self.minutes.append(hour.hour * 60 + hour.minute)
+        self.amounts.append(sales.sales_amount)
+        self.products.append(PRODUCTS.encode(sales.product))
+        self.regions.append(REGION_CODES[sales.region])
+
+    def tail(self, start: int) -> "SalesDay":
+        """Returns the sales from a row position on as a new day.
+
+        Args:
+            start (int): Position of the first row to keep.
+
+        Returns:
+            SalesDay: Copy of the rows from start on.
+        """
+        return SalesDay.from_columns(
+            self.minutes[start:], self.amounts[start:], self.products[start:], self.regions[start:]
+        )
+
+    def extended(self, other: "SalesDay") -> "SalesDay":
+        """Returns a new day holding the sales of this day followed by those of another.
+
+        The columns are copied, so a published day is never changed. The caller ensures
+        that both days hold different times.
+
+        Args:
+            other (SalesDay): Sales appended after the sales of this day.
+
+        Returns:
+            SalesDay: Day holding the rows of both days.
+        """
+        return SalesDay.from_columns(
+            self.minutes + other.minutes,
+            self.amounts + other.amounts,
+            self.products + other.products,
+            self.regions + other.regions,
+        )
+
+    def rows(self) -> Iterator[tuple[time, float, str, RegionDirection]]:
+        """Iterates over sales as plain tuples without creating HourlySales models.
+
+        Yields:
+            tuple[time, float, str, RegionDirection]: Time, amount, product and region of a sale.
+        """
+        for minute, amount, product, region in zip(self.minutes, self.amounts, self.products, self.regions):
+            yield time(minute // 60, minute % 60), amount, PRODUCTS.decode(product), REGIONS[region]
+
+    @property
+    def data(self) -> dict[time, HourlySales]:
+        """dict[time, HourlySales]: Sales materialized as HourlySales models, used for export."""
+        return {
+            hour: HourlySales(sales_amount=amount, product=product, region=region)
+            for hour, amount, product, region in self.rows()
+        }
+
+    def __getstate__(self) -> tuple[array[int], array[float], list[str], array[int], array[int]]:
+        """Returns a compact picklable state with process independent product codes."""
+        local_codes: dict[int, int] = {}
+        products = array("I", (local_codes.setdefault(code, len(local_codes)) for code in self.products))
+        names = [PRODUCTS.decode(code) for code in local_codes]
+        return self.minutes, self.amounts, names, products, self.regions
+
+    def __setstate__(self, state: tuple[array[int], array[float], list[str], array[int], array[int]]) -> None:
+        """Restores the columns and re-interns product names in this process."""
+        self.minutes, self.amounts, names, products, self.regions = state
+        codes = [PRODUCTS.encode(name) for name in names]
+        self.products = array("I", (codes[code] for code in products))
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SalesDay):
+            return NotImplemented
+        return (self.minutes == other.minutes and self.amounts == other.amounts
+                and self.products == other.products and self.regions == other.regions)
+
+    def __repr__(self) -> str:
+        return f"SalesDay(rows={len(self)}, total={sum(self.amounts)})"
 
 class SalesStore(BaseModel):
     """Model representing all recorded sales grouped by date.
 
     Attributes:
-        days (dict[date, SalesDay]): A mapping from date to SalesDay.
+        days (MutableMapping[date, SalesDay]): A mapping from date to SalesDay, stored as a
+            copy-on-write VersionedStore.
     """
-    days: dict[date, SalesDay]
\ No newline at end of file
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    days: SkipValidation[MutableMapping[date, SalesDay]]
+
+    @field_validator("days", mode="before")
+    @classmethod
+    def _to_versioned_store(cls, value: Mapping[date, SalesDay]) -> VersionedStore[date, SalesDay]:
+        """Wraps plain mappings into a VersionedStore."""
+        return value if isinstance(value, VersionedStore) else VersionedStore(value)
\ No newline at end of file
@@ -1,8 +1,11 @@
-from src.io.reader import CsvReader
+from src.io.reader import CsvReader, SalesDayReader
 from datetime import time, datetime
+from collections.abc import Iterable, Iterator, Sequence
 from typing import Type, Callable
-from src.model import HourlySales
+from src.model import HourlySales, SalesDay
 from pydantic import BaseModel
+from src.metrics import METRICS
+from time import perf_counter
 from pathlib import Path
 
 class CsvModelParser[K, V: BaseModel]:
@@ -38,19 +41,82 @@ class CsvModelParser[K, V: BaseModel]:
         Raises:
             ValueError: If parsing a row fails.
         """
-        raw_data = self.reader.read(path, self.key_func)
-        result: dict[K, V] = {}
+        with METRICS.timer("parser_parse_seconds"):
+            raw_data = self.reader.read(path, self.key_func)
+            result: dict[K, V] = {}
 
-        for key, row in raw_data.items():
-            try:
-                result[key] = self.model(**row)
-            except Exception as e:
-                raise ValueError(f"Error parsing row {row} in file {path.name} {e}")
+            with METRICS.timer("model_validation_seconds"):
+                for key, row in raw_data.items():
+                    try:
+                        result[key] = self.model(**row)
+                    except Exception as e:
+                        METRICS.increment("validation_errors_total")
+                        raise ValueError(f"Error parsing row {row} in file {path.name} {e}")
 
         return result
 
+    def parse_iter(self, path: Path) -> Iterator[tuple[K, V]]:
+        """Streams a CSV file as model instances, keeping only one row in memory.
+
+        Args:
+            path (Path): Path to the CSV file.
+
+        Returns:
+            Iterator[tuple[K, V]]: Key and model instance, in file order. Keys may repeat.
+
+        Raises:
+            ValueError: While iterating, if parsing a row fails.
+        """
+        return self._validate(self.reader.iter_read(path, self.key_func), path.name)
+
+    def parse_lines(self, lines: Iterable[str], fieldnames: Sequence[str], name: str) -> Iterator[tuple[K, V]]:
+        """Streams headerless CSV lines, e.g. the lines appended to a file, as model instances.
+
+        Args:
+            lines (Iterable[str]): CSV lines without the header line.
+            fieldnames (Sequence[str]): Column names from the header of the file.
+            name (str): Name of the source file, used in error messages.
+
+        Returns:
+            Iterator[tuple[K, V]]: Key and model instance, in order. Keys may repeat.
+
+        Raises:
+            ValueError: While iterating, if parsing a row fails.
+        """
+        return self._validate(self.reader.iter_read_lines(lines, self.key_func, fieldnames), name)
+
+    def _validate(self, rows: Iterable[tuple[K, dict[str, str]]], name: str) -> Iterator[tuple[K, V]]:
+        """Validates raw rows one at a time.
+
+        Args:
+            rows (Iterable[tuple[K, dict[str, str]]]): Keys and raw rows.
+            name (str): Name of the source file, used in error messages.
+
+        Yields:
+            tuple[K, V]: Key and model instance.
+
+        Raises:
+            ValueError: If parsing a row fails.
+        """
+        timed = METRICS.enabled
+        validation = 0.0
+        for key, row in rows:
+            started = perf_counter() if timed else 0.0
+            try:
+                model = self.model(**row)
+            except Exception as e:
+                METRICS.increment("validation_errors_total")
+                raise ValueError(f"Error parsing row {row} in file {name} {e}")
+            if timed:
+                validation += perf_counter() - started
+            yield key, model
+        METRICS.observe("model_validation_seconds", validation)
+
 class HourlySalesCsvParser(CsvModelParser[time, HourlySales]):
-    """Parser specialized for HourlySales CSV data."""
+    """Parser specialized for HourlySales CSV data.
+
+    The parser can be pickled, so it can be shipped to worker processes.
+    """
 
     def __init__(self, reader: CsvReader[time], key_name: str) -> None:
         """Initializes the parser with a key name for the time field.
@@ -59,8 +125,71 @@ class HourlySalesCsvParser(CsvModelParser[time, HourlySales]):
             reader (CsvReader[time]): CSV reader instance.
             key_name (str): The CSV column name used as key (parsed as time).
         """
+        self.key_name = key_name
         super().__init__(
             model=HourlySales,
-            key_func=lambda row: datetime.strptime(row[key_name], "%H:%M").time(),
+            key_func=self._parse_key,
             reader=reader
-        )
\ No newline at end of file
+        )
+
+    def _parse_key(self, row: dict[str, str]) -> time:
+        """Parses the HH:MM key column of a row."""
+        return datetime.strptime(row[self.key_name], "%H:%M").time()
+
+def parse_file[I, T: BaseModel, V](
+        parser: CsvModelParser[I, T], value_func: Callable[[dict[I, T]], V], path: Path
+) -> tuple[V, int]:
+    """Parses a file with a parser and converts the rows with value_func.
+
+    Args:
+        parser (CsvModelParser[I, T]): Parser used to read and convert the file.
+        value_func (Callable[[dict[I, T]], V]): Function converting the parsed rows to a value.
+        path (Path): Path to the CSV file.
+
+    Returns:
+        tuple[V, int]: The parsed value and the number of parsed rows.
+    """
+    parser_data = parser.parse(path)
+    return value_func(parser_data), len(parser_data)
+
+def read_sales_day(
+        parser: CsvModelParser[time, HourlySales], day_reader: SalesDayReader | None, path: Path
+) -> tuple[SalesDay, int]:
+    """Loads a file with the day reader or streams validated rows into a columnar SalesDay.
+
+    Args:
+        parser (CsvModelParser[time, HourlySales]): Parser streaming rows without a day reader.
+        day_reader (SalesDayReader | None): Reader loading whole files into columns.
+        path (Path): Path to the CSV file.
+
+    Returns:
+        tuple[SalesDay, int]: The parsed day and its number of rows.
+    """
+    if day_reader is not None:
+        sales_day = day_reader.read_day(path)
+    else:
+        sales_day = SalesDay.from_rows(parser.parse_iter(path))
+    return sales_day, len(sales_day)
+
+type ParsedBatch[V] = list[tuple[Path, tuple[V, int, float] | Exception]]
+
+def parse_batch[V](parse: Callable[[Path], tuple[V, int]], paths: list[Path]) -> ParsedBatch[V]:
+    """Parses several files in a worker process, so one round trip carries many files.
+
+    Args:
+        parse (Callable[[Path], tuple[V, int]]): Function parsing a single file.
+        paths (list[Path]): Files to parse.
+
+    Returns:
+        ParsedBatch[V]: For every file the value, its rows and the seconds it took, or the error it raised.
+    """
+    results: ParsedBatch[V] = []
+    for path in paths:
+        started = perf_counter()
+        try:
+            value, rows = parse(path)
+        except Exception as e:
+            results.append((path, e))
+            continue
+        results.append((path, (value, rows, perf_counter() - started)))
+    return results
@@ -0,0 +1,114 @@
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from typing import ContextManager
+from datetime import datetime
+from pathlib import Path
+import tracemalloc
+import threading
+import itertools
+import cProfile
+import logging
+import random
+
+logger = logging.getLogger(__name__)
+
+TOP_ALLOCATIONS = 25
+
+class Profiler:
+    """Samples operations with cProfile and tracemalloc and writes the results to disk.
+
+    Each sampled operation produces '<operation>-<timestamp>-<n>.prof', loadable with
+    pstats or snakeviz, and '<operation>-<timestamp>-<n>.alloc.txt' with the source lines
+    holding the most memory allocated during the operation. Only one operation is
+    profiled at a time; nested and concurrent operations run unprofiled. While disabled,
+    or for operations that are not sampled, profile() returns a shared no-op context.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.rate = 1.0
+        self.directory = Path("logs") / "profiles"
+        self._active = threading.Lock()
+        self._sequence = itertools.count(1)
+
+    def configure(self, directory: Path, rate: float) -> None:
+        """Enables profiling.
+
+        Args:
+            directory (Path): Directory receiving the profiles.
+            rate (float): Fraction of operations to profile, between 0 and 1.
+
+        Raises:
+            ValueError: If rate is outside [0, 1].
+        """
+        if not 0 <= rate <= 1:
+            raise ValueError(f"Profile rate {rate} must be between 0 and 1")
+        self.directory = directory
+        self.rate = rate
+        self.enabled = True
+
+    def profile(self, operation: str) -> ContextManager[None]:
+        """Profiles a block if profiling is enabled and the block is sampled.
+
+        Args:
+            operation (str): Name of the operation, used in the file names.
+
+        Returns:
+            ContextManager[None]: Context manager profiling its block.
+        """
+        if not self.enabled or random.random() >= self.rate or not self._active.acquire(blocking=False):
+            return _NOT_PROFILED
+        return self._profiled(operation)
+
+    @contextmanager
+    def _profiled(self, operation: str) -> Iterator[None]:
+        """Runs a block under cProfile and tracemalloc, then writes the results.
+
+        The caller must hold the active lock, which is released here.
+        """
+        profile = cProfile.Profile()
+        tracing = tracemalloc.is_tracing()
+        try:
+            profile.enable()
+        except ValueError as e:
+            self._active.release()
+            logger.warning(f"Cannot profile {operation} {e}")
+            yield
+            return
+        if not tracing:
+            tracemalloc.start()
+        try:
+            yield
+        finally:
+            profile.disable()
+            allocations = tracemalloc.take_snapshot()
+            if not tracing:
+                tracemalloc.stop()
+            self._active.release()
+            self._write(operation, profile, allocations)
+
+    def _write(self, operation: str, profile: cProfile.Profile, allocations: tracemalloc.Snapshot) -> None:
+        """Writes the cProfile stats and the top allocations of one operation.
+
+        Args:
+            operation (str): Name of the operation.
+            profile (cProfile.Profile): Finished profile.
+            allocations (tracemalloc.Snapshot): Memory still allocated at the end of the operation.
+        """
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            stem = f"{operation}-{datetime.now():%Y%m%d-%H%M%S}-{next(self._sequence)}"
+            profile.dump_stats(self.directory / f"{stem}.prof")
+            top = allocations.filter_traces([
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            ]).statistics("lineno")[:TOP_ALLOCATIONS]
+            lines = [f"Top {len(top)} allocations of {operation}"] + [str(stat) for stat in top]
+            (self.directory / f"{stem}.alloc.txt").write_text("\n".join(lines) + "\n", encoding="utf-8")
+            logger.info(f"Profiled {operation} into {stem}")
+        except Exception as e:
+            logger.error(f"Cannot write profile of {operation} {e}")
+
+_NOT_PROFILED: ContextManager[None] = nullcontext()
+
+PROFILER = Profiler()
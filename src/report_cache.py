@@ -0,0 +1,120 @@
+from src.file_watcher import SalesSnapshot
+from collections.abc import Iterable
+from src.index import TotalsRanking
+from typing import Callable
+from datetime import date
+import threading
+
+type ChangesSince = Callable[[int], Iterable[date] | None]
+
+class Reports:
+    """Report results computed for one store version.
+
+    Instances are never modified after they have been published, so callers can keep
+    using them while newer versions are computed.
+
+    Attributes:
+        version (int): Store version the reports were computed for.
+        totals (dict[date, float]): Total sales per day.
+        averages (dict[date, float]): Average sales per day.
+        outliers (dict[date, list[float]]): Outlier sales per day.
+        trend (list[tuple[date, float]]): Daily totals sorted descending.
+    """
+
+    __slots__ = ("version", "totals", "averages", "outliers", "trend")
+
+    def __init__(self, version: int, ranking: TotalsRanking) -> None:
+        self.version = version
+        self.totals: dict[date, float] = {}
+        self.averages: dict[date, float] = {}
+        self.outliers: dict[date, list[float]] = {}
+        self.trend = list(ranking)
+
+    @classmethod
+    def build(cls, snapshot: SalesSnapshot) -> "Reports":
+        """Computes every report from scratch.
+
+        Args:
+            snapshot (SalesSnapshot): Snapshot to report on.
+
+        Returns:
+            Reports: The computed reports.
+        """
+        reports = cls(snapshot.version, snapshot.ranking)
+        for day, day_stats in snapshot.stats.items():
+            reports.totals[day] = day_stats.total
+            reports.averages[day] = day_stats.mean
+            if day_stats.outliers:
+                reports.outliers[day] = list(day_stats.outliers)
+        return reports
+
+    def apply(self, snapshot: SalesSnapshot, changed: Iterable[date]) -> "Reports":
+        """Returns new reports where only the changed days are recomputed.
+
+        The trend is read from the ranking the index keeps sorted on ingest.
+
+        Args:
+            snapshot (SalesSnapshot): Snapshot to report on.
+            changed (Iterable[date]): Days stored or removed since this version.
+
+        Returns:
+            Reports: The updated reports.
+        """
+        reports = Reports(snapshot.version, snapshot.ranking)
+        reports.totals = dict(self.totals)
+        reports.averages = dict(self.averages)
+        reports.outliers = dict(self.outliers)
+
+        for day in changed:
+            day_stats = snapshot.stats.get(day)
+            if day_stats is None:
+                reports.totals.pop(day, None)
+                reports.averages.pop(day, None)
+                reports.outliers.pop(day, None)
+                continue
+            reports.totals[day] = day_stats.total
+            reports.averages[day] = day_stats.mean
+            if day_stats.outliers:
+                reports.outliers[day] = list(day_stats.outliers)
+            else:
+                reports.outliers.pop(day, None)
+        return reports
+
+
+class ReportCache:
+    """Memoizes reports per store version and updates them day by day.
+
+    When the store version did not change, the cached reports are returned in O(1).
+    Otherwise only the days reported by the change log are recomputed; a full rebuild
+    is done when the log no longer covers the cached version.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._reports: Reports | None = None
+
+    def get(self, snapshot: SalesSnapshot, changes_since: ChangesSince) -> Reports:
+        """Returns the reports for a snapshot.
+
+        Args:
+            snapshot (SalesSnapshot): Snapshot to report on.
+            changes_since (ChangesSince): Returns the days changed after a version or None
+                when they are no longer known.
+
+        Returns:
+            Reports: Reports of the snapshot version.
+        """
+        with self._lock:
+            cached = self._reports
+            if cached is not None and cached.version == snapshot.version:
+                return cached
+            if cached is not None and cached.version > snapshot.version:
+                return Reports.build(snapshot)
+
+            changed = changes_since(cached.version) if cached is not None else None
+            if cached is None or changed is None:
+                reports = Reports.build(snapshot)
+            else:
+                reports = cached.apply(snapshot, changed)
+            self._reports = reports
+            return reports
@@ -0,0 +1,126 @@
+from src.file_watcher import HourlySalesCsvHandler
+from src.parser import HourlySalesCsvParser
+from src.model import SalesStore, SalesDay
+from watchdog.observers import Observer
+from src.ingestion import SubmitTask
+from src.snapshot import StoreSnapshot, SalesDayCodec
+from src.service import SalesService
+from src.config import SNAPSHOT_FILE, CSV_DELIMITER, METRICS_FILE, METRICS_INTERVAL
+from src.metrics import METRICS, MetricsExporter
+from src.profiling import PROFILER
+from src.change_reporter import ChangeReporter, Verbosity
+from src.io.reader import CsvReader, SalesDayReader
+from datetime import time
+import argparse
+import logging
+
+logger = logging.getLogger(__name__)
+
+def build_day_reader(engine: str, key_name: str) -> SalesDayReader | None:
+    """Creates the reader for the selected ingestion engine.
+
+    Args:
+        engine (str): Engine name, 'csv' streams rows through the parser.
+        key_name (str): Column holding the HH:MM time.
+
+    Returns:
+        SalesDayReader | None: Whole-file reader or None for the streaming csv engine.
+
+    Raises:
+        ValueError: If the engine is unknown.
+    """
+    match engine:
+        case "csv":
+            return None
+        case "pandas":
+            from src.io.pandas_reader import PandasCsvReader
+            return PandasCsvReader[time](key_name=key_name, delimiter=CSV_DELIMITER)
+        case "mmap":
+            from src.io.mmap_reader import MmapCsvReader
+            return MmapCsvReader(key_name=key_name, delimiter=CSV_DELIMITER)
+        case _:
+            raise ValueError(f"Unknown ingestion engine {engine}")
+
+class SalesRuntime:
+    """Owns the store, file handler, sales service and observer of a running watcher."""
+
+    def __init__(self, args: argparse.Namespace, submit: SubmitTask | None = None) -> None:
+        """Builds the pipeline and loads the watch directory.
+
+        Metrics and profiling are enabled before the initial load, so it is measured as well.
+
+        Args:
+            args (argparse.Namespace): Arguments returned by parse_arguments.
+            submit (SubmitTask | None, optional): Function running ingestion tasks instead of the
+                ingestion workers, e.g. on an asyncio loop. Defaults to None.
+        """
+        self.watch_dir = args.dir
+        if args.metrics:
+            METRICS.enabled = True
+        if args.profile:
+            PROFILER.configure(self.watch_dir / "logs" / "profiles", args.profile_rate)
+        snapshot = StoreSnapshot[SalesDay](
+            self.watch_dir / "cache" / SNAPSHOT_FILE,
+            SalesDayCodec(),
+            config=f"key_name={args.key_name} delimiter={CSV_DELIMITER} engine={args.engine}",
+        ) if args.snapshot else None
+        self.store = SalesStore(days = {})
+        reader = CsvReader[time]()
+        parser = HourlySalesCsvParser(reader=reader, key_name=args.key_name)
+        self.handler = HourlySalesCsvHandler(
+            store=self.store,
+            parser=parser,
+            watch_path=self.watch_dir,
+            workers=args.workers,
+            snapshot=snapshot,
+            quiet_window=args.quiet_window,
+            ingest_workers=args.ingest_workers,
+            ingest_queue_size=args.ingest_queue_size,
+            day_reader=build_day_reader(args.engine, args.key_name),
+            reporter=ChangeReporter(Verbosity(args.verbosity)),
+            archive=self.watch_dir / "archive" if args.archive else None,
+            submit=submit,
+        )
+        self.service = SalesService(self.handler)
+        self.observer = Observer()
+        self.observer.schedule(self.handler, path=str(self.watch_dir), recursive=False)
+        self.metrics: MetricsExporter | None = None
+        if args.metrics:
+            self.metrics = MetricsExporter(
+                METRICS,
+                self.watch_dir / "logs" / METRICS_FILE,
+                METRICS_INTERVAL,
+                port=args.metrics_port,
+                collect=self._collect_metrics,
+            )
+
+    def start(self) -> None:
+        """Starts watching the directory for CSV files."""
+        self.observer.start()
+        if self.metrics is not None:
+            self.metrics.start()
+        logger.info(f"Watching {self.watch_dir} for Csv files")
+
+    def stop(self) -> None:
+        """Stops the observer, flushes pending work and persists the snapshot."""
+        logger.info(f"Stopped observer ...")
+        self.observer.stop()
+        self.observer.join()
+        self.handler.close()
+        if self.handler.ingestion is not None:
+            logger.info(f"Ingestion stats {self.handler.ingestion.stats()}")
+        if self.metrics is not None:
+            self.metrics.stop()
+        self.handler.save_snapshot()
+
+    def _collect_metrics(self) -> None:
+        """Refreshes the gauges describing the current state before metrics are exported."""
+        METRICS.set_gauge("store_version", self.handler.version)
+        METRICS.set_gauge("store_days", len(self.store.days))
+        if self.handler.ingestion is not None:
+            stats = self.handler.ingestion.stats()
+            METRICS.set_gauge("ingestion_queue_depth", stats.depth)
+            METRICS.set_gauge("ingestion_in_flight", stats.in_flight)
+            METRICS.set_gauge("ingestion_blocked_seconds", stats.blocked_seconds)
+        if self.handler.coalescer is not None:
+            METRICS.set_gauge("coalescer_pending", self.handler.coalescer.pending)
@@ -1,7 +1,12 @@
-from collections import defaultdict
+from src.file_watcher import HourlySalesCsvHandler, SalesSnapshot
+from collections.abc import Collection, Sequence
+from src.cube import CubeCell, CubeKey, Dimension, slice_cube
+from src.report_cache import ReportCache, Reports
+from src.index import DayStats
+from src.metrics import METRICS
+from src.profiling import PROFILER
+from src.model import Period, RegionDirection, SalesDay
 from datetime import date
-from src.file_watcher import HourlySalesCsvHandler
-from statistics import mean, stdev
 
 class SalesService:
     """Service layer for managing sales data and reporting."""
@@ -13,10 +18,19 @@ class SalesService:
             hourly_sales_csv_handler (HourlySalesCsvHandler): Handler managing hourly sales data.
         """
         self.hourly_sales_csv_handler = hourly_sales_csv_handler
+        self._reports = ReportCache()
+
+    @property
+    def version(self) -> int:
+        """int: Version of the underlying store, incremented on every change."""
+        return self.hourly_sales_csv_handler.version
 
     def generate_report(self) -> dict:
         """Generates a complete report including totals, averages, trends, and outliers.
 
+        All sections are computed from one consistent snapshot of the store. Results are
+        memoized per store version; every call returns copies, so callers may modify them.
+
         Returns:
             dict: A dictionary containing:
                 - "daily_totals": Total sales per day.
@@ -24,85 +38,339 @@ class SalesService:
                 - "trends": Sales trends (sorted).
                 - "outliers": Detected outlier sales per day.
         """
+        with METRICS.timer("report_seconds", report="generate_report"), PROFILER.profile("generate_report"):
+            reports = self._get_reports()
         return {
-            "daily_totals": self.total_price_per_day(),
-            "avg_sales": self.calculate_avg_sales(),
-            "trends": self.sales_trend(),
-            "outliers": self.detect_outliers()
+            "daily_totals": dict(reports.totals),
+            "avg_sales": dict(reports.averages),
+            "trends": list(reports.trend),
+            "outliers": {day: list(values) for day, values in reports.outliers.items()}
         }
 
-    def total_price_per_day(self) -> dict[date, float]:
+    def total_price_per_day(
+            self,
+            *,
+            start: date | None = None,
+            end: date | None = None,
+            snapshot: SalesSnapshot | None = None,
+    ) -> dict[date, float]:
         """Calculates total sales amount per day.
 
+        Without a range a copy of the memoized report over all days is returned. With a
+        range only the days inside it are read, in date order.
+
+        Args:
+            start (date | None, optional): First day of the range. Defaults to no lower bound.
+            end (date | None, optional): Last day of the range. Defaults to no upper bound.
+            snapshot (SalesSnapshot | None, optional): Snapshot to report on. Defaults to the current one.
+
         Returns:
             dict[date, float]: Mapping of date to total sales amount.
         """
-        result = {}
-        data = self._get_sales_amount()
-        for day, amount in data.items():
-            result[day] = sum(amount)
-        return result
+        if start is None and end is None:
+            return dict(self._get_reports(snapshot).totals)
+        return {day: stats.total for day, stats in self._range_stats(start, end, snapshot)}
 
-    def calculate_avg_sales(self) -> dict[date, float]:
+    def calculate_avg_sales(
+            self,
+            *,
+            start: date | None = None,
+            end: date | None = None,
+            snapshot: SalesSnapshot | None = None,
+    ) -> dict[date, float]:
         """Calculates average sales amount per day.
 
+        Args:
+            start (date | None, optional): First day of the range. Defaults to no lower bound.
+            end (date | None, optional): Last day of the range. Defaults to no upper bound.
+            snapshot (SalesSnapshot | None, optional): Snapshot to report on. Defaults to the current one.
+
         Returns:
             dict[date, float]: Mapping of date to average sales amount.
         """
-        result = {}
-        data = self._get_sales_amount()
-        for day, amount in data.items():
-            if amount:
-                result[day] = self._avg(amount)
-        return result
+        if start is None and end is None:
+            return dict(self._get_reports(snapshot).averages)
+        return {day: stats.mean for day, stats in self._range_stats(start, end, snapshot)}
 
-    def detect_outliers(self) -> dict[date, list[float]]:
+    def detect_outliers(
+            self,
+            *,
+            start: date | None = None,
+            end: date | None = None,
+            snapshot: SalesSnapshot | None = None,
+    ) -> dict[date, list[float]]:
         """Detects outlier sales values per day using standard deviation threshold.
 
+        Outliers are computed by the index when a day changes, so this only collects them.
+
+        Args:
+            start (date | None, optional): First day of the range. Defaults to no lower bound.
+            end (date | None, optional): Last day of the range. Defaults to no upper bound.
+            snapshot (SalesSnapshot | None, optional): Snapshot to report on. Defaults to the current one.
+
         Returns:
             dict[date, list[float]]: Mapping of date to list of outlier sales values.
         """
-        result: defaultdict[date, list[float]] = defaultdict(list)
-        data = self._get_sales_amount()
-        for day, amount in data.items():
-            avg = self._avg(amount)
-            outlier_threshold = avg + 1 * stdev(amount)
-            for sale in amount:
-                if sale > outlier_threshold:
-                    result[day].append(sale)
+        if start is None and end is None:
+            return {day: list(values) for day, values in self._get_reports(snapshot).outliers.items()}
+        return {day: list(stats.outliers) for day, stats in self._range_stats(start, end, snapshot) if stats.outliers}
 
-        return dict(result)
-
-    def sales_trend(self) -> list[tuple[date, float]]:
+    def sales_trend(
+            self,
+            *,
+            start: date | None = None,
+            end: date | None = None,
+            snapshot: SalesSnapshot | None = None,
+    ) -> list[tuple[date, float]]:
         """Returns sorted daily sales totals in descending order.
 
+        Days with equal totals keep the order in which they were loaded, or date order
+        when a range is given.
+
+        Args:
+            start (date | None, optional): First day of the range. Defaults to no lower bound.
+            end (date | None, optional): Last day of the range. Defaults to no upper bound.
+            snapshot (SalesSnapshot | None, optional): Snapshot to report on. Defaults to the current one.
+
         Returns:
             list[tuple[date, float]]: List of (date, total sales) sorted by sales amount descending.
         """
-        data = self.total_price_per_day()
-        sorted_data = sorted(data.items(), key=lambda x: x[1], reverse=True)
-        return sorted_data
+        if start is None and end is None:
+            return list(self._get_reports(snapshot).trend)
+        data = [(day, stats.total) for day, stats in self._range_stats(start, end, snapshot)]
+        return sorted(data, key=lambda x: x[1], reverse=True)
+
+    def period_sales(self, period: Period, *, snapshot: SalesSnapshot | None = None) -> dict[date, DayStats]:
+        """Returns the rolled-up statistics of every week, month, quarter or year.
 
-    def _get_sales_amount(self) -> dict[date, list[float]]:
-        """Retrieves all sales amounts grouped by day.
+        Rollups are maintained by the index when a day changes, so this costs O(buckets).
+
+        Args:
+            period (Period): Granularity of the rollup.
+            snapshot (SalesSnapshot | None, optional): Snapshot to report on. Defaults to the current one.
 
         Returns:
-            dict[date, list[float]]: Mapping of date to list of sales amounts.
+            dict[date, DayStats]: Mapping of the first day of each period to its statistics, in date order.
         """
-        result = defaultdict(list)
-        for day, sales_day in self.hourly_sales_csv_handler.store.items():
-            for sales in sales_day.data.values():
-                result[day].append(sales.sales_amount)
+        rollup = (snapshot or self._snapshot()).rollups[period]
+        return {bucket: rollup[bucket] for bucket in sorted(rollup)}
+
+    def period_totals(self, period: Period, *, snapshot: SalesSnapshot | None = None) -> dict[date, float]:
+        """Calculates total sales amount per week, month, quarter or year.
+
+        Args:
+            period (Period): Granularity of the rollup.
+            snapshot (SalesSnapshot | None, optional): Snapshot to report on. Defaults to the current one.
+
+        Returns:
+            dict[date, float]: Mapping of the first day of each period to its total sales amount.
+        """
+        return {bucket: stats.total for bucket, stats in self.period_sales(period, snapshot=snapshot).items()}
+
+    def sales_by(
+            self,
+            group_by: Sequence[Dimension] = (),
+            *,
+            products: Collection[str] | None = None,
+            regions: Collection[RegionDirection] | None = None,
+            start: date | None = None,
+            end: date | None = None,
+            snapshot: SalesSnapshot | None = None,
+    ) -> dict[CubeKey, CubeCell]:
+        """Slices and groups sales by day, product and region from the per-day cubes.
+
+        Only the pre-aggregated cells of the days in range are read, never the rows.
+
+        Args:
+            group_by (Sequence[Dimension], optional): Dimensions of the result keys, in order.
+                Defaults to a single total.
+            products (Collection[str] | None, optional): Products to keep. Defaults to all.
+            regions (Collection[RegionDirection] | None, optional): Regions to keep. Defaults to all.
+            start (date | None, optional): First day of the range. Defaults to no lower bound.
+            end (date | None, optional): Last day of the range. Defaults to no upper bound.
+            snapshot (SalesSnapshot | None, optional): Snapshot to report on. Defaults to the current one.
+
+        Returns:
+            dict[CubeKey, CubeCell]: Sum and count per group, keyed by one value per dimension.
+        """
+        cubes = ((day, stats.cube) for day, stats in self._range_stats(start, end, snapshot) if stats.cube is not None)
+        return slice_cube(cubes, group_by, products, regions)
+
+    def hourly_profile(self, *, snapshot: SalesSnapshot | None = None) -> dict[int, tuple[float, float]]:
+        """Returns the typical day: average and spread of the daily total of every hour.
+
+        Args:
+            snapshot (SalesSnapshot | None, optional): Snapshot to report on. Defaults to the current one.
+
+        Returns:
+            dict[int, tuple[float, float]]: Mapping of hour to (average total, standard deviation).
+        """
+        profile = (snapshot or self._snapshot()).profile
+        return {hour: (float(mean), float(stdev)) for hour, (mean, stdev) in enumerate(zip(profile.mean, profile.stdev))}
+
+    def peak_hours(self, n: int = 3, *, snapshot: SalesSnapshot | None = None) -> list[tuple[int, float]]:
+        """Returns the hours with the highest average daily total.
+
+        Args:
+            n (int, optional): Number of hours. Defaults to 3.
+            snapshot (SalesSnapshot | None, optional): Snapshot to report on. Defaults to the current one.
+
+        Returns:
+            list[tuple[int, float]]: (hour, average total) pairs, highest first.
+        """
+        return (snapshot or self._snapshot()).profile.peak_hours(n)
+
+    def hour_anomalies(self, day: date, *, snapshot: SalesSnapshot | None = None) -> dict[int, tuple[float, float]]:
+        """Scores every hour of a day against the typical day.
+
+        Args:
+            day (date): The scored day.
+            snapshot (SalesSnapshot | None, optional): Snapshot to report on. Defaults to the current one.
+
+        Returns:
+            dict[int, tuple[float, float]]: Mapping of hour to (total sales, z-score), empty if the
+                day has no sales.
+        """
+        snapshot = snapshot or self._snapshot()
+        stats = snapshot.stats.get(day)
+        if stats is None or stats.hours is None:
+            return {}
+        scores = snapshot.profile.anomaly_scores(stats.hours)
+        return {hour: (float(total), float(score)) for hour, (total, score) in enumerate(zip(stats.hours.totals, scores))}
+
+    def trend_page(
+            self,
+            offset: int,
+            limit: int,
+            *,
+            snapshot: SalesSnapshot | None = None,
+    ) -> list[tuple[date, float]]:
+        """Returns a page of the sales trend without materializing every day.
+
+        Args:
+            offset (int): Number of top days to skip.
+            limit (int): Maximum number of days to return.
+            snapshot (SalesSnapshot | None, optional): Snapshot to report on. Defaults to the current one.
 
-        return result
+        Returns:
+            list[tuple[date, float]]: (date, total sales) pairs sorted by sales amount descending.
+        """
+        return (snapshot or self._snapshot()).ranking.page(offset, limit)
+
+    def top_days(self, n: int, *, snapshot: SalesSnapshot | None = None) -> list[tuple[date, float]]:
+        """Returns the n days with the highest total sales, highest first.
+
+        Args:
+            n (int): Number of days.
+            snapshot (SalesSnapshot | None, optional): Snapshot to report on. Defaults to the current one.
+
+        Returns:
+            list[tuple[date, float]]: (date, total sales) pairs.
+        """
+        return (snapshot or self._snapshot()).ranking.top(n)
+
+    def bottom_days(self, n: int, *, snapshot: SalesSnapshot | None = None) -> list[tuple[date, float]]:
+        """Returns the n days with the lowest total sales, lowest first.
+
+        Args:
+            n (int): Number of days.
+            snapshot (SalesSnapshot | None, optional): Snapshot to report on. Defaults to the current one.
+
+        Returns:
+            list[tuple[date, float]]: (date, total sales) pairs.
+        """
+        return (snapshot or self._snapshot()).ranking.bottom(n)
+
+    def rank_of_day(self, day: date, *, snapshot: SalesSnapshot | None = None) -> int | None:
+        """Returns the position of a day in the sales trend.
+
+        Args:
+            day (date): The requested day.
+            snapshot (SalesSnapshot | None, optional): Snapshot to report on. Defaults to the current one.
+
+        Returns:
+            int | None: 1-based rank, 1 being the best day, or None if the day has no sales.
+        """
+        return (snapshot or self._snapshot()).ranking.rank(day)
+
+    def total_percentile(self, fraction: float, *, snapshot: SalesSnapshot | None = None) -> float:
+        """Returns the daily total sales at a percentile.
+
+        Args:
+            fraction (float): Percentile between 0 and 1, e.g. 0.9 for the 90th percentile.
+            snapshot (SalesSnapshot | None, optional): Snapshot to report on. Defaults to the current one.
+
+        Returns:
+            float: Daily total at the percentile, 0 if there are no days.
+
+        Raises:
+            ValueError: If fraction is outside [0, 1].
+        """
+        return (snapshot or self._snapshot()).ranking.percentile(fraction)
+
+    def get_day(self, day: date) -> SalesDay | None:
+        """Returns the columnar sales of a single day.
+
+        Args:
+            day (date): The requested day.
+
+        Returns:
+            SalesDay | None: Sales of the day or None if the day is not loaded.
+        """
+        return self._snapshot().days.get(day)
+
+    def _snapshot(self) -> SalesSnapshot:
+        """Takes a consistent snapshot of the store and its index.
+
+        Returns:
+            SalesSnapshot: Immutable view of the current store version.
+        """
+        return self.hourly_sales_csv_handler.snapshot()
+
+    def _get_reports(self, snapshot: SalesSnapshot | None = None) -> Reports:
+        """Returns the memoized reports of a snapshot.
+
+        Unchanged versions are served from the cache; after a change only the days
+        reported by the handler's change log are recomputed.
+
+        Args:
+            snapshot (SalesSnapshot | None, optional): Snapshot to report on. Defaults to the current one.
+
+        Returns:
+            Reports: Reports of the snapshot version.
+        """
+        snapshot = snapshot or self._snapshot()
+        return self._reports.get(snapshot, self.hourly_sales_csv_handler.changes_since)
+
+    def date_bounds(self, *, snapshot: SalesSnapshot | None = None) -> tuple[date, date] | None:
+        """Returns the first and last day holding sales.
+
+        Args:
+            snapshot (SalesSnapshot | None, optional): Snapshot to read. Defaults to the current one.
+
+        Returns:
+            tuple[date, date] | None: Earliest and latest day or None when the store is empty.
+        """
+        dates = (snapshot or self._snapshot()).dates
+        if dates.first is None or dates.last is None:
+            return None
+        return dates.first, dates.last
 
-    def _avg(self, values: list[float]) -> float:
-        """Calculates the average of a list of numbers.
+    def _range_stats(
+            self,
+            start: date | None,
+            end: date | None,
+            snapshot: SalesSnapshot | None = None,
+    ) -> list[tuple[date, DayStats]]:
+        """Retrieves the statistics of the days within a range from the ordered date index.
 
         Args:
-            values (list[float]): List of float values.
+            start (date | None): First day of the range, None for no lower bound.
+            end (date | None): Last day of the range, None for no upper bound.
+            snapshot (SalesSnapshot | None, optional): Snapshot to read. Defaults to the current one.
 
         Returns:
-            float: Average value. Returns 0 if list is empty.
+            list[tuple[date, DayStats]]: (date, statistics) pairs in date order.
         """
-        return sum(values) / len(values) if values else 0
\ No newline at end of file
+        snapshot = snapshot or self._snapshot()
+        return [(day, snapshot.stats[day]) for day in snapshot.dates.between(start, end)]
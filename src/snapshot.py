@@ -0,0 +1,243 @@
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+from src.model import SalesDay, PRODUCTS, REGIONS
+from pathlib import Path
+from array import array
+import numpy as np
+import hashlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 2
+
+type Fingerprint = tuple[int, int, str]
+
+class SnapshotCodec[V](ABC):
+    """Converts store values to named numpy arrays and back.
+
+    Snapshots only hold plain arrays and are read without pickle, so a snapshot file
+    written by someone else can at worst hold wrong values, never executable code.
+
+    Type Args:
+        V: The value type stored for each file.
+    """
+
+    @abstractmethod
+    def encode(self, values: Sequence[V]) -> dict[str, np.ndarray]:
+        """Converts values into arrays.
+
+        Args:
+            values (Sequence[V]): Values in snapshot order.
+
+        Returns:
+            dict[str, np.ndarray]: Arrays holding all values.
+        """
+        pass
+
+    @abstractmethod
+    def decode(self, arrays: Mapping[str, np.ndarray]) -> list[V]:
+        """Restores the values from the arrays returned by encode.
+
+        Args:
+            arrays (Mapping[str, np.ndarray]): Arrays by name.
+
+        Returns:
+            list[V]: Values in snapshot order.
+
+        Raises:
+            ValueError: If the arrays do not describe valid values.
+        """
+        pass
+
+class SalesDayCodec(SnapshotCodec[SalesDay]):
+    """Stores the columns of all days back to back, in the layout of src.io.archive.
+
+    Products are stored as indices into the list of their names, so the snapshot does
+    not depend on the product codes of the process that wrote it.
+    """
+
+    def encode(self, values: Sequence[SalesDay]) -> dict[str, np.ndarray]:
+        """Concatenates the columns of the days and records where each day starts.
+
+        Args:
+            values (Sequence[SalesDay]): Days in snapshot order.
+
+        Returns:
+            dict[str, np.ndarray]: Offsets, columns and product names.
+        """
+        offsets = np.zeros(len(values) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(sales_day) for sales_day in values])
+        product_codes, local_products = np.unique(
+            self._concat([sales_day.products for sales_day in values], np.uint32), return_inverse=True
+        )
+        return {
+            "offsets": offsets,
+            "minutes": self._concat([sales_day.minutes for sales_day in values], np.uint16),
+            "amounts": self._concat([sales_day.amounts for sales_day in values], np.float64),
+            "products": local_products.astype(np.uint32),
+            "product_names": np.array([PRODUCTS.decode(int(code)) for code in product_codes], dtype=str),
+            "regions": self._concat([sales_day.regions for sales_day in values], np.uint8),
+        }
+
+    def decode(self, arrays: Mapping[str, np.ndarray]) -> list[SalesDay]:
+        """Splits the columns back into days.
+
+        Args:
+            arrays (Mapping[str, np.ndarray]): Arrays returned by encode.
+
+        Returns:
+            list[SalesDay]: Days in snapshot order.
+
+        Raises:
+            ValueError: If a region code is unknown or the columns have different lengths.
+        """
+        offsets = arrays["offsets"]
+        regions = arrays["regions"].astype(np.uint8)
+        if len(regions) and int(regions.max()) >= len(REGIONS):
+            raise ValueError("Unknown region code in snapshot")
+        codes = np.array([PRODUCTS.encode(name) for name in arrays["product_names"].tolist()], dtype=np.uint32)
+        products = codes[arrays["products"]]
+        minutes = arrays["minutes"].astype(np.uint16)
+        amounts = arrays["amounts"].astype(np.float64)
+        if not len(minutes) == len(amounts) == len(products) == len(regions) == offsets[-1]:
+            raise ValueError("Snapshot columns have different lengths")
+        return [
+            SalesDay.from_columns(
+                array("H", minutes[start:end].tobytes()),
+                array("d", amounts[start:end].tobytes()),
+                array("I", products[start:end].tobytes()),
+                array("B", regions[start:end].tobytes()),
+            )
+            for start, end in zip(offsets[:-1].tolist(), offsets[1:].tolist())
+        ]
+
+    @staticmethod
+    def _concat(columns: Sequence[array], dtype: type[np.generic]) -> np.ndarray:
+        """Joins typed columns into one array."""
+        if not columns:
+            return np.empty(0, dtype=dtype)
+        return np.concatenate([np.frombuffer(column, dtype=dtype) for column in columns])
+
+class StoreSnapshot[V]:
+    """On-disk cache of parsed store values keyed by the fingerprint of their source file.
+
+    A file is reloaded from the snapshot only when its size, modification time and
+    content hash all match the values recorded when it was parsed, and the snapshot was
+    written with the same parser configuration. Entries are stored as numpy arrays and
+    read without pickle.
+
+    Type Args:
+        V: The value type stored for each file.
+    """
+
+    def __init__(self, path: Path, codec: SnapshotCodec[V], config: str = "") -> None:
+        """Initializes the snapshot and loads existing entries from disk.
+
+        Args:
+            path (Path): Location of the snapshot file.
+            codec (SnapshotCodec[V]): Converts values to arrays and back.
+            config (str, optional): Parser configuration the values depend on, such as the
+                key column, delimiter and engine. A snapshot written with another
+                configuration is ignored. Defaults to ''.
+        """
+        self.path = path
+        self.codec = codec
+        self.config = config
+        self.entries: dict[str, tuple[Fingerprint, V, int]] = {}
+        self.load()
+
+    @staticmethod
+    def fingerprint(path: Path) -> Fingerprint:
+        """Computes the fingerprint of a file.
+
+        Args:
+            path (Path): Path to the file.
+
+        Returns:
+            Fingerprint: Size, modification time in nanoseconds and BLAKE2 content hash.
+        """
+        stat = path.stat()
+        digest = hashlib.blake2b(digest_size=16)
+        with path.open("rb") as file:
+            for chunk in iter(lambda: file.read(1 << 20), b""):
+                digest.update(chunk)
+        return stat.st_size, stat.st_mtime_ns, digest.hexdigest()
+
+    def get(self, path: Path, fingerprint: Fingerprint) -> tuple[V, int] | None:
+        """Returns the cached value of a file if its fingerprint did not change.
+
+        Args:
+            path (Path): Path to the source file.
+            fingerprint (Fingerprint): Current fingerprint of the file.
+
+        Returns:
+            tuple[V, int] | None: The cached value and its row count or None on a miss.
+        """
+        entry = self.entries.get(str(path.resolve()))
+        if entry is None or entry[0] != fingerprint:
+            return None
+        return entry[1], entry[2]
+
+    def put(self, path: Path, fingerprint: Fingerprint, value: V, rows: int) -> None:
+        """Records the parsed value of a file.
+
+        Args:
+            path (Path): Path to the source file.
+            fingerprint (Fingerprint): Fingerprint of the file at parse time.
+            value (V): Parsed value.
+            rows (int): Number of parsed rows.
+        """
+        self.entries[str(path.resolve())] = (fingerprint, value, rows)
+
+    def load(self) -> None:
+        """Loads entries from disk, starting empty if the file is missing, unreadable or stale."""
+        if not self.path.exists():
+            return
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                version = int(data["version"])
+                config = str(data["config"])
+                if version != SNAPSHOT_VERSION or config != self.config:
+                    logger.warning(f"Ignoring snapshot {self.path.name} with version {version} and config {config!r}")
+                    return
+                values = self.codec.decode({
+                    name.removeprefix("value_"): data[name] for name in data.files if name.startswith("value_")
+                })
+                fingerprints = zip(data["sizes"].tolist(), data["mtimes"].tolist(), data["digests"].tolist())
+                entries = {
+                    path: (fingerprint, value, rows)
+                    for path, fingerprint, value, rows in zip(
+                        data["paths"].tolist(), fingerprints, values, data["rows"].tolist(), strict=True
+                    )
+                }
+        except Exception as e:
+            logger.warning(f"Cannot read snapshot {self.path.name} {e}")
+            return
+        self.entries = entries
+        logger.info(f"Loaded snapshot with {len(entries)} entries")
+
+    def save(self) -> None:
+        """Writes entries of still existing files to disk atomically."""
+        self.entries = {path: entry for path, entry in self.entries.items() if Path(path).exists()}
+        paths = list(self.entries)
+        fingerprints = [self.entries[path][0] for path in paths]
+        values = self.codec.encode([self.entries[path][1] for path in paths])
+        arrays = {f"value_{name}": column for name, column in values.items()}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with tmp_path.open("wb") as file:
+            np.savez(
+                file,
+                version=np.array(SNAPSHOT_VERSION),
+                config=np.array(self.config),
+                paths=np.array(paths, dtype=str),
+                sizes=np.array([size for size, _, _ in fingerprints], dtype=np.int64),
+                mtimes=np.array([mtime for _, mtime, _ in fingerprints], dtype=np.int64),
+                digests=np.array([digest for _, _, digest in fingerprints], dtype=str),
+                rows=np.array([self.entries[path][2] for path in paths], dtype=np.int64),
+                allow_pickle=False,
+                **arrays,
+            )
+        tmp_path.replace(self.path)
+        logger.info(f"Saved snapshot with {len(self.entries)} entries")
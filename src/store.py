@@ -0,0 +1,75 @@
+from collections.abc import Iterator, Mapping, MutableMapping
+from types import MappingProxyType
+from typing import Any
+import threading
+
+class VersionedStore[K, V](MutableMapping[K, V]):
+    """Thread-safe copy-on-write mapping publishing immutable, versioned snapshots.
+
+    Every write copies the underlying dict under a lock and atomically publishes the
+    new copy together with an incremented version. Readers never see a dict that is
+    mutated afterwards, so iterating a snapshot is safe while writers keep working.
+
+    Type Variables:
+        K: The type of the keys.
+        V: The type of the values.
+    """
+
+    def __init__(self, data: Mapping[K, V] | None = None) -> None:
+        """Initializes the store.
+
+        Args:
+            data (Mapping[K, V] | None, optional): Initial contents. Defaults to empty.
+        """
+        self._lock = threading.Lock()
+        self._published: tuple[int, Mapping[K, V]] = (0, MappingProxyType(dict(data or {})))
+
+    @property
+    def version(self) -> int:
+        """int: Number of writes published so far."""
+        return self._published[0]
+
+    def snapshot(self) -> tuple[int, Mapping[K, V]]:
+        """Returns the current version and a read-only view that never changes, in O(1).
+
+        Returns:
+            tuple[int, Mapping[K, V]]: The version and its immutable contents.
+        """
+        return self._published
+
+    def __getitem__(self, key: K) -> V:
+        return self._published[1][key]
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._published[1])
+
+    def __len__(self) -> int:
+        return len(self._published[1])
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._published[1]
+
+    def __setitem__(self, key: K, value: V) -> None:
+        with self._lock:
+            version, data = self._published
+            new_data = dict(data)
+            new_data[key] = value
+            self._published = (version + 1, MappingProxyType(new_data))
+
+    def __delitem__(self, key: K) -> None:
+        with self._lock:
+            version, data = self._published
+            new_data = dict(data)
+            del new_data[key]
+            self._published = (version + 1, MappingProxyType(new_data))
+
+    def update(self, other: Any = (), /, **kwargs: V) -> None:
+        """Applies several writes and publishes them as a single new version."""
+        with self._lock:
+            version, data = self._published
+            new_data = dict(data)
+            new_data.update(other, **kwargs)
+            self._published = (version + 1, MappingProxyType(new_data))
+
+    def __repr__(self) -> str:
+        return f"VersionedStore(version={self.version}, {dict(self._published[1])!r})"
@@ -1,8 +1,19 @@
 from src.service import SalesService
+from collections.abc import Collection, Sequence
+from src.model import Period, RegionDirection
+from src.cube import Dimension
 from pandas import DataFrame
+from typing import Callable
+from datetime import date
+
+type DateRange = tuple[date | None, date | None]
 
 class UIDataService:
-    """Service responsible for converting raw sales data into structured reports."""
+    """Service responsible for converting raw sales data into structured reports.
+
+    Report DataFrames are cached per store version, so repeated requests between
+    file changes are served without recomputing them.
+    """
 
     def __init__(self, service: SalesService):
         """Initializes the ReportService with a SalesService instance.
@@ -11,51 +22,261 @@ class UIDataService:
             service (SalesService): The sales service providing raw sales data.
         """
         self.service = service
+        self._cache: dict[str, tuple[int, DateRange, DataFrame]] = {}
+
+    def _cached(self, name: str, build: Callable[[], DataFrame], date_range: DateRange = (None, None)) -> DataFrame:
+        """Returns a cached report or builds it when the store version or the range changed.
+
+        Args:
+            name (str): Name of the report.
+            build (Callable[[], DataFrame]): Function building the report.
+            date_range (DateRange, optional): Range the report covers. Defaults to all days.
+
+        Returns:
+            DataFrame: The report for the current store version.
+        """
+        version = self.service.version
+        cached = self._cache.get(name)
+        if cached is not None and cached[0] == version and cached[1] == date_range:
+            return cached[2]
+        df = build()
+        self._cache[name] = (version, date_range, df)
+        return df
+
+    def date_bounds(self) -> tuple[date, date] | None:
+        """Returns the first and last day holding sales, used as limits of the range picker.
+
+        Returns:
+            tuple[date, date] | None: Earliest and latest day or None when there are no sales.
+        """
+        return self.service.date_bounds()
 
-    def report_total_price_per_day(self) -> DataFrame:
+    def report_total_price_per_day(self, start: date | None = None, end: date | None = None) -> DataFrame:
         """Generates a report of total sales per day.
 
+        Args:
+            start (date | None, optional): First day of the range. Defaults to no lower bound.
+            end (date | None, optional): Last day of the range. Defaults to no upper bound.
+
         Returns:
             DataFrame: A DataFrame with columns ["Day", "Total sales"].
         """
-        data = self.service.total_price_per_day()
-        df = DataFrame([
-            {"Day": day, "Total sales": total} for day, total in data.items()
-        ])
-        return df
+        def build() -> DataFrame:
+            data = self.service.total_price_per_day(start=start, end=end)
+            return DataFrame([
+                {"Day": day, "Total sales": total} for day, total in data.items()
+            ])
+
+        return self._cached("report_total_price_per_day", build, (start, end))
 
-    def report_calculate_avg_sales(self) -> DataFrame:
+    def report_calculate_avg_sales(self, start: date | None = None, end: date | None = None) -> DataFrame:
         """Generates a report of average sales per day.
 
+        Args:
+            start (date | None, optional): First day of the range. Defaults to no lower bound.
+            end (date | None, optional): Last day of the range. Defaults to no upper bound.
+
         Returns:
             DataFrame: A DataFrame with columns ["Day", "Avg sales"].
         """
-        data = self.service.calculate_avg_sales()
-        df = DataFrame([
-            {"Day": day, "Avg sales": avg} for day, avg in data.items()
-        ])
-        return df
+        def build() -> DataFrame:
+            data = self.service.calculate_avg_sales(start=start, end=end)
+            return DataFrame([
+                {"Day": day, "Avg sales": avg} for day, avg in data.items()
+            ])
+
+        return self._cached("report_calculate_avg_sales", build, (start, end))
 
-    def report_sales_trend(self) -> DataFrame:
+    def report_sales_trend(self, start: date | None = None, end: date | None = None) -> DataFrame:
         """Generates a report showing sales trends (sorted by sales value descending).
 
+        Args:
+            start (date | None, optional): First day of the range. Defaults to no lower bound.
+            end (date | None, optional): Last day of the range. Defaults to no upper bound.
+
         Returns:
             DataFrame: A DataFrame with columns ["Day", "Sales"], sorted by sales.
         """
-        data = self.service.sales_trend()
-        df = DataFrame([
-            {"Day": day, "Sales": sales} for day, sales in data
+        def build() -> DataFrame:
+            data = self.service.sales_trend(start=start, end=end)
+            return DataFrame([
+                {"Day": day, "Sales": sales} for day, sales in data
+            ])
+
+        return self._cached("report_sales_trend", build, (start, end))
+
+    def report_sales_trend_page(self, page: int, page_size: int = 50) -> DataFrame:
+        """Generates one page of the sales trend.
+
+        Only the requested days are read from the ranking, so large stores are not
+        converted into a DataFrame as a whole.
+
+        Args:
+            page (int): 0-based page number.
+            page_size (int, optional): Number of days per page. Defaults to 50.
+
+        Returns:
+            DataFrame: A DataFrame with columns ["Rank", "Day", "Sales"], sorted by sales.
+        """
+        offset = page * page_size
+        data = self.service.trend_page(offset, page_size)
+        return DataFrame([
+            {"Rank": offset + position, "Day": day, "Sales": sales}
+            for position, (day, sales) in enumerate(data, start=1)
         ])
-        return df
 
-    def report_detect_outliers(self) -> DataFrame:
+    def report_top_days(self, n: int) -> DataFrame:
+        """Generates a report of the n best days.
+
+        Args:
+            n (int): Number of days.
+
+        Returns:
+            DataFrame: A DataFrame with columns ["Rank", "Day", "Sales"].
+        """
+        return DataFrame([
+            {"Rank": rank, "Day": day, "Sales": sales}
+            for rank, (day, sales) in enumerate(self.service.top_days(n), start=1)
+        ])
+
+    def report_bottom_days(self, n: int) -> DataFrame:
+        """Generates a report of the n worst days, worst first.
+
+        Args:
+            n (int): Number of days.
+
+        Returns:
+            DataFrame: A DataFrame with columns ["Day", "Sales"].
+        """
+        return DataFrame([
+            {"Day": day, "Sales": sales} for day, sales in self.service.bottom_days(n)
+        ])
+
+    def report_detect_outliers(self, start: date | None = None, end: date | None = None) -> DataFrame:
         """Generates a report listing outlier sales per day.
 
+        Args:
+            start (date | None, optional): First day of the range. Defaults to no lower bound.
+            end (date | None, optional): Last day of the range. Defaults to no upper bound.
+
         Returns:
             DataFrame: A DataFrame with columns ["Day", "Outlier"], where outliers are joined as a string.
         """
-        data = self.service.detect_outliers()
+        def build() -> DataFrame:
+            data = self.service.detect_outliers(start=start, end=end)
+            return DataFrame([
+                {"Day": day, "Outlier": ", ".join(map(str, outlier))} for day, outlier in data.items()
+            ])
+
+        return self._cached("report_detect_outliers", build, (start, end))
+
+    def report_period_sales(self, period: Period) -> DataFrame:
+        """Generates a report of sales rolled up per week, month, quarter or year.
+
+        Args:
+            period (Period): Granularity of the rollup.
+
+        Returns:
+            DataFrame: A DataFrame with columns ["Period", "Total sales", "Avg sales", "Sales count"].
+        """
+        def build() -> DataFrame:
+            data = self.service.period_sales(period)
+            return DataFrame([
+                {"Period": bucket, "Total sales": stats.total, "Avg sales": stats.mean, "Sales count": stats.count}
+                for bucket, stats in data.items()
+            ])
+
+        return self._cached(f"report_period_sales_{period}", build)
+
+    def report_sales_by(
+            self,
+            group_by: Sequence[Dimension],
+            products: Collection[str] | None = None,
+            regions: Collection[RegionDirection] | None = None,
+            start: date | None = None,
+            end: date | None = None,
+    ) -> DataFrame:
+        """Generates a report of sales grouped by day, product and/or region.
+
+        Args:
+            group_by (Sequence[Dimension]): Dimensions to group by, one column each.
+            products (Collection[str] | None, optional): Products to keep. Defaults to all.
+            regions (Collection[RegionDirection] | None, optional): Regions to keep. Defaults to all.
+            start (date | None, optional): First day of the range. Defaults to no lower bound.
+            end (date | None, optional): Last day of the range. Defaults to no upper bound.
+
+        Returns:
+            DataFrame: One column per dimension plus ["Total sales", "Sales count", "Avg sales"].
+        """
+        data = self.service.sales_by(group_by, products=products, regions=regions, start=start, end=end)
+        df = DataFrame([
+            {
+                **{dimension.value.title(): str(value) if isinstance(value, RegionDirection) else value
+                   for dimension, value in zip(group_by, key)},
+                "Total sales": cell.total,
+                "Sales count": cell.count,
+                "Avg sales": cell.mean,
+            }
+            for key, cell in data.items()
+        ])
+        return df
+
+    def report_hourly_profile(self) -> DataFrame:
+        """Generates the typical-day report from the precomputed hourly profile.
+
+        Returns:
+            DataFrame: A DataFrame with columns ["Hour", "Avg sales", "Stdev"].
+        """
+        def build() -> DataFrame:
+            data = self.service.hourly_profile()
+            return DataFrame([
+                {"Hour": hour, "Avg sales": mean, "Stdev": stdev} for hour, (mean, stdev) in data.items()
+            ])
+
+        return self._cached("report_hourly_profile", build)
+
+    def report_peak_hours(self, n: int = 3) -> DataFrame:
+        """Generates a report of the busiest hours of the typical day.
+
+        Args:
+            n (int, optional): Number of hours. Defaults to 3.
+
+        Returns:
+            DataFrame: A DataFrame with columns ["Hour", "Avg sales"].
+        """
+        return DataFrame([
+            {"Hour": hour, "Avg sales": mean} for hour, mean in self.service.peak_hours(n)
+        ])
+
+    def report_hour_anomalies(self, day: date) -> DataFrame:
+        """Generates a report scoring every hour of a day against the typical day.
+
+        Args:
+            day (date): The scored day.
+
+        Returns:
+            DataFrame: A DataFrame with columns ["Hour", "Sales", "Score"].
+        """
+        return DataFrame([
+            {"Hour": hour, "Sales": total, "Score": score}
+            for hour, (total, score) in self.service.hour_anomalies(day).items()
+        ])
+
+    def report_day_sales(self, day: date) -> DataFrame:
+        """Generates a report listing every sale of a single day.
+
+        Rows are read straight from the columnar day without creating HourlySales models.
+
+        Args:
+            day (date): The requested day.
+
+        Returns:
+            DataFrame: A DataFrame with columns ["Hour", "Sales", "Product", "Region"].
+        """
+        sales_day = self.service.get_day(day)
+        rows = sales_day.rows() if sales_day is not None else ()
         df = DataFrame([
-            {"Day": day, "Outlier": ", ".join(map(str, outlier))} for day, outlier in data.items()
+            {"Hour": hour, "Sales": amount, "Product": product, "Region": str(region)}
+            for hour, amount, product, region in rows
         ])
-        return df
\ No newline at end of file
+        return df
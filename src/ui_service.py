@@ -1,6 +1,16 @@
 from src.ui_data_service import UIDataService
+from datetime import date
+from src.model import Period
+from src.cube import Dimension
 import streamlit as st
 
+PERIOD_REPORTS = {
+    "Weekly sales": Period.WEEK,
+    "Monthly sales": Period.MONTH,
+    "Quarterly sales": Period.QUARTER,
+    "Yearly sales": Period.YEAR,
+}
+
 class UiService:
     """UI layer for displaying sales reports using Streamlit."""
 
@@ -24,42 +34,100 @@ class UiService:
             - Avg sales
             - Trend sales
             - Outlier
+            - Weekly, monthly, quarterly and yearly sales
+            - Sales by product and region
+            - Hourly profile with peak hours and hour anomalies of a day
+
+        A date-range picker in the sidebar limits the daily reports to the selected days.
         """
         st.title('_Generate Report Sales_')
         st.sidebar.title('Menu')
         choice = st.sidebar.radio(
-            "Please select a report",["Daily total sales", "Avg sales", "Trend sales", "Outlier"]
+            "Please select a report",["Daily total sales", "Avg sales", "Trend sales", "Outlier", *PERIOD_REPORTS, "Sales by product and region", "Hourly profile"]
         )
 
+        start, end = self._select_date_range()
+
         st.write("Your selected:", choice)
         b_ch = st.checkbox("Bar chart")
         l_ch = st.checkbox("Line chart")
         match choice:
             case "Daily total sales":
-                df = self.ui.report_total_price_per_day()
+                df = self.ui.report_total_price_per_day(start, end)
                 st.dataframe(df.style.highlight_max(axis=0).format(precision=2))
                 if b_ch:
                     st.bar_chart(df.set_index("Day")["Total sales"])
                 if l_ch:
                     st.line_chart(df.set_index("Day")["Total sales"])
             case "Avg sales":
-                df = self.ui.report_calculate_avg_sales()
+                df = self.ui.report_calculate_avg_sales(start, end)
                 st.dataframe(df.style.highlight_max(axis=0).format(precision=2))
                 if b_ch:
                     st.bar_chart(df.set_index("Day")["Avg sales"])
                 if l_ch:
                     st.line_chart(df.set_index("Day")["Avg sales"])
             case "Trend sales":
-                df = self.ui.report_sales_trend()
+                df = self.ui.report_sales_trend(start, end)
                 st.dataframe(df.style.highlight_max(axis=0).format(precision=2))
                 if b_ch:
                     st.bar_chart(df.set_index("Day")["Sales"])
                 if l_ch:
                     st.line_chart(df.set_index("Day")["Sales"])
             case "Outlier":
-                df = self.ui.report_detect_outliers()
+                df = self.ui.report_detect_outliers(start, end)
                 st.dataframe(df.style.highlight_max(axis=0).format(precision=2))
                 if b_ch:
                     st.bar_chart(df.set_index("Day")["Outlier"])
                 if l_ch:
-                    st.line_chart(df.set_index("Day")["Outlier"])
\ No newline at end of file
+                    st.line_chart(df.set_index("Day")["Outlier"])
+            case "Sales by product and region":
+                group_by = st.multiselect(
+                    "Group by", [Dimension.PRODUCT, Dimension.REGION], default=[Dimension.PRODUCT]
+                )
+                df = self.ui.report_sales_by(group_by, start=start, end=end)
+                st.dataframe(df.style.highlight_max(axis=0).format(precision=2))
+                if group_by and (b_ch or l_ch):
+                    chart = df.set_index(df.columns[0])["Total sales"]
+                    if b_ch:
+                        st.bar_chart(chart)
+                    if l_ch:
+                        st.line_chart(chart)
+            case "Hourly profile":
+                df = self.ui.report_hourly_profile()
+                st.dataframe(df.style.highlight_max(axis=0).format(precision=2))
+                if b_ch:
+                    st.bar_chart(df.set_index("Hour")["Avg sales"])
+                if l_ch:
+                    st.line_chart(df.set_index("Hour")["Avg sales"])
+                st.write("Peak hours")
+                st.dataframe(self.ui.report_peak_hours())
+                bounds = self.ui.date_bounds()
+                if bounds is not None:
+                    first, last = start or bounds[0], end or bounds[1]
+                    day = st.date_input("Hour anomalies of", value=last, min_value=first, max_value=last)
+                    st.dataframe(self.ui.report_hour_anomalies(day).style.format(precision=2))
+            case _ if choice in PERIOD_REPORTS:
+                df = self.ui.report_period_sales(PERIOD_REPORTS[choice])
+                st.dataframe(df.style.highlight_max(axis=0).format(precision=2))
+                if b_ch:
+                    st.bar_chart(df.set_index("Period")["Total sales"])
+                if l_ch:
+                    st.line_chart(df.set_index("Period")["Total sales"])
+
+    def _select_date_range(self) -> tuple[date | None, date | None]:
+        """Shows the date-range picker bounded by the first and last loaded day.
+
+        Selecting every loaded day is reported as (None, None), so the reports are served
+        from the memoized unranged results instead of being computed for the range.
+
+        Returns:
+            tuple[date | None, date | None]: Selected first and last day, (None, None) for all days.
+        """
+        bounds = self.ui.date_bounds()
+        if bounds is None:
+            return None, None
+        first, last = bounds
+        selected = st.sidebar.date_input("Date range", value=(first, last), min_value=first, max_value=last)
+        if isinstance(selected, tuple) and len(selected) == 2 and selected != (first, last):
+            return selected[0], selected[1]
+        return None, None
@@ -0,0 +1,67 @@
+from src.io.archive import ArchiveFormat, default_format, export_day, export_store, import_day, import_store, main
+from src.model import SalesDay, HourlySales, RegionDirection
+from datetime import date, time
+from unittest.mock import patch
+from pathlib import Path
+import numpy as np
+import logging
+import pytest
+
+@pytest.fixture
+def sales_day() -> SalesDay:
+    return SalesDay(data={
+        time(9, 0): HourlySales(sales_amount=100.25, product="Widget A", region=RegionDirection.EAST),
+        time(10, 30): HourlySales(sales_amount=50, product="Widget Z", region=RegionDirection.NORTH),
+        time(23, 59): HourlySales(sales_amount=7, product="Widget A", region=RegionDirection.SOUTH),
+    })
+
+@pytest.mark.parametrize("archive_format", list(ArchiveFormat))
+def test_day_round_trip(tmp_path: Path, sales_day: SalesDay, archive_format: ArchiveFormat) -> None:
+    path = tmp_path / f"2025-07-05{archive_format.suffix}"
+    export_day(sales_day, path)
+
+    assert import_day(path) == sales_day
+    assert not list(tmp_path.glob("*.tmp"))
+
+@pytest.mark.parametrize("archive_format", list(ArchiveFormat))
+def test_empty_day_round_trip(tmp_path: Path, archive_format: ArchiveFormat) -> None:
+    path = tmp_path / f"2025-07-05{archive_format.suffix}"
+    export_day(SalesDay(), path)
+    assert len(import_day(path)) == 0
+
+def test_store_round_trip(tmp_path: Path, sales_day: SalesDay) -> None:
+    days = {date(2025, 7, 6): sales_day, date(2025, 7, 5): SalesDay(data={
+        time(8, 0): HourlySales(sales_amount=1, product="Widget B", region=RegionDirection.WEST),
+    })}
+
+    paths = export_store(days, tmp_path / "archive", ArchiveFormat.NPZ)
+
+    assert [path.name for path in paths] == ["2025-07-05.npz", "2025-07-06.npz"]
+    assert import_store(tmp_path / "archive") == days
+
+def test_default_format_prefers_parquet() -> None:
+    pytest.importorskip("pyarrow")
+    assert default_format() is ArchiveFormat.PARQUET
+
+def test_unknown_suffix_and_region(tmp_path: Path, sales_day: SalesDay) -> None:
+    with pytest.raises(ValueError, match="Unknown archive format"):
+        export_day(sales_day, tmp_path / "2025-07-05.csv")
+
+    path = tmp_path / "2025-07-05.npz"
+    np.savez(path, minutes=np.array([0], np.uint16), amounts=np.array([1.0]), products=np.array([0], np.uint32),
+             product_names=np.array(["Widget A"]), regions=np.array([9], np.uint8))
+    with pytest.raises(ValueError, match="Unknown region code"):
+        import_day(path)
+
+def test_main_skips_unreadable_files(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    (tmp_path / "2025-07-01.csv").write_text("hour;sales_amount;product;region\n09:00;10;Widget A;East\n")
+    (tmp_path / "2025-07-02.csv").write_text("minute;sales_amount;product;region\n09:00;10;Widget A;East\n")
+    (tmp_path / "2025-07-03.csv").mkdir()
+    (tmp_path / "notes.csv").write_text("")
+    argv = ["archive", "--dir", str(tmp_path), "--format", "npz", "--before", "2025-08-01"]
+
+    with patch("sys.argv", argv), caplog.at_level(logging.ERROR):
+        main()
+
+    assert [path.name for path in (tmp_path / "archive").iterdir()] == ["2025-07-01.npz"]
+    assert all(name in caplog.text for name in ("2025-07-02.csv", "2025-07-03.csv", "notes.csv"))
@@ -0,0 +1,151 @@
+from src.async_runtime import AsyncEventBridge, AsyncSalesRuntime
+from src.file_watcher import HourlySalesCsvHandler
+from src.model import SalesDay
+from watchdog.events import FileCreatedEvent
+from unittest.mock import patch
+from functools import partial
+from datetime import date
+from pathlib import Path
+import argparse
+import asyncio
+import threading
+
+def runtime_args(tmp_path: Path, quiet_window: float = 0.0) -> argparse.Namespace:
+    return argparse.Namespace(
+        dir=tmp_path, key_name="hour", workers=1, snapshot=False, quiet_window=quiet_window,
+        ingest_workers=2, ingest_queue_size=10, engine="csv", metrics=False, metrics_port=0,
+        profile=False, profile_rate=1.0, verbosity="quiet", archive=False,
+    )
+
+def test_bridge_keeps_tasks_of_a_path_in_order() -> None:
+    ran: list[str] = []
+
+    async def run() -> list[list[str]]:
+        bridge = AsyncEventBridge(asyncio.get_running_loop(), shards=3, maxsize=30)
+        for i, name in enumerate(["a.csv", "b.csv", "a.csv", "c.csv", "a.csv"]):
+            await bridge.put(Path(f"/data/{name}"), partial(ran.append, f"{name}-{i}"))
+        assert bridge.pending == 5
+        shards = []
+        for tasks in bridge.queues:
+            ran.clear()
+            while not tasks.empty():
+                tasks.get_nowait()[1]()
+            shards.append(list(ran))
+        return shards
+
+    shards = asyncio.run(run())
+    assert sum(len(shard) for shard in shards) == 5
+    a_shard = next(shard for shard in shards if "a.csv-0" in shard)
+    assert [task for task in a_shard if task.startswith("a.csv")] == ["a.csv-0", "a.csv-2", "a.csv-4"]
+    assert sum(1 for shard in shards if any(task.startswith("a.csv") for task in shard)) == 1
+
+def test_bridge_blocks_submitting_thread_while_queue_is_full() -> None:
+    async def run() -> None:
+        bridge = AsyncEventBridge(asyncio.get_running_loop(), shards=1, maxsize=1)
+        received: list[int] = []
+
+        def observe() -> None:
+            for i in range(3):
+                bridge.submit(Path(f"/data/{i}.csv"), partial(received.append, i))
+
+        observer = threading.Thread(target=observe)
+        observer.start()
+        await asyncio.sleep(0.05)
+        assert observer.is_alive()
+        assert bridge.pending == 1
+
+        while len(received) < 3:
+            (await bridge.queues[0].get())[1]()
+        await asyncio.to_thread(observer.join)
+        assert received == [0, 1, 2]
+
+    asyncio.run(run())
+
+def test_async_runtime_ingests_events_and_reports(tmp_path: Path) -> None:
+    (tmp_path / "2025-07-05.csv").write_text("hour;sales_amount;product;region\n09:00;100;Widget A;North\n", "utf-8")
+
+    async def run() -> tuple[dict, dict]:
+        runtime = await AsyncSalesRuntime.create(runtime_args(tmp_path))
+        await runtime.start()
+        try:
+            (tmp_path / "2025-07-06.csv").write_text("hour;sales_amount;product;region\n10:00;50;Widget B;East\n", "utf-8")
+            for _ in range(100):
+                if len(runtime.service.total_price_per_day()) == 2:
+                    break
+                await asyncio.sleep(0.05)
+            report = await runtime.generate_report()
+        finally:
+            await runtime.stop()
+        return report, runtime.service.total_price_per_day()
+
+    report, totals = asyncio.run(run())
+
+    assert totals == {date(2025, 7, 5): 100, date(2025, 7, 6): 50}
+    assert report["daily_totals"] == totals
+
+def test_async_runtime_parses_settled_files_on_the_executor(tmp_path: Path) -> None:
+    threads: list[str] = []
+    parse = HourlySalesCsvHandler._parse
+
+    def recording_parse(handler: HourlySalesCsvHandler, path: Path) -> tuple[SalesDay, int]:
+        threads.append(threading.current_thread().name)
+        return parse(handler, path)
+
+    async def run() -> dict[date, float]:
+        runtime = await AsyncSalesRuntime.create(runtime_args(tmp_path, quiet_window=0.1))
+        assert runtime.runtime.handler.coalescer is not None
+        await runtime.start()
+        try:
+            for day in range(1, 9):
+                (tmp_path / f"2025-07-0{day}.csv").write_text(
+                    f"hour;sales_amount;product;region\n09:00;{day};Widget A;North\n", "utf-8"
+                )
+            for _ in range(100):
+                if len(runtime.service.total_price_per_day()) == 8:
+                    break
+                await asyncio.sleep(0.05)
+        finally:
+            await runtime.stop()
+        return runtime.service.total_price_per_day()
+
+    with patch.object(HourlySalesCsvHandler, "_parse", autospec=True, side_effect=recording_parse):
+        totals = asyncio.run(run())
+
+    assert totals == {date(2025, 7, day): day for day in range(1, 9)}
+    assert threads and all(name.startswith("async-ingestion") for name in threads)
+
+def test_async_runtime_stop_parses_coalesced_files_of_queued_events(tmp_path: Path) -> None:
+    async def run() -> dict[date, float]:
+        args = runtime_args(tmp_path, quiet_window=60)
+        args.ingest_workers, args.ingest_queue_size = 1, 100
+        runtime = await AsyncSalesRuntime.create(args)
+        await runtime.start()
+        release = threading.Event()
+
+        def busy_worker() -> None:
+            release.wait()
+
+        await runtime.bridge.put(tmp_path, busy_worker)
+        for day in range(1, 6):
+            file_path = tmp_path / f"2025-07-0{day}.csv"
+            file_path.write_text(f"hour;sales_amount;product;region\n09:00;{day};Widget A;North\n", "utf-8")
+            await asyncio.to_thread(runtime.runtime.handler.on_created, FileCreatedEvent(str(file_path)))
+        asyncio.get_running_loop().call_later(0.1, release.set)
+        await runtime.stop()
+        return runtime.service.total_price_per_day()
+
+    assert asyncio.run(run()) == {date(2025, 7, day): day for day in range(1, 6)}
+
+def test_async_runtime_stop_cancels_idle_consumers(tmp_path: Path) -> None:
+    async def run() -> AsyncSalesRuntime:
+        runtime = await AsyncSalesRuntime.create(runtime_args(tmp_path))
+        await runtime.start()
+        await runtime.stop()
+        return runtime
+
+    runtime = asyncio.run(run())
+
+    assert len(runtime._consumers) == 2
+    assert all(consumer.cancelled() for consumer in runtime._consumers)
+    assert not runtime.runtime.observer.is_alive()
+    assert runtime.runtime.handler.ingestion is None
@@ -0,0 +1,53 @@
+from benchmarks.data_generator import generate_archive, generate_day
+from benchmarks.run_benchmarks import compare, parse_scale, peak_alloc_mb, percentile, run_scale
+from src.report_cache import Reports
+from unittest.mock import patch
+from _pytest.capture import CaptureFixture
+from pathlib import Path
+import random
+import json
+import pytest
+
+def test_generate_archive(tmp_path: Path) -> None:
+    total = generate_archive(tmp_path, days=3, rows=10)
+
+    files = sorted(tmp_path.glob("*.csv"))
+    assert total == 30
+    assert [file.name for file in files] == ["2020-01-01.csv", "2020-01-02.csv", "2020-01-03.csv"]
+    lines = files[0].read_text().splitlines()
+    assert lines[0] == "hour;sales_amount;product;region"
+    assert len(lines) == 11
+
+def test_generate_day_rejects_too_many_rows(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        generate_day(tmp_path / "day.csv", 24 * 60 + 1, random.Random(0))
+
+def test_parse_scale_and_percentile() -> None:
+    assert parse_scale("365x96") == (365, 96)
+    assert percentile([], 0.5) == 0
+    assert percentile([3, 1, 2, 4], 0.5) == 2
+    assert percentile(list(range(1, 101)), 0.99) == 99
+
+def test_run_scale_and_compare(tmp_path: Path, capsys: CaptureFixture[str]) -> None:
+    results = run_scale("2x5", repeat=2)
+    names = {result["name"] for result in results}
+    assert {"csv_reader_read", "handler_initialize_from_directory", "generate_report"} <= names
+    assert all(result["p99_ms"] >= result["p50_ms"] for result in results)
+
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps({"results": results}))
+    compare(results, baseline)
+    assert "+0.0%" in capsys.readouterr().out
+
+def test_peak_alloc_is_measured_per_call() -> None:
+    assert peak_alloc_mb(lambda: bytearray(32 * 1024 * 1024)) >= 32
+    assert peak_alloc_mb(lambda: bytearray(1024)) < 1
+
+def test_report_benchmarks_do_not_time_cache_hits() -> None:
+    with patch.object(Reports, "build", wraps=Reports.build) as build:
+        results = run_scale("2x5", repeat=3)
+    names = [result["name"] for result in results]
+    assert "generate_report_cached" in names
+    # generate_report and the four UI reports build on every timed and traced call;
+    # the cached benchmark builds once.
+    assert build.call_count == 5 * (3 + 1) + 1
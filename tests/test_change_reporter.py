@@ -0,0 +1,60 @@
+from src.change_reporter import ChangeReporter, DayChange, Verbosity, render_change
+from src.model import SalesDay, HourlySales, RegionDirection
+from src.index import DayStats
+from datetime import date, time
+import threading
+
+def stats_of(*sales: tuple[time, float]) -> DayStats:
+    return DayStats.from_sales_day(SalesDay(data={
+        at: HourlySales(sales_amount=amount, product="Widget A", region=RegionDirection.EAST) for at, amount in sales
+    }))
+
+def test_render_change_summary() -> None:
+    before = stats_of((time(9, 0), 100))
+    after = stats_of((time(9, 0), 100), (time(10, 0), 50))
+
+    assert render_change(DayChange(date(2025, 7, 5), None, before), Verbosity.SUMMARY) == [
+        "2025-07-05 created: 1 rows (+1), total 100.00 (+100.00)"
+    ]
+    assert render_change(DayChange(date(2025, 7, 5), before, after), Verbosity.SUMMARY) == [
+        "2025-07-05 updated: 2 rows (+1), total 150.00 (+50.00)"
+    ]
+    assert render_change(DayChange(date(2025, 7, 5), after, None), Verbosity.SUMMARY) == [
+        "2025-07-05 removed: 0 rows (-2), total 0.00 (-150.00)"
+    ]
+    assert render_change(DayChange(date(2025, 7, 5), before, after), Verbosity.QUIET) == []
+
+def test_render_change_detail_lists_changed_hours() -> None:
+    before = stats_of((time(9, 0), 100), (time(11, 0), 20))
+    after = stats_of((time(9, 0), 100), (time(10, 0), 50))
+
+    assert render_change(DayChange(date(2025, 7, 5), before, after), Verbosity.DETAIL) == [
+        "2025-07-05 updated: 2 rows (+0), total 150.00 (+30.00)",
+        "  10:00 +1 rows, +50.00",
+        "  11:00 -1 rows, -20.00",
+    ]
+
+def test_reporter_prints_in_order_on_its_own_thread() -> None:
+    lines: list[str] = []
+    threads: set[str] = set()
+
+    def write(line: str) -> None:
+        threads.add(threading.current_thread().name)
+        lines.append(line)
+
+    reporter = ChangeReporter(write=write)
+    reporter.loaded(2, 10)
+    reporter.report(DayChange(date(2025, 7, 5), None, stats_of((time(9, 0), 100))))
+    reporter.stop()
+
+    assert lines == ["Loaded 2 days with 10 rows", "2025-07-05 created: 1 rows (+1), total 100.00 (+100.00)"]
+    assert threads == {"change-reporter"}
+
+def test_quiet_reporter_prints_nothing() -> None:
+    lines: list[str] = []
+    reporter = ChangeReporter(Verbosity.QUIET, write=lines.append)
+    reporter.loaded(1, 1)
+    reporter.report(DayChange(date(2025, 7, 5), None, stats_of((time(9, 0), 100))))
+    reporter.stop()
+
+    assert lines == []
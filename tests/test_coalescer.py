@@ -0,0 +1,51 @@
+from src.coalescer import EventCoalescer
+from unittest.mock import MagicMock
+from pathlib import Path
+from time import sleep
+import threading
+import pytest
+
+def test_coalescer_fires_once_per_settled_burst(tmp_path: Path) -> None:
+    file_path = tmp_path / "2025-07-05.csv"
+    file_path.write_text("hour", "utf-8")
+    fired = threading.Event()
+    callback = MagicMock(side_effect=lambda _: fired.set())
+    coalescer = EventCoalescer(callback, quiet_window=0.05)
+
+    for _ in range(20):
+        coalescer.submit(file_path)
+
+    assert fired.wait(timeout=2)
+    coalescer.stop()
+    callback.assert_called_once_with(file_path)
+
+def test_coalescer_waits_until_file_stops_changing(tmp_path: Path) -> None:
+    file_path = tmp_path / "2025-07-05.csv"
+    file_path.write_text("hour", "utf-8")
+    fired = threading.Event()
+    coalescer = EventCoalescer(lambda _: fired.set(), quiet_window=0.1)
+
+    coalescer.submit(file_path)
+    sleep(0.05)
+    file_path.write_text("hour;sales_amount", "utf-8")
+
+    assert not fired.wait(timeout=0.08)
+    assert fired.wait(timeout=2)
+    coalescer.stop()
+
+def test_coalescer_discard_and_flush(tmp_path: Path) -> None:
+    callback = MagicMock()
+    coalescer = EventCoalescer(callback, quiet_window=60)
+    coalescer.submit(tmp_path / "a.csv")
+    coalescer.submit(tmp_path / "b.csv")
+    coalescer.discard(tmp_path / "a.csv")
+    assert coalescer.pending == 1
+
+    coalescer.stop()
+    callback.assert_called_once_with(tmp_path / "b.csv")
+
+def test_coalescer_logs_callback_errors(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    coalescer = EventCoalescer(MagicMock(side_effect=RuntimeError("boom")), quiet_window=60)
+    coalescer.submit(tmp_path / "a.csv")
+    coalescer.stop()
+    assert "boom" in caplog.text
@@ -11,6 +11,22 @@ def test_parse_arguments_default(monkeypatch: MonkeyPatch) -> None:
     assert args.dir == Path("./data")
     assert args.logfile == "sales.log"
     assert args.key_name == "hour"
+    assert args.workers == 1
+    assert args.snapshot is True
+    assert args.quiet_window == 0.5
+    assert args.ingest_workers == 2
+    assert args.ingest_queue_size == 1000
+    assert args.engine == "csv"
+    assert args.metrics is False
+    assert args.metrics_port == 0
+    assert args.profile is False
+    assert args.profile_rate == 1.0
+    assert args.verbosity == "summary"
+    assert args.archive is True
+
+def test_parse_arguments_workers(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(sys, "argv", ["program", "--workers", "4"])
+    assert parse_arguments().workers == 4
 
 def test_setup_logging(tmp_path: Path) -> None:
     log_file = tmp_path / "logs" / "sales.log"
@@ -28,3 +44,23 @@ def test_setup_logging(tmp_path: Path) -> None:
     assert "Test message" in content
 
 
+
+def test_parse_arguments_no_snapshot(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(sys, "argv", ["program", "--no-snapshot"])
+    assert parse_arguments().snapshot is False
+
+def test_parse_arguments_metrics(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(sys, "argv", ["program", "--metrics", "--metrics-port", "9100"])
+    args = parse_arguments()
+    assert args.metrics is True
+    assert args.metrics_port == 9100
+
+def test_parse_arguments_profile(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(sys, "argv", ["program", "--profile", "--profile-rate", "0.05"])
+    args = parse_arguments()
+    assert args.profile is True
+    assert args.profile_rate == 0.05
+
+def test_parse_arguments_verbosity(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(sys, "argv", ["program", "--verbosity", "detail"])
+    assert parse_arguments().verbosity == "detail"
@@ -0,0 +1,44 @@
+from src.cube import CubeCell, DayCube, Dimension, slice_cube
+from src.model import SalesDay, HourlySales, RegionDirection
+from datetime import date, time
+import pytest
+
+@pytest.fixture
+def sales_day() -> SalesDay:
+    return SalesDay(data={
+        time(9, 0): HourlySales(sales_amount=100, product="Widget A", region=RegionDirection.EAST),
+        time(10, 0): HourlySales(sales_amount=150, product="Widget B", region=RegionDirection.NORTH),
+        time(11, 0): HourlySales(sales_amount=50, product="Widget A", region=RegionDirection.EAST),
+        time(12, 0): HourlySales(sales_amount=20, product="Widget A", region=RegionDirection.WEST),
+    })
+
+def test_day_cube_aggregates_cells(sales_day: SalesDay) -> None:
+    cube = DayCube.from_sales_day(sales_day)
+    cells = {(product, region): (count, total) for product, region, count, total in cube.cells()}
+    assert len(cube) == 3
+    assert sorted(cells.values()) == [(1, 20), (1, 150), (2, 150)]
+    assert len(DayCube.from_sales_day(SalesDay())) == 0
+
+def test_slice_cube_groups_and_filters(sales_day: SalesDay) -> None:
+    cubes = [(date(2025, 7, 5), DayCube.from_sales_day(sales_day)), (date(2025, 7, 6), DayCube.from_sales_day(sales_day))]
+
+    assert slice_cube(cubes) == {(): CubeCell(8, 640)}
+    assert slice_cube(cubes, [Dimension.PRODUCT]) == {("Widget A",): CubeCell(6, 340), ("Widget B",): CubeCell(2, 300)}
+    assert slice_cube(cubes, [Dimension.REGION, Dimension.DAY], products=["Widget A"], regions=[RegionDirection.EAST]) == {
+        (RegionDirection.EAST, date(2025, 7, 5)): CubeCell(2, 150),
+        (RegionDirection.EAST, date(2025, 7, 6)): CubeCell(2, 150),
+    }
+    assert slice_cube(cubes, [Dimension.PRODUCT], products=["Unknown"]) == {}
+
+def test_cube_cell_mean() -> None:
+    assert CubeCell(4, 100).mean == 25
+    assert CubeCell().mean == 0
+
+def test_day_cube_combined_matches_cube_of_whole_day(sales_day: SalesDay) -> None:
+    combined = DayCube.from_sales_day(sales_day.tail(0)).combined(DayCube())
+    assert list(combined.cells()) == list(DayCube.from_sales_day(sales_day).cells())
+
+    combined = DayCube.from_sales_day(SalesDay.from_columns(
+        sales_day.minutes[:2], sales_day.amounts[:2], sales_day.products[:2], sales_day.regions[:2]
+    )).combined(DayCube.from_sales_day(sales_day.tail(2)))
+    assert list(combined.cells()) == list(DayCube.from_sales_day(sales_day).cells())
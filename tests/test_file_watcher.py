@@ -1,12 +1,20 @@
-from src.model import HourlySales, SalesStore, SalesDay, RegionDirection
+from src.model import HourlySales, Period, SalesStore, SalesDay, RegionDirection
 from src.file_watcher import CsvHandler, HourlySalesCsvHandler
 from watchdog.events import FileSystemEvent
-from src.parser import CsvModelParser
-from unittest.mock import MagicMock
-from datetime import time, date
+from src.parser import CsvModelParser, HourlySalesCsvParser
+from src.io.reader import CsvReader
+from src.io.pandas_reader import PandasCsvReader
+from src.snapshot import StoreSnapshot, SalesDayCodec
+from src.change_reporter import ChangeReporter
+from src.io.archive import export_store
+from src.store import VersionedStore
+from unittest.mock import MagicMock, patch
+from concurrent.futures import ProcessPoolExecutor
+from datetime import time, date, timedelta
 from pydantic import BaseModel
 from typing import Callable
 from pathlib import Path
+import threading
 import logging
 import pytest
 
@@ -362,3 +370,326 @@ def test_initialize_from_directory_logs_error_when_path_missing(
     )
 
     assert "Watch path nonexistent does not exist"
+
+def test_hourly_sales_csv_handler_keeps_index_in_sync(tmp_path: Path, dummy_sales_store: SalesStore) -> None:
+    csv_content = "hour;sales_amount;product;region\n09:00;100;Widget A;North\n10:00;50;Widget B;East\n"
+    file_path = tmp_path / "2025-07-05.csv"
+    file_path.write_text(csv_content, "utf-8")
+    parser = HourlySalesCsvParser(reader=CsvReader[time](), key_name="hour")
+
+    handler = HourlySalesCsvHandler(store=dummy_sales_store, parser=parser, watch_path=tmp_path)
+    assert handler.index.days[date(2025, 7, 5)].total == 150
+    assert handler.version == 1
+
+    file_path.write_text(csv_content + "11:00;25;Widget C;West\n", "utf-8")
+    handler.on_modified(make_fs_event(file_path))
+    assert handler.index.days[date(2025, 7, 5)].total == 175
+    assert handler.version == 2
+
+    handler.on_deleted(make_fs_event(file_path))
+    assert date(2025, 7, 5) not in handler.index.days
+
+def test_initialize_from_directory_in_parallel(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.INFO)
+    for day in range(1, 6):
+        (tmp_path / f"2025-07-0{day}.csv").write_text(
+            f"hour;sales_amount;product;region\n09:00;{day * 10};Widget A;North\n", "utf-8"
+        )
+    (tmp_path / "2025-07-09.csv").write_text("hour;sales_amount;product;region\n09:00;-1;Widget A;North\n", "utf-8")
+    (tmp_path / "broken.csv").write_text("hour;sales_amount;product;region\n", "utf-8")
+    store = SalesStore(days={})
+    parser = HourlySalesCsvParser(reader=CsvReader[time](), key_name="hour")
+
+    with patch("src.file_watcher.os.cpu_count", return_value=4), \
+            patch("src.file_watcher.ProcessPoolExecutor", wraps=ProcessPoolExecutor) as pool:
+        handler = HourlySalesCsvHandler(store=store, parser=parser, watch_path=tmp_path, workers=3)
+
+    assert pool.call_args.kwargs["max_workers"] == 3
+    assert sorted(store.days) == [date(2025, 7, day) for day in range(1, 6)]
+    assert handler.index.days[date(2025, 7, 3)].total == 30
+    assert "Parsed 2025-07-03.csv with 1 entries" in caplog.text
+    assert "Error in file 2025-07-09.csv while initializing" in caplog.text
+    assert "Error in file broken.csv while initializing" in caplog.text
+    assert "rows/s" in caplog.text
+
+def test_initialize_in_parallel_serves_snapshot_hits_in_this_process(tmp_path: Path) -> None:
+    (tmp_path / "2025-07-05.csv").write_text("hour;sales_amount;product;region\n09:00;100;Widget A;North\n", "utf-8")
+    snapshot_path = tmp_path / "cache" / "store.snapshot"
+    parser = HourlySalesCsvParser(reader=CsvReader[time](), key_name="hour")
+    HourlySalesCsvHandler(
+        store=SalesStore(days={}), parser=parser, watch_path=tmp_path, snapshot=StoreSnapshot[SalesDay](snapshot_path, SalesDayCodec())
+    )
+
+    store = SalesStore(days={})
+    with patch("src.file_watcher.os.cpu_count", return_value=4), patch("src.file_watcher.ProcessPoolExecutor") as pool:
+        HourlySalesCsvHandler(
+            store=store, parser=parser, watch_path=tmp_path, workers=4,
+            snapshot=StoreSnapshot[SalesDay](snapshot_path, SalesDayCodec()),
+        )
+
+    pool.assert_not_called()
+    assert store.days[date(2025, 7, 5)].data[time(9, 0)].sales_amount == 100
+
+def test_initialize_in_parallel_loads_serially_without_picklable_parser(
+        dummy_store: dict[str, DummyModel],
+        dummy_parser: MagicMock,
+        key_func: Callable[[Path], str],
+        value_func: Callable[[dict[str, DummyModel]], DummyModel],
+        tmp_path: Path,
+        caplog: pytest.LogCaptureFixture,
+) -> None:
+    (tmp_path / "a.csv").write_text("value\n1\n", "utf-8")
+
+    with patch("src.file_watcher.os.cpu_count", return_value=4), patch("src.file_watcher.ProcessPoolExecutor") as pool:
+        CsvHandler(dummy_store, dummy_parser, key_func, value_func, tmp_path, workers=2)
+
+    pool.assert_not_called()
+    assert dummy_store == {"a": DummyModel(value=1)}
+    assert "loading them serially" in caplog.text
+
+def test_initialize_with_one_cpu_loads_serially(tmp_path: Path) -> None:
+    (tmp_path / "2025-07-05.csv").write_text("hour;sales_amount;product;region\n09:00;100;Widget A;North\n", "utf-8")
+    parser = HourlySalesCsvParser(reader=CsvReader[time](), key_name="hour")
+    store = SalesStore(days={})
+
+    with patch("src.file_watcher.os.cpu_count", return_value=1), patch("src.file_watcher.ProcessPoolExecutor") as pool:
+        HourlySalesCsvHandler(store=store, parser=parser, watch_path=tmp_path, workers=4)
+
+    pool.assert_not_called()
+    assert date(2025, 7, 5) in store.days
+
+def test_initialize_from_directory_reuses_snapshot(tmp_path: Path) -> None:
+    (tmp_path / "2025-07-05.csv").write_text("hour;sales_amount;product;region\n09:00;100;Widget A;North\n", "utf-8")
+    snapshot_path = tmp_path / "cache" / "store.snapshot"
+    parser = HourlySalesCsvParser(reader=CsvReader[time](), key_name="hour")
+    HourlySalesCsvHandler(
+        store=SalesStore(days={}), parser=parser, watch_path=tmp_path, snapshot=StoreSnapshot[SalesDay](snapshot_path, SalesDayCodec())
+    )
+    assert snapshot_path.exists()
+
+    mock_parser: MagicMock = MagicMock(spec=HourlySalesCsvParser)
+    store = SalesStore(days={})
+    handler = HourlySalesCsvHandler(
+        store=store, parser=mock_parser, watch_path=tmp_path, snapshot=StoreSnapshot[SalesDay](snapshot_path, SalesDayCodec())
+    )
+
+    mock_parser.parse_iter.assert_not_called()
+    assert store.days[date(2025, 7, 5)].data[time(9, 0)].sales_amount == 100
+    assert handler.index.days[date(2025, 7, 5)].total == 100
+
+def test_coalesced_events_parse_file_once(tmp_path: Path) -> None:
+    file_path = tmp_path / "2025-07-05.csv"
+    parser = HourlySalesCsvParser(reader=CsvReader[time](), key_name="hour")
+    store = SalesStore(days={})
+    handler = HourlySalesCsvHandler(store=store, parser=parser, watch_path=tmp_path, quiet_window=60)
+    parser_spy = MagicMock(wraps=parser.parse_iter)
+    handler.parser.parse_iter = parser_spy  # type: ignore[method-assign]
+
+    file_path.write_text("hour;sales_amount;product;region\n09:00;100;Widget A;North\n", "utf-8")
+    handler.on_created(make_fs_event(file_path))
+    for _ in range(5):
+        handler.on_modified(make_fs_event(file_path))
+    assert store.days == {}
+
+    handler.close()
+    parser_spy.assert_called_once_with(file_path)
+    assert handler.index.days[date(2025, 7, 5)].total == 100
+
+def test_coalesced_event_dropped_after_delete(tmp_path: Path) -> None:
+    file_path = tmp_path / "2025-07-05.csv"
+    file_path.write_text("hour;sales_amount;product;region\n09:00;100;Widget A;North\n", "utf-8")
+    parser = HourlySalesCsvParser(reader=CsvReader[time](), key_name="hour")
+    store = SalesStore(days={})
+    handler = HourlySalesCsvHandler(store=store, parser=parser, watch_path=tmp_path, quiet_window=60)
+
+    handler.on_modified(make_fs_event(file_path))
+    file_path.unlink()
+    handler.on_deleted(make_fs_event(file_path))
+    handler.close()
+
+    assert store.days == {}
+
+def test_events_are_ingested_on_worker_threads(tmp_path: Path) -> None:
+    parser = HourlySalesCsvParser(reader=CsvReader[time](), key_name="hour")
+    store = SalesStore(days={})
+    handler = HourlySalesCsvHandler(store=store, parser=parser, watch_path=tmp_path, ingest_workers=2)
+
+    for day in range(1, 10):
+        file_path = tmp_path / f"2025-07-0{day}.csv"
+        file_path.write_text(f"hour;sales_amount;product;region\n09:00;{day};Widget A;North\n", "utf-8")
+        handler.on_created(make_fs_event(file_path))
+    handler.on_deleted(make_fs_event(tmp_path / "2025-07-01.csv"))
+    handler.close()
+
+    assert len(store.days) == 8
+    assert handler.version == 10
+    assert handler.ingestion is not None
+    assert handler.ingestion.stats().processed == 10
+
+def test_close_parses_events_queued_behind_a_busy_worker(tmp_path: Path) -> None:
+    parser = HourlySalesCsvParser(reader=CsvReader[time](), key_name="hour")
+    store = SalesStore(days={})
+    handler = HourlySalesCsvHandler(
+        store=store, parser=parser, watch_path=tmp_path, quiet_window=60, ingest_workers=1
+    )
+    assert handler.ingestion is not None
+    release = threading.Event()
+
+    def busy_worker() -> None:
+        release.wait()
+
+    handler.ingestion.submit(tmp_path, busy_worker)
+
+    for day in range(1, 6):
+        file_path = tmp_path / f"2025-07-0{day}.csv"
+        file_path.write_text(f"hour;sales_amount;product;region\n09:00;{day};Widget A;North\n", "utf-8")
+        handler.on_created(make_fs_event(file_path))
+    threading.Timer(0.1, release.set).start()
+    handler.close()
+
+    assert {day: stats.total for day, stats in handler.index.days.items()} == {
+        date(2025, 7, day): day for day in range(1, 6)
+    }
+
+def test_snapshot_is_consistent_and_immutable(tmp_path: Path) -> None:
+    file_path = tmp_path / "2025-07-05.csv"
+    file_path.write_text("hour;sales_amount;product;region\n09:00;100;Widget A;North\n", "utf-8")
+    parser = HourlySalesCsvParser(reader=CsvReader[time](), key_name="hour")
+    handler = HourlySalesCsvHandler(store=SalesStore(days={}), parser=parser, watch_path=tmp_path)
+
+    snapshot = handler.snapshot()
+    handler.on_deleted(make_fs_event(file_path))
+
+    assert snapshot.version == 1
+    assert list(snapshot.days) == list(snapshot.stats) == [date(2025, 7, 5)]
+    assert handler.snapshot().days == {}
+
+def test_hourly_handler_uses_day_reader(tmp_path: Path) -> None:
+    (tmp_path / "2025-07-05.csv").write_text("hour;sales_amount;product;region\n09:00;100;Widget A;North\n", "utf-8")
+    mock_parser: MagicMock = MagicMock(spec=HourlySalesCsvParser)
+    store = SalesStore(days={})
+
+    HourlySalesCsvHandler(
+        store=store, parser=mock_parser, watch_path=tmp_path, day_reader=PandasCsvReader[time]()
+    )
+
+    mock_parser.parse_iter.assert_not_called()
+    assert store.days[date(2025, 7, 5)].data[time(9, 0)].sales_amount == 100
+
+def test_changes_since(
+        dummy_store: dict[str, DummyModel],
+        dummy_parser: MagicMock,
+        key_func: Callable[[Path], str],
+        value_func: Callable[[dict[str, DummyModel]], DummyModel],
+        tmp_path: Path,
+) -> None:
+    handler = CsvHandler(dummy_store, dummy_parser, key_func, value_func, tmp_path, change_log_size=2)
+    assert handler.changes_since(0) == set()
+
+    handler._set("a", DummyModel(value=1))
+    handler._set("b", DummyModel(value=2))
+    handler._remove("a")
+
+    assert handler.changes_since(3) == set()
+    assert handler.changes_since(1) == {"a", "b"}
+    assert handler.changes_since(0) is None
+    assert handler.changes_since(4) is None
+
+def test_hourly_sales_csv_handler_reports_day_deltas(tmp_path: Path, dummy_sales_store: SalesStore) -> None:
+    file_path = tmp_path / "2025-07-05.csv"
+    file_path.write_text("hour;sales_amount;product;region\n09:00;100;Widget A;North\n", "utf-8")
+    parser = HourlySalesCsvParser(reader=CsvReader[time](), key_name="hour")
+    lines: list[str] = []
+
+    handler = HourlySalesCsvHandler(
+        store=dummy_sales_store, parser=parser, watch_path=tmp_path, reporter=ChangeReporter(write=lines.append)
+    )
+    file_path.write_text("hour;sales_amount;product;region\n09:00;100;Widget A;North\n10:00;25;Widget C;West\n", "utf-8")
+    handler.on_modified(make_fs_event(file_path))
+    handler.on_deleted(make_fs_event(file_path))
+    handler.close()
+
+    assert lines == [
+        "Loaded 1 days with 1 rows",
+        "2025-07-05 updated: 2 rows (+1), total 125.00 (+25.00)",
+        "2025-07-05 removed: 0 rows (-2), total 0.00 (-125.00)",
+    ]
+
+def test_appended_rows_are_parsed_without_the_prefix(tmp_path: Path, dummy_sales_store: SalesStore) -> None:
+    header = "hour;sales_amount;product;region\n"
+    file_path = tmp_path / "2025-07-05.csv"
+    file_path.write_text(header + "09:00;100;Widget A;North\n", "utf-8")
+    parser = HourlySalesCsvParser(reader=CsvReader[time](), key_name="hour")
+    handler = HourlySalesCsvHandler(store=dummy_sales_store, parser=parser, watch_path=tmp_path)
+    handler.on_modified(make_fs_event(file_path))
+    parser_spy = MagicMock(wraps=parser.parse_iter)
+    handler.parser.parse_iter = parser_spy  # type: ignore[method-assign]
+
+    with file_path.open("a", encoding="utf-8") as file:
+        file.write("10:00;50;Widget B;East\n11:00;30;Wid")
+    handler.on_modified(make_fs_event(file_path))
+    with file_path.open("a", encoding="utf-8") as file:
+        file.write("get C;West\n")
+    handler.on_modified(make_fs_event(file_path))
+
+    parser_spy.assert_not_called()
+    stats = handler.index.days[date(2025, 7, 5)]
+    assert (stats.count, stats.total) == (3, 180)
+    assert stats.outliers == (100,)
+    assert dummy_sales_store.days[date(2025, 7, 5)] == SalesDay.from_rows(
+        parser.parse_lines(["09:00;100;Widget A;North", "10:00;50;Widget B;East", "11:00;30;Widget C;West"],
+                           ["hour", "sales_amount", "product", "region"], "expected")
+    )
+
+    file_path.write_text(header + "09:00;10;Widget A;North\n", "utf-8")
+    handler.on_modified(make_fs_event(file_path))
+    parser_spy.assert_called_once_with(file_path)
+    assert handler.index.days[date(2025, 7, 5)].total == 10
+
+def test_appended_row_repeating_a_time_parses_file_in_full(tmp_path: Path, dummy_sales_store: SalesStore) -> None:
+    file_path = tmp_path / "2025-07-05.csv"
+    file_path.write_text("hour;sales_amount;product;region\n09:00;100;Widget A;North\n", "utf-8")
+    parser = HourlySalesCsvParser(reader=CsvReader[time](), key_name="hour")
+    handler = HourlySalesCsvHandler(store=dummy_sales_store, parser=parser, watch_path=tmp_path)
+    handler.on_modified(make_fs_event(file_path))
+
+    with file_path.open("a", encoding="utf-8") as file:
+        file.write("09:00;40;Widget B;East\n")
+    handler.on_modified(make_fs_event(file_path))
+
+    stats = handler.index.days[date(2025, 7, 5)]
+    assert (stats.count, stats.total) == (1, 40)
+
+def test_archived_days_are_loaded_without_parsing(tmp_path: Path, dummy_sales_store: SalesStore) -> None:
+    archived = SalesDay(data={time(8, 0): HourlySales(sales_amount=40, product="Widget A", region=RegionDirection.WEST)})
+    export_store({date(2025, 7, 4): archived, date(2025, 7, 5): archived}, tmp_path / "archive")
+    (tmp_path / "2025-07-05.csv").write_text("hour;sales_amount;product;region\n09:00;100;Widget A;North\n", "utf-8")
+    parser = HourlySalesCsvParser(reader=CsvReader[time](), key_name="hour")
+
+    handler = HourlySalesCsvHandler(store=dummy_sales_store, parser=parser, watch_path=tmp_path, archive=tmp_path / "archive")
+
+    assert dummy_sales_store.days[date(2025, 7, 4)] == archived
+    assert handler.index.days[date(2025, 7, 4)].total == 40
+    assert handler.index.days[date(2025, 7, 5)].total == 100
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_initialize_from_directory_publishes_large_archive_once(tmp_path: Path, workers: int) -> None:
+    first = date(2020, 1, 1)
+    for offset in range(1500):
+        (tmp_path / f"{first + timedelta(days=offset)}.csv").write_text(
+            f"hour;sales_amount;product;region\n09:00;{offset + 1};Widget A;North\n", "utf-8"
+        )
+    parser = HourlySalesCsvParser(reader=CsvReader[time](), key_name="hour")
+    store = SalesStore(days={})
+
+    with patch.object(VersionedStore, "__setitem__", autospec=True) as setitem, \
+            patch("src.file_watcher.os.cpu_count", return_value=4):
+        handler = HourlySalesCsvHandler(store=store, parser=parser, watch_path=tmp_path, workers=workers)
+
+    setitem.assert_not_called()
+    assert handler.version == 1
+    assert isinstance(store.days, VersionedStore) and store.days.version == 1
+    assert len(handler.index.days) == len(handler.index.dates) == 1500
+    assert handler.index.ranking.top(1) == [(first + timedelta(days=1499), 1500)]
+    assert sum(stats.count for stats in handler.index.rollups[Period.YEAR].values()) == 1500
+    assert handler.changes_since(0) == set(store.days)
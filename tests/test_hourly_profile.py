@@ -0,0 +1,57 @@
+from src.hourly_profile import DayHours, HourlyProfile, HOURS
+from src.model import SalesDay, HourlySales, RegionDirection
+from collections.abc import Mapping
+from datetime import time
+import numpy as np
+import pytest
+
+def hours_of(totals: Mapping[int, float]) -> DayHours:
+    values = np.zeros(HOURS)
+    counts = np.zeros(HOURS, dtype=np.int64)
+    for hour, total in totals.items():
+        values[hour] = total
+        counts[hour] = 1
+    return DayHours(values, counts)
+
+def test_day_hours_from_sales_day() -> None:
+    sales_day = SalesDay(data={
+        time(9, 0): HourlySales(sales_amount=100, product="Widget A", region=RegionDirection.EAST),
+        time(9, 30): HourlySales(sales_amount=50, product="Widget B", region=RegionDirection.NORTH),
+        time(23, 59): HourlySales(sales_amount=20, product="Widget A", region=RegionDirection.WEST),
+    })
+    hours = DayHours.from_sales_day(sales_day)
+    assert hours.totals[9] == 150 and hours.totals[23] == 20 and hours.totals.sum() == 170
+    assert hours.counts[9] == 2 and hours.counts.sum() == 3
+
+def test_profile_mean_stdev_and_peaks() -> None:
+    profile = HourlyProfile()
+    for totals in [{9: 100, 12: 10}, {9: 200, 12: 30}, {9: 300}]:
+        profile = profile.updated(None, hours_of(totals))
+
+    assert profile.days == 3
+    assert profile.mean[9] == pytest.approx(200)
+    assert profile.stdev[9] == pytest.approx(100)
+    assert profile.mean[0] == 0 and profile.stdev[0] == 0
+    assert profile.counts[12] == 2
+    assert profile.peak_hours(2) == [(9, pytest.approx(200)), (12, pytest.approx(40 / 3))]
+
+def test_profile_remove_and_replace_day() -> None:
+    first, second = hours_of({9: 100}), hours_of({9: 300})
+    profile = HourlyProfile().updated(None, first).updated(None, second)
+    replaced = profile.updated(second, hours_of({9: 200}))
+    assert replaced.mean[9] == pytest.approx(150)
+    assert replaced.stdev[9] == pytest.approx(np.std([100, 200], ddof=1))
+
+    removed = replaced.updated(first, None)
+    assert removed.days == 1 and removed.mean[9] == pytest.approx(200) and removed.m2[9] == pytest.approx(0)
+    empty = removed.updated(hours_of({9: 200}), None)
+    assert empty.days == 0 and empty.peak_hours(3) == []
+    assert profile.days == 2
+
+def test_profile_anomaly_scores() -> None:
+    profile = HourlyProfile()
+    for total in [100, 200, 300]:
+        profile = profile.updated(None, hours_of({9: total}))
+    scores = profile.anomaly_scores(hours_of({9: 400, 10: 50}))
+    assert scores[9] == pytest.approx(2)
+    assert scores[10] == 0
@@ -0,0 +1,203 @@
+from src.model import SalesDay, HourlySales, Period, RegionDirection
+from src.index import DayStats, SalesIndex, SortedDays, TotalsRanking
+from datetime import date, time
+from statistics import stdev
+import pytest
+
+@pytest.fixture
+def sales_day() -> SalesDay:
+    return SalesDay(data={
+        time(9, 0): HourlySales(sales_amount=100, product="Widget A", region=RegionDirection.EAST),
+        time(10, 0): HourlySales(sales_amount=150, product="Widget B", region=RegionDirection.NORTH),
+        time(11, 0): HourlySales(sales_amount=500, product="Widget A", region=RegionDirection.WEST),
+    })
+
+def test_day_stats_from_amounts() -> None:
+    stats = DayStats.from_amounts([100, 150, 500])
+    assert stats.count == 3
+    assert stats.total == 750
+    assert stats.min == 100
+    assert stats.max == 500
+    assert stats.mean == 250
+    assert stats.stdev == pytest.approx(stdev([100, 150, 500]))
+
+def test_day_stats_empty_and_single() -> None:
+    assert DayStats().mean == 0
+    assert DayStats.from_amounts([42]).stdev == 0
+
+def test_sales_index_apply_and_remove(sales_day: SalesDay) -> None:
+    index = SalesIndex()
+    index.apply(date(2025, 7, 5), sales_day)
+    assert index.days[date(2025, 7, 5)].total == 750
+
+    index.apply(date(2025, 7, 5), None)
+    assert date(2025, 7, 5) not in index.days
+
+def test_sales_index_skips_empty_day() -> None:
+    index = SalesIndex.from_store({date(2025, 7, 5): SalesDay(data={})})
+    assert index.days == {}
+
+def test_day_stats_welford_is_stable_for_large_amounts() -> None:
+    amounts = [1e9 + 4, 1e9 + 7, 1e9 + 13, 1e9 + 16]
+    stats = DayStats.from_amounts(amounts)
+    assert stats.mean == pytest.approx(1e9 + 10)
+    assert stats.variance == pytest.approx(30)
+
+def test_day_stats_outliers(sales_day: SalesDay) -> None:
+    stats = DayStats.from_sales_day(sales_day)
+    assert stats.outlier_threshold == pytest.approx(250 + stdev([100, 150, 500]))
+    assert stats.outliers == (500,)
+
+def test_day_stats_single_row_has_no_outliers() -> None:
+    single = SalesDay(data={time(9, 0): HourlySales(sales_amount=100, product="Widget A", region=RegionDirection.EAST)})
+    stats = DayStats.from_sales_day(single)
+    assert stats.stdev == 0
+    assert stats.outliers == ()
+
+def test_sales_index_keeps_unchanged_days(sales_day: SalesDay) -> None:
+    index = SalesIndex.from_store({date(2025, 7, 5): sales_day, date(2025, 7, 6): sales_day})
+    unchanged = index.days[date(2025, 7, 6)]
+    index.apply(date(2025, 7, 5), None)
+    assert index.days[date(2025, 7, 6)] is unchanged
+
+def test_totals_ranking_queries() -> None:
+    ranking = TotalsRanking()
+    for day, total in [(1, 10.0), (2, 30.0), (3, 10.0), (4, 20.0)]:
+        ranking = ranking.updated(date(2025, 7, day), total)
+
+    assert list(ranking) == [(date(2025, 7, 2), 30), (date(2025, 7, 4), 20), (date(2025, 7, 1), 10), (date(2025, 7, 3), 10)]
+    assert ranking.top(2) == [(date(2025, 7, 2), 30), (date(2025, 7, 4), 20)]
+    assert ranking.bottom(2) == [(date(2025, 7, 3), 10), (date(2025, 7, 1), 10)]
+    assert ranking.page(1, 2) == [(date(2025, 7, 4), 20), (date(2025, 7, 1), 10)]
+    assert ranking.page(10, 2) == []
+    assert ranking.rank(date(2025, 7, 4)) == 2
+    assert ranking.rank(date(2025, 7, 9)) is None
+    assert ranking.percentile(0) == 10
+    assert ranking.percentile(0.5) == 10
+    assert ranking.percentile(0.75) == 20
+    assert ranking.percentile(1) == 30
+
+def test_totals_ranking_updates_are_copy_on_write() -> None:
+    ranking = TotalsRanking().updated(date(2025, 7, 1), 10).updated(date(2025, 7, 2), 20)
+    changed = ranking.updated(date(2025, 7, 2), 5).updated(date(2025, 7, 1), None)
+
+    assert list(ranking) == [(date(2025, 7, 2), 20), (date(2025, 7, 1), 10)]
+    assert list(changed) == [(date(2025, 7, 2), 5)]
+    assert len(changed) == 1
+    assert TotalsRanking().percentile(0.5) == 0
+    with pytest.raises(ValueError):
+        ranking.percentile(1.5)
+
+def test_sales_index_keeps_ranking_in_sync(sales_day: SalesDay) -> None:
+    index = SalesIndex.from_store({date(2025, 7, 5): sales_day})
+    assert index.ranking.top(1) == [(date(2025, 7, 5), 750)]
+    index.apply(date(2025, 7, 5), None)
+    assert len(index.ranking) == 0
+
+def test_sorted_days_between() -> None:
+    days = SortedDays()
+    for day in [5, 1, 9, 3]:
+        days = days.updated(date(2025, 7, day), True)
+    assert days.updated(date(2025, 7, 5), True) is days
+
+    assert list(days) == [date(2025, 7, day) for day in [1, 3, 5, 9]]
+    assert days.between(date(2025, 7, 2), date(2025, 7, 5)) == [date(2025, 7, 3), date(2025, 7, 5)]
+    assert days.between(end=date(2025, 7, 3)) == [date(2025, 7, 1), date(2025, 7, 3)]
+    assert days.between(start=date(2025, 7, 10)) == []
+    assert (days.first, days.last) == (date(2025, 7, 1), date(2025, 7, 9))
+
+    removed = days.updated(date(2025, 7, 1), False)
+    assert len(removed) == 3 and len(days) == 4
+    assert SortedDays().first is None
+
+def test_day_stats_merge() -> None:
+    parts = [DayStats.from_amounts([100, 150]), DayStats(), DayStats.from_amounts([500, 20, 7])]
+    merged = DayStats.merge(parts)
+    expected = DayStats.from_amounts([100, 150, 500, 20, 7])
+    assert (merged.count, merged.total, merged.min, merged.max) == (5, 777, 7, 500)
+    assert merged.mean == pytest.approx(expected.mean)
+    assert merged.variance == pytest.approx(expected.variance)
+
+def test_sales_index_rollups(sales_day: SalesDay) -> None:
+    days = [date(2025, 6, 30), date(2025, 7, 1), date(2025, 9, 30), date(2025, 10, 1)]
+    index = SalesIndex.from_store({day: sales_day for day in days})
+
+    assert {bucket: stats.total for bucket, stats in index.rollups[Period.WEEK].items()} == {
+        date(2025, 6, 30): 1500, date(2025, 9, 29): 1500
+    }
+    assert index.rollups[Period.MONTH][date(2025, 7, 1)].total == 750
+    assert index.rollups[Period.QUARTER][date(2025, 7, 1)].total == 1500
+    assert index.rollups[Period.YEAR][date(2025, 1, 1)].count == 12
+
+    index.apply(date(2025, 7, 1), None)
+    assert date(2025, 7, 1) not in index.rollups[Period.MONTH]
+    assert index.rollups[Period.WEEK][date(2025, 6, 30)].total == 750
+    assert index.rollups[Period.YEAR][date(2025, 1, 1)].total == 2250
+    assert index.rollup_views()[Period.QUARTER][date(2025, 7, 1)].total == 750
+
+def test_sales_index_keeps_hourly_profile_in_sync(sales_day: SalesDay) -> None:
+    index = SalesIndex.from_store({date(2025, 7, 5): sales_day, date(2025, 7, 6): sales_day})
+    assert index.profile.days == 2
+    assert index.profile.mean[11] == 500
+
+    index.apply(date(2025, 7, 6), SalesDay(data={time(11, 0): HourlySales(sales_amount=100, product="Widget A", region=RegionDirection.WEST)}))
+    assert index.profile.days == 2
+    assert index.profile.mean[11] == 300
+    assert index.profile.mean[9] == 50
+
+    index.apply(date(2025, 7, 5), None)
+    assert index.profile.days == 1
+    assert index.profile.mean[11] == 100
+
+def test_sales_index_append_matches_full_recompute(sales_day: SalesDay) -> None:
+    head = SalesDay.from_columns(sales_day.minutes[:1], sales_day.amounts[:1], sales_day.products[:1], sales_day.regions[:1])
+    index = SalesIndex()
+    index.apply(date(2025, 7, 5), head)
+    index.append(date(2025, 7, 5), sales_day, 1)
+    expected = SalesIndex.from_store({date(2025, 7, 5): sales_day})
+
+    stats, full = index.days[date(2025, 7, 5)], expected.days[date(2025, 7, 5)]
+    assert (stats.count, stats.total, stats.min, stats.max) == (full.count, full.total, full.min, full.max)
+    assert stats.mean == pytest.approx(full.mean) and stats.m2 == pytest.approx(full.m2)
+    assert stats.outliers == full.outliers == (500,)
+    assert stats.hours is not None and full.hours is not None
+    assert list(stats.hours.totals) == list(full.hours.totals)
+    assert index.ranking.top(1) == [(date(2025, 7, 5), 750)]
+    assert index.rollups[Period.MONTH][date(2025, 7, 1)].total == 750
+
+def test_sales_index_append_recomputes_unknown_prefix(sales_day: SalesDay) -> None:
+    index = SalesIndex()
+    index.append(date(2025, 7, 5), sales_day, 2)
+    assert index.days[date(2025, 7, 5)].total == 750
+
+def test_sales_index_apply_many_matches_applying_days_one_by_one(sales_day: SalesDay) -> None:
+    small = SalesDay(data={time(9, 0): HourlySales(sales_amount=40, product="Widget C", region=RegionDirection.SOUTH)})
+    days = {date(2025, 3, 31): sales_day, date(2025, 4, 2): small, date(2025, 1, 15): sales_day, date(2025, 4, 3): small}
+    expected = SalesIndex()
+    for day, value in days.items():
+        expected.apply(day, value)
+
+    index = SalesIndex()
+    index.apply_many(days)
+
+    assert {day: stats.total for day, stats in index.days.items()} == {day: stats.total for day, stats in expected.days.items()}
+    assert list(index.ranking) == list(expected.ranking)
+    assert list(index.dates) == list(expected.dates)
+    for period in Period:
+        assert {bucket: (stats.count, stats.total) for bucket, stats in index.rollups[period].items()} == {
+            bucket: (stats.count, stats.total) for bucket, stats in expected.rollups[period].items()
+        }
+    assert list(index.profile.mean) == pytest.approx(list(expected.profile.mean))
+    assert list(index.profile.m2) == pytest.approx(list(expected.profile.m2))
+
+    index.apply_many({date(2025, 4, 2): None, date(2025, 1, 15): small})
+    assert list(index.dates) == [date(2025, 1, 15), date(2025, 3, 31), date(2025, 4, 3)]
+    assert index.ranking.top(1) == [(date(2025, 3, 31), 750)]
+    assert index.rollups[Period.QUARTER][date(2025, 1, 1)].total == 790
+    assert index.profile.days == 3
+
+def test_totals_ranking_from_totals_keeps_insertion_order_for_ties() -> None:
+    ranking = TotalsRanking.from_totals([(date(2025, 7, 2), 10), (date(2025, 7, 1), 20), (date(2025, 7, 3), 10)])
+
+    assert list(ranking) == [(date(2025, 7, 1), 20), (date(2025, 7, 2), 10), (date(2025, 7, 3), 10)]
+    assert ranking.updated(date(2025, 7, 4), 10).bottom(1) == [(date(2025, 7, 4), 10)]
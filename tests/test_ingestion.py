@@ -0,0 +1,52 @@
+from functools import partial
+from src.ingestion import IngestionQueue
+from pathlib import Path
+import threading
+import pytest
+
+def test_ingestion_queue_runs_tasks_in_order_per_key() -> None:
+    ingestion = IngestionQueue(workers=3, maxsize=100)
+    seen: dict[str, list[int]] = {"a": [], "b": []}
+
+    def record(key: str, i: int) -> None:
+        seen[key].append(i)
+
+    for i in range(50):
+        for key in seen:
+            ingestion.submit(key, partial(record, key, i))
+    ingestion.stop()
+
+    assert seen["a"] == list(range(50))
+    assert seen["b"] == list(range(50))
+    stats = ingestion.stats()
+    assert stats.submitted == stats.processed == 100
+    assert stats.depth == stats.in_flight == 0
+
+def test_ingestion_queue_reports_backpressure_and_failures(caplog: pytest.LogCaptureFixture) -> None:
+    ingestion = IngestionQueue(workers=1, maxsize=1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow() -> None:
+        started.set()
+        release.wait()
+
+    def fail() -> None:
+        raise RuntimeError("boom")
+
+    ingestion.submit(Path("a.csv"), slow)
+    started.wait()
+    ingestion.submit(Path("a.csv"), fail)
+    assert ingestion.stats().in_flight == 1
+    assert ingestion.stats().depth == 1
+
+    threading.Timer(0.05, release.set).start()
+    ingestion.submit(Path("a.csv"), lambda: None)
+    ingestion.join()
+    ingestion.stop()
+
+    stats = ingestion.stats()
+    assert stats.blocked == 1
+    assert stats.blocked_seconds > 0
+    assert stats.failed == 1
+    assert "boom" in caplog.text
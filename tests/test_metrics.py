@@ -0,0 +1,76 @@
+from src.metrics import Histogram, MetricsExporter, MetricsRegistry
+from pathlib import Path
+from urllib.request import urlopen
+import socket
+import json
+import pytest
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    registry = MetricsRegistry()
+    registry.enabled = True
+    return registry
+
+def test_disabled_registry_records_nothing() -> None:
+    registry = MetricsRegistry()
+    registry.increment("events_total")
+    registry.observe("parse_seconds", 1)
+    registry.set_gauge("depth", 3)
+    with registry.timer("parse_seconds"):
+        pass
+    assert registry.to_dict() == {"counters": [], "gauges": [], "histograms": []}
+
+def test_counters_gauges_and_timers(registry: MetricsRegistry) -> None:
+    registry.increment("events_total", event="created")
+    registry.increment("events_total", 2, event="created")
+    registry.increment("events_total", event="deleted")
+    registry.set_gauge("depth", 3)
+    with registry.timer("parse_seconds"):
+        pass
+
+    data = registry.to_dict()
+    assert {(c["labels"]["event"], c["value"]) for c in data["counters"]} == {("created", 3), ("deleted", 1)}
+    assert data["gauges"] == [{"name": "depth", "labels": {}, "value": 3}]
+    assert data["histograms"][0]["count"] == 1
+
+    registry.reset()
+    assert registry.to_dict()["counters"] == []
+
+def test_histogram_buckets() -> None:
+    histogram = Histogram(buckets=(1.0, 5.0))
+    for value in [0.5, 1.0, 3, 10]:
+        histogram.observe(value)
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.count == 4
+    assert histogram.total == 14.5
+
+def test_render_prometheus(registry: MetricsRegistry) -> None:
+    registry.increment("events_total", event="created")
+    registry.observe("parse_seconds", 0.002)
+    text = registry.render_prometheus()
+
+    assert "# TYPE events_total counter" in text
+    assert 'events_total{event="created"} 1' in text
+    assert 'parse_seconds_bucket{le="0.005"} 1' in text
+    assert 'parse_seconds_bucket{le="+Inf"} 1' in text
+    assert "parse_seconds_count 1" in text
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def test_exporter_dumps_json_and_serves_metrics(registry: MetricsRegistry, tmp_path: Path) -> None:
+    collected = []
+    port = free_port()
+    exporter = MetricsExporter(registry, tmp_path / "logs" / "metrics.json", 60, port, collect=lambda: collected.append(1))
+    registry.increment("events_total")
+    exporter.start()
+    try:
+        with urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            assert "events_total 1" in response.read().decode("utf-8")
+    finally:
+        exporter.stop()
+
+    assert json.loads((tmp_path / "logs" / "metrics.json").read_text("utf-8"))["counters"][0]["value"] == 1
+    assert len(collected) == 2
@@ -0,0 +1,98 @@
+from src.io.mmap_reader import MmapCsvReader
+from src.parser import HourlySalesCsvParser
+from src.io.reader import CsvReader
+from src.model import SalesDay
+from datetime import time
+from unittest.mock import MagicMock, patch
+from pathlib import Path
+import numpy as np
+import pytest
+
+HEADER = "hour;sales_amount;product;region\n"
+
+def write_csv(tmp_path: Path, body: str, header: str = HEADER) -> Path:
+    file_path = tmp_path / "2025-07-05.csv"
+    file_path.write_text(header + body, "utf-8")
+    return file_path
+
+def parse_with_csv_engine(path: Path) -> SalesDay:
+    parser = HourlySalesCsvParser(reader=CsvReader[time](), key_name="hour")
+    return SalesDay.from_rows(parser.parse_iter(path))
+
+def spied_reader() -> tuple[MmapCsvReader, MagicMock]:
+    reader = MmapCsvReader()
+    spy = MagicMock(wraps=reader._read_rows)
+    reader._read_rows = spy  # type: ignore[method-assign]
+    return reader, spy
+
+@pytest.mark.parametrize("body", [
+    "09:00;100;Widget A;North\n10:30;50.5;Widget B;East\n09:00;70;Widget C;South\n8:05;1e2;Widget A;West\n",
+    "09:00;100;Widget A;North\r\n\r\n23:59;0.5;;East",
+])
+def test_read_day_matches_csv_engine_without_fallback(tmp_path: Path, body: str) -> None:
+    file_path = write_csv(tmp_path, body)
+    reader, fallback = spied_reader()
+
+    assert reader.read_day(file_path) == parse_with_csv_engine(file_path)
+    fallback.assert_not_called()
+
+def test_read_day_columns_in_any_order(tmp_path: Path) -> None:
+    file_path = write_csv(tmp_path, "North;Widget A;09:00;100;x\n", header="region;product;hour;sales_amount;note\n")
+    assert list(MmapCsvReader().read_day(file_path).rows()) == [(time(9, 0), 100.0, "Widget A", "North")]
+
+def test_read_day_empty_files(tmp_path: Path) -> None:
+    assert len(MmapCsvReader().read_day(write_csv(tmp_path, ""))) == 0
+    empty = tmp_path / "empty.csv"
+    empty.write_text("", "utf-8")
+    assert len(MmapCsvReader().read_day(empty)) == 0
+
+def test_read_day_falls_back_for_quoted_fields(tmp_path: Path) -> None:
+    file_path = write_csv(tmp_path, '09:00;100;"Widget; A";North\n9:5;10;Widget B;East\n')
+    reader, fallback = spied_reader()
+
+    assert reader.read_day(file_path) == parse_with_csv_engine(file_path)
+    fallback.assert_called_once_with(file_path)
+
+@pytest.mark.parametrize("body", [
+    "09:00;0;Widget A;North\n",
+    "09:00;abc;Widget A;North\n",
+    "09:00;10;Widget A;Middle\n",
+    "09:00;10;Widget A\n",
+    "24:00;10;Widget A;North\n",
+    "09:00;10;Widget A;North\n10:00;-3;Widget B;East\n",
+])
+def test_read_day_reports_same_errors(tmp_path: Path, body: str) -> None:
+    file_path = write_csv(tmp_path, body)
+
+    with pytest.raises(ValueError) as expected:
+        parse_with_csv_engine(file_path)
+    with pytest.raises(ValueError) as actual:
+        MmapCsvReader().read_day(file_path)
+
+    assert str(actual.value) == str(expected.value)
+
+@pytest.mark.parametrize("header", [
+    "hour;sales\ramount;product;region\n",
+    "\rhour;sales_amount;product;region\n",
+])
+def test_read_day_carriage_return_in_header_matches_csv_engine(tmp_path: Path, header: str) -> None:
+    file_path = write_csv(tmp_path, "09:00;100;Widget A;North\n", header=header)
+    reader, fallback = spied_reader()
+
+    with pytest.raises((ValueError, KeyError)) as expected:
+        parse_with_csv_engine(file_path)
+    with pytest.raises(expected.type) as actual:
+        reader.read_day(file_path)
+
+    assert str(actual.value) == str(expected.value)
+    fallback.assert_called_once_with(file_path)
+
+def test_read_day_scan_errors_are_not_masked_by_the_map(tmp_path: Path) -> None:
+    file_path = write_csv(tmp_path, "09:00;100;Widget A;North\n")
+
+    def failing_amounts(self: MmapCsvReader, buffer: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> None:
+        raise RuntimeError("scan failed")
+
+    with patch.object(MmapCsvReader, "_amounts", failing_amounts):
+        with pytest.raises(RuntimeError, match="scan failed"):
+            MmapCsvReader().read_day(file_path)
@@ -1,4 +1,6 @@
-from src.model import HourlySales, RegionDirection
+from src.model import HourlySales, Period, RegionDirection, SalesDay, SalesStore, PRODUCTS
+from datetime import date, time
+from array import array
 from pydantic import ValidationError
 import pytest
 
@@ -22,3 +24,72 @@ def test_hourly_sales_invalid_sales_amount(sales_amount: float) -> None:
             region=RegionDirection.EAST
         )
 
+
+def test_sales_day_columnar_round_trip() -> None:
+    data = {
+        time(9, 30): HourlySales(sales_amount=100, product="Widget A", region=RegionDirection.EAST),
+        time(10, 0): HourlySales(sales_amount=50.5, product="Widget B", region=RegionDirection.NORTH),
+    }
+    sales_day = SalesDay(data=data)
+
+    assert len(sales_day) == 2
+    assert list(sales_day.minutes) == [570, 600]
+    assert list(sales_day.amounts) == [100, 50.5]
+    assert sales_day.data == data
+
+def test_sales_day_interns_products() -> None:
+    sales_day = SalesDay(data={
+        time(9, 0): HourlySales(sales_amount=1, product="Widget A", region=RegionDirection.EAST),
+        time(10, 0): HourlySales(sales_amount=2, product="Widget A", region=RegionDirection.WEST),
+    })
+
+    assert sales_day.products[0] == sales_day.products[1]
+    assert PRODUCTS.decode(sales_day.products[0]) == "Widget A"
+    assert list(sales_day.rows())[1] == (time(10, 0), 2, "Widget A", RegionDirection.WEST)
+
+def test_sales_day_from_columns_length_mismatch() -> None:
+    with pytest.raises(ValueError):
+        SalesDay.from_columns(array("H", [1]), array("d"), array("I"), array("B"))
+
+def test_sales_store_accepts_columnar_days() -> None:
+    store = SalesStore(days={date(2025, 7, 5): SalesDay()})
+    assert len(store.days[date(2025, 7, 5)]) == 0
+
+def test_sales_day_from_rows_replaces_repeated_time() -> None:
+    sales_day = SalesDay.from_rows([
+        (time(9, 0), HourlySales(sales_amount=1, product="Widget A", region=RegionDirection.EAST)),
+        (time(10, 0), HourlySales(sales_amount=2, product="Widget B", region=RegionDirection.WEST)),
+        (time(9, 0), HourlySales(sales_amount=3, product="Widget C", region=RegionDirection.NORTH)),
+    ])
+
+    assert list(sales_day.minutes) == [540, 600]
+    assert list(sales_day.amounts) == [3, 2]
+    assert sales_day.data[time(9, 0)].product == "Widget C"
+
+@pytest.mark.parametrize("period, day, bucket, following", [
+    (Period.WEEK, date(2025, 7, 6), date(2025, 6, 30), date(2025, 7, 7)),
+    (Period.MONTH, date(2025, 12, 31), date(2025, 12, 1), date(2026, 1, 1)),
+    (Period.QUARTER, date(2025, 11, 15), date(2025, 10, 1), date(2026, 1, 1)),
+    (Period.QUARTER, date(2025, 5, 15), date(2025, 4, 1), date(2025, 7, 1)),
+    (Period.YEAR, date(2025, 7, 6), date(2025, 1, 1), date(2026, 1, 1)),
+])
+def test_period_bucket_and_next(period: Period, day: date, bucket: date, following: date) -> None:
+    assert period.bucket(day) == bucket
+    assert period.next(bucket) == following
+
+def test_product_dictionary_lookup_does_not_intern() -> None:
+    size = len(PRODUCTS)
+    assert PRODUCTS.lookup("Never Sold Product") is None
+    assert len(PRODUCTS) == size
+    assert PRODUCTS.lookup(PRODUCTS.decode(PRODUCTS.encode("Widget A"))) == PRODUCTS.encode("Widget A")
+
+def test_sales_day_tail_and_extended() -> None:
+    sales_day = SalesDay(data={
+        time(9, 0): HourlySales(sales_amount=100, product="Widget A", region=RegionDirection.EAST),
+        time(10, 0): HourlySales(sales_amount=50, product="Widget B", region=RegionDirection.WEST),
+    })
+    head = SalesDay(data={time(9, 0): HourlySales(sales_amount=100, product="Widget A", region=RegionDirection.EAST)})
+
+    assert sales_day.tail(1).data == {time(10, 0): HourlySales(sales_amount=50, product="Widget B", region=RegionDirection.WEST)}
+    assert head.extended(sales_day.tail(1)) == sales_day
+    assert len(head) == 1
@@ -0,0 +1,120 @@
+from src.io.pandas_reader import PandasCsvReader
+from src.parser import HourlySalesCsvParser
+from src.io.reader import CsvReader
+from src.model import SalesDay
+from datetime import time
+from typing import Callable
+from unittest.mock import MagicMock
+from pathlib import Path
+import pytest
+
+HEADER = "hour;sales_amount;product;region\n"
+
+def write_csv(tmp_path: Path, body: str) -> Path:
+    file_path = tmp_path / "2025-07-05.csv"
+    file_path.write_text(HEADER + body, "utf-8")
+    return file_path
+
+def parse_with_csv_engine(path: Path) -> SalesDay:
+    parser = HourlySalesCsvParser(reader=CsvReader[time](), key_name="hour")
+    return SalesDay(data=parser.parse(path))
+
+def stream_with_csv_engine(path: Path) -> SalesDay:
+    parser = HourlySalesCsvParser(reader=CsvReader[time](), key_name="hour")
+    return SalesDay.from_rows(parser.parse_iter(path))
+
+def outcome(read: Callable[[Path], SalesDay], path: Path) -> tuple[str, object]:
+    try:
+        return "loaded", read(path)
+    except Exception as e:
+        return type(e).__name__, str(e)
+
+def spied_reader() -> tuple[PandasCsvReader[time], MagicMock]:
+    reader = PandasCsvReader[time]()
+    spy = MagicMock(wraps=reader._read_rows)
+    reader._read_rows = spy  # type: ignore[method-assign]
+    return reader, spy
+
+def test_read_day_matches_csv_engine(tmp_path: Path) -> None:
+    file_path = write_csv(tmp_path, "09:00;100;Widget A;North\n10:30;50.5;Widget B;East\n09:00;70;Widget C;South\n8:05;1;Widget A;West\n")
+
+    sales_day = PandasCsvReader[time]().read_day(file_path)
+
+    assert sales_day == parse_with_csv_engine(file_path)
+    assert list(sales_day.minutes) == [540, 630, 485]
+
+def test_read_day_empty_files(tmp_path: Path) -> None:
+    assert len(PandasCsvReader[time]().read_day(write_csv(tmp_path, ""))) == 0
+    empty = tmp_path / "empty.csv"
+    empty.write_text("", "utf-8")
+    assert len(PandasCsvReader[time]().read_day(empty)) == 0
+
+@pytest.mark.parametrize("body", [
+    "09:00;0;Widget A;North\n",
+    "09:00;abc;Widget A;North\n",
+    "09:00;10;Widget A;Middle\n",
+    "09:00;10;Widget A;North\n10:00;-3;Widget B;East\n",
+])
+def test_read_day_reports_same_row_errors(tmp_path: Path, body: str) -> None:
+    file_path = write_csv(tmp_path, body)
+
+    with pytest.raises(ValueError) as expected:
+        parse_with_csv_engine(file_path)
+    with pytest.raises(ValueError) as actual:
+        PandasCsvReader[time]().read_day(file_path)
+
+    assert str(actual.value) == str(expected.value)
+
+@pytest.mark.parametrize("hour", ["9.00", "24:00", "xx"])
+def test_read_day_reports_same_hour_errors(tmp_path: Path, hour: str) -> None:
+    file_path = write_csv(tmp_path, f"{hour};10;Widget A;North\n")
+
+    with pytest.raises(ValueError) as expected:
+        parse_with_csv_engine(file_path)
+    with pytest.raises(ValueError) as actual:
+        PandasCsvReader[time]().read_day(file_path)
+
+    assert str(actual.value) == str(expected.value)
+
+def test_read_day_missing_key_column(tmp_path: Path) -> None:
+    file_path = tmp_path / "2025-07-05.csv"
+    file_path.write_text("time;sales_amount\n09:00;1\n", "utf-8")
+    with pytest.raises(KeyError):
+        PandasCsvReader[time]().read_day(file_path)
+
+def test_read_returns_raw_rows(tmp_path: Path) -> None:
+    file_path = write_csv(tmp_path, "09:00;100;Widget A;North\n")
+    rows = PandasCsvReader[str]().read(file_path, lambda row: row["hour"])
+    assert rows == {"09:00": {"hour": "09:00", "sales_amount": "100", "product": "Widget A", "region": "North"}}
+
+@pytest.mark.parametrize("content", [
+    HEADER + "09:00;abc;Widget A;North\n99:99;10;Widget B;East\n",
+    HEADER + "09:00;10;Widget A;North\n99:99;abc;Widget B;East\n",
+    HEADER + "09:00;10;Widget A\n",
+    "hour;region;sales_amount;product\n09:00;North;10\n",
+    HEADER + "09:00;10;;North\n",
+    HEADER + "09:00;1_000;Widget A;North\n",
+    HEADER + "09:00; 100 ;Widget A;North\n",
+    HEADER + "9:5;10;Widget A;North\n",
+    HEADER + "09:00;10;Widget A;North;x\n10:00;5;Widget B;East;y\n",
+    HEADER + "09:00;10;Widget A;North\n10:00;5;Widget B;East;y\n",
+    "hour;sales_amount;hour;region\n09:00;10;Widget A;North\n",
+    "\ufeff" + HEADER + "09:00;10;Widget A;North\n",
+    "region;\ufeffhour;sales_amount;product\nNorth;09:00;10;Widget A\n",
+    "time;sales_amount;product;region\n09:00;10;Widget A;North\n",
+    "\n" + HEADER + "09:00;10;Widget A;North\n",
+    "\r\n" + HEADER + "09:00;10;Widget A;North\n",
+    HEADER + "\n09:00;10;Widget A;North\n\n10:00;5;Widget B;East\n",
+])
+def test_read_day_matches_csv_engine_on_malformed_files(tmp_path: Path, content: str) -> None:
+    file_path = tmp_path / "2025-07-05.csv"
+    file_path.write_text(content, "utf-8")
+
+    assert outcome(PandasCsvReader[time]().read_day, file_path) == outcome(stream_with_csv_engine, file_path)
+
+def test_read_day_valid_file_does_not_fall_back(tmp_path: Path) -> None:
+    file_path = write_csv(tmp_path, "09:00;100;Widget A;North\n10:30;50.5;Widget B;East\n9:05;1e2;Widget C;South\n")
+    reader, fallback = spied_reader()
+
+    assert reader.read_day(file_path) == stream_with_csv_engine(file_path)
+    fallback.assert_not_called()
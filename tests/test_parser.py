@@ -1,10 +1,11 @@
 from src.parser import CsvModelParser, HourlySalesCsvParser
 from unittest.mock import MagicMock
 from src.io.reader import CsvReader
-from src.model import HourlySales
+from src.model import HourlySales, RegionDirection
 from pydantic import BaseModel
 from datetime import time
 from pathlib import Path
+import pickle
 import pytest
 
 class DummyParser(BaseModel):
@@ -71,3 +72,35 @@ def test_hourly_sales_csv_parser_success(mock_hourly_sales_reader: CsvReader[tim
     assert sales.sales_amount == 100
     assert sales.product == "Widget A"
     assert sales.region == "East"
+
+def test_hourly_sales_csv_parser_can_be_pickled(tmp_path: Path) -> None:
+    file_path = tmp_path / "2025-07-05.csv"
+    file_path.write_text("time;sales_amount;product;region\n09:00;100;Widget A;North\n", "utf-8")
+    parser = pickle.loads(pickle.dumps(HourlySalesCsvParser(reader=CsvReader[time](), key_name="time")))
+
+    assert list(parser.parse(file_path)) == [time(9, 0)]
+
+def test_parse_iter_streams_models(tmp_path: Path) -> None:
+    file_path = tmp_path / "2025-07-05.csv"
+    file_path.write_text("hour;sales_amount;product;region\n09:00;100;Widget A;North\n10:00;50;Widget B;East\n")
+    parser = HourlySalesCsvParser(reader=CsvReader[time](), key_name="hour")
+
+    rows = list(parser.parse_iter(file_path))
+    assert [key for key, _ in rows] == [time(9, 0), time(10, 0)]
+    assert rows[1][1].sales_amount == 50
+
+def test_parse_iter_fail(tmp_path: Path) -> None:
+    file_path = tmp_path / "2025-07-05.csv"
+    file_path.write_text("hour;sales_amount;product;region\n09:00;-5;Widget A;North\n")
+    parser = HourlySalesCsvParser(reader=CsvReader[time](), key_name="hour")
+
+    with pytest.raises(ValueError) as e:
+        list(parser.parse_iter(file_path))
+    assert "2025-07-05.csv" in str(e.value)
+
+def test_parse_lines_validates_appended_lines() -> None:
+    parser = HourlySalesCsvParser(reader=CsvReader[time](), key_name="hour")
+    rows = list(parser.parse_lines(["10:00;50;Widget B;East"], ["hour", "sales_amount", "product", "region"], "2025-07-05.csv"))
+    assert rows == [(time(10, 0), HourlySales(sales_amount=50, product="Widget B", region=RegionDirection.EAST))]
+    with pytest.raises(ValueError, match="2025-07-05.csv"):
+        list(parser.parse_lines(["10:00;-5;Widget B;East"], ["hour", "sales_amount", "product", "region"], "2025-07-05.csv"))
@@ -0,0 +1,47 @@
+from src.profiling import Profiler
+from pathlib import Path
+import tracemalloc
+import pstats
+import pytest
+
+def allocate() -> list[bytes]:
+    return [bytes(1000) for _ in range(100)]
+
+def test_disabled_profiler_writes_nothing(tmp_path: Path) -> None:
+    profiler = Profiler()
+    profiler.directory = tmp_path
+    with profiler.profile("load"):
+        allocate()
+    assert list(tmp_path.iterdir()) == []
+
+def test_profile_writes_stats_and_allocations(tmp_path: Path) -> None:
+    profiler = Profiler()
+    profiler.configure(tmp_path / "profiles", rate=1.0)
+    with profiler.profile("load"):
+        kept = allocate()
+
+    prof = next((tmp_path / "profiles").glob("load-*.prof"))
+    alloc = next((tmp_path / "profiles").glob("load-*.alloc.txt"))
+    functions = {function for _, _, function in pstats.Stats(str(prof)).stats}  # type: ignore[attr-defined]
+    assert "allocate" in functions
+    assert alloc.read_text("utf-8").startswith("Top ")
+    assert not tracemalloc.is_tracing()
+    assert len(kept) == 100
+
+def test_nested_operations_are_not_profiled(tmp_path: Path) -> None:
+    profiler = Profiler()
+    profiler.configure(tmp_path, rate=1.0)
+    with profiler.profile("outer"):
+        with profiler.profile("inner"):
+            allocate()
+    assert [path.suffix for path in tmp_path.glob("inner-*")] == []
+    assert len(list(tmp_path.glob("outer-*"))) == 2
+
+def test_sampling_rate(tmp_path: Path) -> None:
+    profiler = Profiler()
+    profiler.configure(tmp_path, rate=0.0)
+    with profiler.profile("load"):
+        allocate()
+    assert list(tmp_path.iterdir()) == []
+    with pytest.raises(ValueError):
+        profiler.configure(tmp_path, rate=2)
@@ -1,4 +1,5 @@
-from src.io.reader import CsvReader
+from src.io.reader import CsvReader, Reader
+from typing import Callable
 from pathlib import Path
 import pytest
 
@@ -14,3 +15,17 @@ def test_reader(sample_csv: Path) -> None:
     res = reader.read(sample_csv, lambda row: row["data"])
     assert "2025-06-28" in res
     assert res["2025-06-28"]["value"] == "150"
+
+def test_reader_iter_read_streams_rows(sample_csv: Path) -> None:
+    reader: CsvReader[str] = CsvReader(delimiter=";")
+    rows = reader.iter_read(sample_csv, lambda row: row["data"])
+
+    assert next(rows) == ("2025-06-28", {"data": "2025-06-28", "value": "150"})
+    assert [key for key, _ in rows] == ["2025-06-29"]
+
+def test_base_reader_iter_read_defaults_to_read(sample_csv: Path) -> None:
+    class DictReader(Reader[str, str]):
+        def read(self, path: Path, key_func: Callable[[str], str]) -> dict[str, str]:
+            return {"a": "1"}
+
+    assert list(DictReader().iter_read(sample_csv, str)) == [("a", "1")]
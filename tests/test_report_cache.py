@@ -0,0 +1,69 @@
+from src.report_cache import ReportCache, Reports
+from src.index import DayStats, SortedDays, TotalsRanking
+from src.file_watcher import SalesSnapshot
+from src.hourly_profile import HourlyProfile
+from datetime import date
+from unittest.mock import MagicMock
+
+def snapshot_of(version: int, amounts: dict[date, list[float]]) -> SalesSnapshot:
+    stats = {day: DayStats.from_amounts(values) for day, values in amounts.items()}
+    ranking = TotalsRanking()
+    for day, day_stats in stats.items():
+        ranking = ranking.updated(day, day_stats.total)
+    return SalesSnapshot(version, {}, stats, ranking, SortedDays(sorted(stats)), {}, HourlyProfile())
+
+def sorted_trend(snapshot: SalesSnapshot) -> list[tuple[date, float]]:
+    return sorted(((day, s.total) for day, s in snapshot.stats.items()), key=lambda x: x[1], reverse=True)
+
+def test_build_matches_stable_sort() -> None:
+    snapshot = snapshot_of(1, {date(2025, 7, 1): [10], date(2025, 7, 2): [30], date(2025, 7, 3): [10], date(2025, 7, 4): [20]})
+    reports = Reports.build(snapshot)
+    assert reports.trend == sorted_trend(snapshot)
+    assert reports.totals == {day: s.total for day, s in snapshot.stats.items()}
+    assert reports.averages == {day: s.mean for day, s in snapshot.stats.items()}
+
+def test_apply_recomputes_changed_days_only() -> None:
+    first = snapshot_of(1, {date(2025, 7, 1): [10], date(2025, 7, 2): [30], date(2025, 7, 3): [10]})
+    reports = Reports.build(first)
+
+    second = snapshot_of(4, {date(2025, 7, 1): [40], date(2025, 7, 3): [10], date(2025, 7, 4): [10]})
+    updated = reports.apply(second, {date(2025, 7, 1), date(2025, 7, 2), date(2025, 7, 4)})
+
+    assert updated.version == 4
+    assert updated.trend == sorted_trend(second)
+    assert updated.totals == {day: s.total for day, s in second.stats.items()}
+    assert reports.trend == sorted_trend(first)
+
+def test_apply_tracks_outliers() -> None:
+    day = date(2025, 7, 1)
+    reports = Reports.build(snapshot_of(1, {day: [10, 10, 10]}))
+    assert reports.outliers == {}
+
+    with_outlier = snapshot_of(2, {day: [10, 10, 10]})
+    with_outlier.stats[day].outliers = (50.0,)
+    updated = reports.apply(with_outlier, {day})
+    assert updated.outliers == {day: [50.0]}
+    assert updated.apply(snapshot_of(3, {day: [10]}), {day}).outliers == {}
+
+def test_report_cache_serves_unchanged_version() -> None:
+    cache = ReportCache()
+    snapshot = snapshot_of(1, {date(2025, 7, 1): [10]})
+    changes_since = MagicMock(return_value=set())
+
+    first = cache.get(snapshot, changes_since)
+    assert cache.get(snapshot, changes_since) is first
+    changes_since.assert_not_called()
+
+def test_report_cache_applies_changes_or_rebuilds() -> None:
+    cache = ReportCache()
+    cache.get(snapshot_of(1, {date(2025, 7, 1): [10]}), MagicMock())
+
+    snapshot = snapshot_of(2, {date(2025, 7, 1): [10], date(2025, 7, 2): [20]})
+    changes_since = MagicMock(return_value={date(2025, 7, 2)})
+    assert cache.get(snapshot, changes_since).totals == {date(2025, 7, 1): 10, date(2025, 7, 2): 20}
+    changes_since.assert_called_once_with(1)
+
+    snapshot = snapshot_of(5, {date(2025, 7, 3): [5]})
+    assert cache.get(snapshot, MagicMock(return_value=None)).totals == {date(2025, 7, 3): 5}
+    assert cache.get(snapshot_of(4, {}), MagicMock()).totals == {}
+    assert cache.get(snapshot, MagicMock()).trend == [(date(2025, 7, 3), 5)]
@@ -0,0 +1,89 @@
+from src.runtime import SalesRuntime, build_day_reader
+from src.file_watcher import HourlySalesCsvHandler
+from src.io.pandas_reader import PandasCsvReader
+from src.io.mmap_reader import MmapCsvReader
+from src.metrics import METRICS
+from src.profiling import PROFILER
+from unittest.mock import patch
+from datetime import date
+from pathlib import Path
+import argparse
+import json
+import pytest
+
+def test_sales_runtime_start_and_stop(tmp_path: Path) -> None:
+    (tmp_path / "2025-07-05.csv").write_text("hour;sales_amount;product;region\n09:00;100;Widget A;North\n", "utf-8")
+    args = argparse.Namespace(
+        dir=tmp_path, key_name="hour", workers=1, snapshot=True, quiet_window=0.5,
+        ingest_workers=2, ingest_queue_size=10, engine="csv", metrics=False, metrics_port=0,
+        profile=False, profile_rate=1.0, verbosity="quiet", archive=True,
+    )
+
+    runtime = SalesRuntime(args)
+    runtime.start()
+    runtime.stop()
+
+    assert runtime.service.total_price_per_day() == {date(2025, 7, 5): 100}
+    assert (tmp_path / "cache" / "store.snapshot").exists()
+
+@pytest.mark.parametrize(("engine", "parsed"), [("csv", False), ("mmap", True)])
+def test_sales_runtime_snapshot_depends_on_parser_config(tmp_path: Path, engine: str, parsed: bool) -> None:
+    (tmp_path / "2025-07-05.csv").write_text("hour;sales_amount;product;region\n09:00;100;Widget A;North\n", "utf-8")
+    args = argparse.Namespace(
+        dir=tmp_path, key_name="hour", workers=1, snapshot=True, quiet_window=0.5,
+        ingest_workers=0, ingest_queue_size=10, engine="csv", metrics=False, metrics_port=0,
+        profile=False, profile_rate=1.0, verbosity="quiet", archive=False,
+    )
+    SalesRuntime(args)
+
+    args.engine = engine
+    with patch.object(HourlySalesCsvHandler, "_parse", autospec=True, side_effect=HourlySalesCsvHandler._parse) as parse:
+        runtime = SalesRuntime(args)
+
+    assert parse.called is parsed
+    assert runtime.service.total_price_per_day() == {date(2025, 7, 5): 100}
+
+def test_build_day_reader() -> None:
+    assert build_day_reader("csv", "hour") is None
+    assert isinstance(build_day_reader("pandas", "hour"), PandasCsvReader)
+    assert isinstance(build_day_reader("mmap", "hour"), MmapCsvReader)
+    with pytest.raises(ValueError):
+        build_day_reader("fortran", "hour")
+
+def test_sales_runtime_dumps_metrics(tmp_path: Path) -> None:
+    (tmp_path / "2025-07-05.csv").write_text("hour;sales_amount;product;region\n09:00;100;Widget A;North\n", "utf-8")
+    args = argparse.Namespace(
+        dir=tmp_path, key_name="hour", workers=1, snapshot=False, quiet_window=0.5,
+        ingest_workers=2, ingest_queue_size=10, engine="csv", metrics=True, metrics_port=0,
+        profile=False, profile_rate=1.0, verbosity="quiet", archive=True,
+    )
+    try:
+        runtime = SalesRuntime(args)
+        runtime.start()
+        runtime.stop()
+    finally:
+        METRICS.enabled = False
+        METRICS.reset()
+
+    dump = json.loads((tmp_path / "logs" / "metrics.json").read_text("utf-8"))
+    counters = {counter["name"]: counter["value"] for counter in dump["counters"]}
+    gauges = {gauge["name"]: gauge["value"] for gauge in dump["gauges"]}
+    assert counters["rows_ingested_total"] == 1
+    assert gauges["store_days"] == 1
+    assert "file_load_seconds" in {histogram["name"] for histogram in dump["histograms"]}
+
+def test_sales_runtime_profiles_initial_load(tmp_path: Path) -> None:
+    (tmp_path / "2025-07-05.csv").write_text("hour;sales_amount;product;region\n09:00;100;Widget A;North\n", "utf-8")
+    args = argparse.Namespace(
+        dir=tmp_path, key_name="hour", workers=1, snapshot=False, quiet_window=0.5,
+        ingest_workers=0, ingest_queue_size=10, engine="csv", metrics=False, metrics_port=0,
+        profile=True, profile_rate=1.0, verbosity="quiet", archive=True,
+    )
+    try:
+        runtime = SalesRuntime(args)
+        runtime.service.generate_report()
+    finally:
+        PROFILER.enabled = False
+
+    names = {path.name.split("-")[0] for path in (tmp_path / "logs" / "profiles").glob("*.prof")}
+    assert names == {"initialize_from_directory", "generate_report"}
@@ -1,9 +1,17 @@
-from src.model import SalesDay, HourlySales, RegionDirection
+from src.model import SalesDay, HourlySales, Period, RegionDirection
 from src.service import SalesService
-from unittest.mock import MagicMock
+from src.cube import Dimension
+from src.index import SalesIndex
+from src.file_watcher import SalesSnapshot
+from src.report_cache import Reports
+from unittest.mock import MagicMock, patch
 from datetime import date, time
 import pytest
 
+def snapshot_of(store: dict[date, SalesDay], version: int = 0) -> SalesSnapshot:
+    index = SalesIndex.from_store(store)
+    return SalesSnapshot(version, store, index.days, index.ranking, index.dates, index.rollup_views(), index.profile)
+
 @pytest.fixture
 def mock() -> MagicMock:
     return MagicMock()
@@ -11,6 +19,7 @@ def mock() -> MagicMock:
 @pytest.fixture
 def mock_handler(mock: MagicMock, dummy_store: dict[date, SalesDay]) -> MagicMock:
     mock.store = dummy_store
+    mock.snapshot.return_value = snapshot_of(dummy_store)
     return mock
 
 @pytest.fixture
@@ -37,19 +46,6 @@ def test_generate_report(mock: MagicMock, mock_service: SalesService) -> None:
 
 
 
-@pytest.mark.parametrize("values, expected" ,[
-     ([10, 20, 30], 20),
-     ([100, 100], 100)
-])
-def test_avg(values: list[float], expected: int) -> None:
-    service = SalesService(MagicMock())
-    result = service._avg(values)
-    assert result == expected
-
-def test_get_sales_amount(mock: MagicMock, mock_service: SalesService) -> None:
-    result = mock_service._get_sales_amount()
-    assert result == {date(2025, 7, 5): [150, 150]}
-
 def test_total_price_per_day(mock: MagicMock, mock_service: SalesService) -> None:
     result = mock_service.total_price_per_day()
     assert result == {date(2025, 7, 5): 300}
@@ -69,6 +65,7 @@ def test_sales_trend(mock:MagicMock, mock_service: SalesService) -> None:
             time(10, 0): HourlySales(sales_amount=150, product="Widget B", region=RegionDirection.NORTH)
         }),
     }
+    mock.handler.snapshot.return_value = snapshot_of(mock.handler.store)
     service = SalesService(hourly_sales_csv_handler=mock.handler)
     result = service.sales_trend()
     assert result == [(date(2025,7,5), 300), (date(2025, 5, 5), 300)]
@@ -85,6 +82,139 @@ def test_detect_outliers(mock: MagicMock) -> None:
             time(15,0): HourlySales(sales_amount=85, product="Widget C", region=RegionDirection.EAST),
         })
     }
+    mock.handler.snapshot.return_value = snapshot_of(mock.handler.store)
     service = SalesService(hourly_sales_csv_handler=mock.handler)
     result = service.detect_outliers()
     assert result == {date(2025,7,5): [500]}
+
+def test_detect_outliers_single_sale_day(mock: MagicMock) -> None:
+    mock.handler.store = {
+        date(2025, 7, 5): SalesDay(data={
+            time(9, 0): HourlySales(sales_amount=100, product="Widget A", region=RegionDirection.EAST),
+        })
+    }
+    mock.handler.snapshot.return_value = snapshot_of(mock.handler.store)
+    service = SalesService(hourly_sales_csv_handler=mock.handler)
+    assert service.detect_outliers() == {}
+
+def test_version_follows_handler(mock: MagicMock, mock_service: SalesService) -> None:
+    mock.version = 7
+    assert mock_service.version == 7
+
+def test_get_day(mock_service: SalesService) -> None:
+    assert mock_service.get_day(date(2025, 7, 5)) is not None
+    assert mock_service.get_day(date(2025, 7, 6)) is None
+
+def test_reports_are_memoized_per_version(mock: MagicMock, dummy_store: dict[date, SalesDay]) -> None:
+    mock.snapshot.return_value = snapshot_of(dummy_store)
+    service = SalesService(hourly_sales_csv_handler=mock)
+    with patch.object(Reports, "build", wraps=Reports.build) as build:
+        report = service.generate_report()
+        assert service.total_price_per_day() == report["daily_totals"]
+    build.assert_called_once()
+
+    new_day = SalesDay(data={time(9, 0): HourlySales(sales_amount=500, product="Widget A", region=RegionDirection.EAST)})
+    store = {**dummy_store, date(2025, 7, 6): new_day}
+    mock.snapshot.return_value = snapshot_of(store, version=1)
+    mock.changes_since.return_value = {date(2025, 7, 6)}
+
+    assert service.sales_trend() == [(date(2025, 7, 6), 500), (date(2025, 7, 5), 300)]
+    mock.changes_since.assert_called_once_with(0)
+
+def test_memoized_reports_are_copied_for_callers(mock: MagicMock) -> None:
+    amounts = [100.0] * 10 + [5000.0]
+    store = {date(2025, 7, 5): SalesDay(data={
+        time(hour, 0): HourlySales(sales_amount=amount, product="Widget A", region=RegionDirection.EAST)
+        for hour, amount in enumerate(amounts)
+    })}
+    mock.snapshot.return_value = snapshot_of(store)
+    service = SalesService(hourly_sales_csv_handler=mock)
+    expected = service.generate_report()
+
+    report = service.generate_report()
+    report["daily_totals"].clear()
+    report["trends"].append((date(2025, 7, 6), 1))
+    report["outliers"][date(2025, 7, 5)].append(1)
+    service.total_price_per_day()[date(2025, 7, 5)] = 0
+    service.calculate_avg_sales().clear()
+    service.detect_outliers()[date(2025, 7, 5)].clear()
+    service.sales_trend().clear()
+
+    assert service.generate_report() == expected
+    assert expected["outliers"] == {date(2025, 7, 5): [5000]}
+
+def test_ranking_queries(mock: MagicMock) -> None:
+    store = {
+        date(2025, 7, day): SalesDay(data={
+            time(9, 0): HourlySales(sales_amount=amount, product="Widget A", region=RegionDirection.EAST),
+        })
+        for day, amount in [(1, 100), (2, 300), (3, 200)]
+    }
+    mock.snapshot.return_value = snapshot_of(store)
+    service = SalesService(hourly_sales_csv_handler=mock)
+
+    assert service.top_days(1) == [(date(2025, 7, 2), 300)]
+    assert service.bottom_days(1) == [(date(2025, 7, 1), 100)]
+    assert service.trend_page(1, 5) == [(date(2025, 7, 3), 200), (date(2025, 7, 1), 100)]
+    assert service.rank_of_day(date(2025, 7, 3)) == 2
+    assert service.total_percentile(0.5) == 200
+
+def test_reports_within_date_range(mock: MagicMock) -> None:
+    store = {
+        date(2025, 7, day): SalesDay(data={
+            time(9, 0): HourlySales(sales_amount=amount, product="Widget A", region=RegionDirection.EAST),
+            time(10, 0): HourlySales(sales_amount=amount * 10, product="Widget B", region=RegionDirection.EAST),
+            time(11, 0): HourlySales(sales_amount=amount, product="Widget A", region=RegionDirection.EAST),
+        })
+        for day, amount in [(3, 100), (1, 300), (2, 200)]
+    }
+    mock.snapshot.return_value = snapshot_of(store)
+    service = SalesService(hourly_sales_csv_handler=mock)
+    start, end = date(2025, 7, 2), date(2025, 7, 3)
+
+    assert list(service.total_price_per_day(start=start, end=end).items()) == [(date(2025, 7, 2), 2400), (date(2025, 7, 3), 1200)]
+    assert service.calculate_avg_sales(start=start, end=start) == {date(2025, 7, 2): 800}
+    assert service.sales_trend(end=start) == [(date(2025, 7, 1), 3600), (date(2025, 7, 2), 2400)]
+    assert service.detect_outliers(start=end) == {date(2025, 7, 3): [1000]}
+    assert service.date_bounds() == (date(2025, 7, 1), date(2025, 7, 3))
+
+def test_date_bounds_of_empty_store(mock: MagicMock) -> None:
+    mock.snapshot.return_value = snapshot_of({})
+    assert SalesService(hourly_sales_csv_handler=mock).date_bounds() is None
+
+def test_period_totals(mock: MagicMock, dummy_store: dict[date, SalesDay]) -> None:
+    store = {**dummy_store, date(2025, 6, 30): dummy_store[date(2025, 7, 5)], date(2025, 8, 1): dummy_store[date(2025, 7, 5)]}
+    mock.snapshot.return_value = snapshot_of(store)
+    service = SalesService(hourly_sales_csv_handler=mock)
+
+    assert list(service.period_totals(Period.MONTH).items()) == [
+        (date(2025, 6, 1), 300), (date(2025, 7, 1), 300), (date(2025, 8, 1), 300)
+    ]
+    assert service.period_totals(Period.WEEK) == {date(2025, 6, 30): 600, date(2025, 7, 28): 300}
+    assert service.period_sales(Period.YEAR)[date(2025, 1, 1)].count == 6
+
+def test_sales_by_product_and_region(mock: MagicMock, dummy_store: dict[date, SalesDay]) -> None:
+    mock.snapshot.return_value = snapshot_of(dummy_store)
+    service = SalesService(hourly_sales_csv_handler=mock)
+
+    result = service.sales_by([Dimension.PRODUCT], regions=[RegionDirection.EAST])
+    assert {key: (cell.count, cell.total) for key, cell in result.items()} == {("Widget A",): (1, 150)}
+    assert service.sales_by(start=date(2025, 7, 6)) == {}
+
+def test_hourly_profile_and_anomalies(mock: MagicMock) -> None:
+    store = {
+        date(2025, 7, day): SalesDay(data={
+            time(9, 0): HourlySales(sales_amount=amount, product="Widget A", region=RegionDirection.EAST),
+            time(14, 0): HourlySales(sales_amount=10, product="Widget A", region=RegionDirection.EAST),
+        })
+        for day, amount in [(1, 100), (2, 200), (3, 300)]
+    }
+    mock.snapshot.return_value = snapshot_of(store)
+    service = SalesService(hourly_sales_csv_handler=mock)
+
+    profile = service.hourly_profile()
+    assert len(profile) == 24
+    assert profile[9] == pytest.approx((200, 100))
+    assert service.peak_hours(2) == [(9, 200), (14, 10)]
+    assert service.hour_anomalies(date(2025, 7, 3))[9] == pytest.approx((300, 1))
+    assert service.hour_anomalies(date(2025, 7, 9)) == {}
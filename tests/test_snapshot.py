@@ -0,0 +1,93 @@
+from src.model import SalesDay, HourlySales, RegionDirection
+from src.snapshot import StoreSnapshot, SalesDayCodec, SNAPSHOT_VERSION
+from datetime import time
+from pathlib import Path
+from unittest.mock import patch
+import numpy as np
+import pickle
+import pytest
+
+@pytest.fixture
+def csv_file(tmp_path: Path) -> Path:
+    file_path = tmp_path / "2025-07-05.csv"
+    file_path.write_text("hour;sales_amount;product;region\n09:00;100;Widget A;North\n", "utf-8")
+    return file_path
+
+@pytest.fixture
+def sales_day() -> SalesDay:
+    return SalesDay(data={
+        time(9, 0): HourlySales(sales_amount=100, product="Widget A", region=RegionDirection.NORTH),
+    })
+
+def test_snapshot_round_trip(tmp_path: Path, csv_file: Path, sales_day: SalesDay) -> None:
+    snapshot = StoreSnapshot[SalesDay](tmp_path / "cache" / "store.snapshot", SalesDayCodec())
+    fingerprint = snapshot.fingerprint(csv_file)
+    snapshot.put(csv_file, fingerprint, sales_day, 1)
+    snapshot.save()
+
+    restored = StoreSnapshot[SalesDay](tmp_path / "cache" / "store.snapshot", SalesDayCodec())
+    assert restored.get(csv_file, fingerprint) == (sales_day, 1)
+
+def test_snapshot_miss_when_file_changed(tmp_path: Path, csv_file: Path, sales_day: SalesDay) -> None:
+    snapshot = StoreSnapshot[SalesDay](tmp_path / "store.snapshot", SalesDayCodec())
+    snapshot.put(csv_file, snapshot.fingerprint(csv_file), sales_day, 1)
+
+    csv_file.write_text("hour;sales_amount;product;region\n09:00;200;Widget A;North\n", "utf-8")
+    assert snapshot.get(csv_file, snapshot.fingerprint(csv_file)) is None
+
+def test_snapshot_save_drops_removed_files(tmp_path: Path, csv_file: Path, sales_day: SalesDay) -> None:
+    snapshot = StoreSnapshot[SalesDay](tmp_path / "store.snapshot", SalesDayCodec())
+    snapshot.put(csv_file, snapshot.fingerprint(csv_file), sales_day, 1)
+    csv_file.unlink()
+    snapshot.save()
+    assert snapshot.entries == {}
+
+def test_snapshot_ignores_unreadable_file(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    path = tmp_path / "store.snapshot"
+    path.write_bytes(b"not a pickle")
+    assert StoreSnapshot[SalesDay](path, SalesDayCodec()).entries == {}
+    assert "Cannot read snapshot" in caplog.text
+
+def test_snapshot_ignores_other_version(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    path = tmp_path / "store.snapshot"
+    snapshot = StoreSnapshot[SalesDay](path, SalesDayCodec())
+    snapshot.save()
+    with np.load(path) as data:
+        arrays = dict(data)
+    arrays["version"] = np.array(SNAPSHOT_VERSION - 1)
+    with path.open("wb") as file:
+        np.savez(file, **arrays)
+
+    assert StoreSnapshot[SalesDay](path, SalesDayCodec()).entries == {}
+    assert "Ignoring snapshot" in caplog.text
+
+def test_snapshot_ignores_other_parser_config(tmp_path: Path, csv_file: Path, sales_day: SalesDay) -> None:
+    path = tmp_path / "store.snapshot"
+    snapshot = StoreSnapshot[SalesDay](path, SalesDayCodec(), config="key_name=hour engine=csv")
+    snapshot.put(csv_file, snapshot.fingerprint(csv_file), sales_day, 1)
+    snapshot.save()
+
+    assert StoreSnapshot[SalesDay](path, SalesDayCodec(), config="key_name=hour engine=csv").entries
+    assert StoreSnapshot[SalesDay](path, SalesDayCodec(), config="key_name=time engine=csv").entries == {}
+    assert StoreSnapshot[SalesDay](path, SalesDayCodec(), config="key_name=hour engine=mmap").entries == {}
+
+def test_snapshot_is_not_unpickled(tmp_path: Path) -> None:
+    path = tmp_path / "store.snapshot"
+    path.write_bytes(pickle.dumps((1, {})))
+
+    with patch("pickle.load", side_effect=AssertionError("unpickled")), \
+            patch("pickle.loads", side_effect=AssertionError("unpickled")):
+        assert StoreSnapshot[SalesDay](path, SalesDayCodec()).entries == {}
+
+def test_sales_day_codec_round_trip(sales_day: SalesDay) -> None:
+    days = [sales_day, SalesDay(), SalesDay(data={
+        time(10, 0): HourlySales(sales_amount=5.5, product="Widget Z", region=RegionDirection.EAST),
+        time(11, 0): HourlySales(sales_amount=7, product="Widget A", region=RegionDirection.WEST),
+    })]
+    codec = SalesDayCodec()
+    assert codec.decode(codec.encode(days)) == days
+    assert codec.decode(codec.encode([])) == []
+
+def test_sales_day_pickle_keeps_product_names(sales_day: SalesDay) -> None:
+    restored = pickle.loads(pickle.dumps(sales_day))
+    assert restored.data == sales_day.data
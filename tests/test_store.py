@@ -0,0 +1,50 @@
+from src.store import VersionedStore
+import threading
+
+def test_versioned_store_mapping_behaviour() -> None:
+    store: VersionedStore[str, int] = VersionedStore({"a": 1})
+    store["b"] = 2
+    del store["a"]
+    store.update({"c": 3, "d": 4})
+
+    assert dict(store) == {"b": 2, "c": 3, "d": 4}
+    assert "b" in store and "a" not in store
+    assert len(store) == 3
+    assert store.version == 3
+    assert "version=3" in repr(store)
+
+def test_versioned_store_snapshot_is_isolated() -> None:
+    store: VersionedStore[str, int] = VersionedStore({"a": 1})
+    version, snapshot = store.snapshot()
+    store["b"] = 2
+
+    assert version == 0
+    assert dict(snapshot) == {"a": 1}
+    assert store.snapshot()[0] == 1
+
+def test_versioned_store_concurrent_readers_and_writers() -> None:
+    store: VersionedStore[int, int] = VersionedStore()
+    errors: list[Exception] = []
+
+    def write() -> None:
+        for i in range(2000):
+            store[i] = i
+            if i % 3 == 0:
+                del store[i]
+
+    def read() -> None:
+        try:
+            for _ in range(200):
+                _, snapshot = store.snapshot()
+                sum(snapshot.values())
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write)] + [threading.Thread(target=read) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(store) == 2000 - len(range(0, 2000, 3))
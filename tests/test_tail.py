@@ -0,0 +1,64 @@
+from src.io.tail import ingested_prefix, read_appended
+from unittest.mock import patch
+from pathlib import Path
+import hashlib
+
+HEADER = b"hour;sales_amount;product;region\n"
+
+def test_ingested_prefix_stops_after_last_complete_line(tmp_path: Path) -> None:
+    file_path = tmp_path / "2025-07-05.csv"
+    file_path.write_bytes(HEADER + b"09:00;100;Widget A;North\n10:00;5")
+    tail = ingested_prefix(file_path)
+    assert tail is not None
+    assert tail.offset == len(HEADER) + len(b"09:00;100;Widget A;North\n")
+    assert tail.header == ("hour", "sales_amount", "product", "region")
+    assert tail.rows == 0
+    file_path.write_bytes(b"hour;sales")
+    assert ingested_prefix(file_path) is None
+
+def test_ingested_prefix_streams_across_chunk_boundaries(tmp_path: Path) -> None:
+    file_path = tmp_path / "2025-07-05.csv"
+    complete = HEADER + b"".join(f"{hour:02}:00;{hour};Widget A;North\n".encode() for hour in range(24))
+    file_path.write_bytes(complete + b"23:30;1")
+
+    with patch("src.io.tail.CHUNK_SIZE", 7):
+        tail = ingested_prefix(file_path)
+    assert tail is not None
+    assert tail.offset == len(complete)
+    assert tail.digest == hashlib.blake2b(complete, digest_size=16).hexdigest()
+    assert tail.header == ("hour", "sales_amount", "product", "region")
+    assert tail == ingested_prefix(file_path)
+
+def test_ingested_prefix_does_not_materialize_the_file(tmp_path: Path) -> None:
+    file_path = tmp_path / "2025-07-05.csv"
+    file_path.write_bytes(HEADER + b"09:00;100;Widget A;North\n")
+    with patch.object(Path, "read_bytes", side_effect=AssertionError("whole file read")):
+        assert ingested_prefix(file_path) is not None
+
+def test_read_appended_returns_complete_new_lines(tmp_path: Path) -> None:
+    file_path = tmp_path / "2025-07-05.csv"
+    file_path.write_bytes(HEADER + b"09:00;100;Widget A;North\n")
+    tail = ingested_prefix(file_path)
+    assert tail is not None
+
+    with file_path.open("ab") as file:
+        file.write(b"10:00;50;Widget B;East\n11:00;3")
+    with patch("src.io.tail.CHUNK_SIZE", 5):
+        appended = read_appended(file_path, tail)
+    assert appended is not None
+    lines, next_tail = appended
+    assert lines == ["10:00;50;Widget B;East"]
+    assert next_tail == ingested_prefix(file_path)
+
+    assert read_appended(file_path, next_tail) == ([], next_tail)
+
+def test_read_appended_detects_changed_prefix(tmp_path: Path) -> None:
+    file_path = tmp_path / "2025-07-05.csv"
+    file_path.write_bytes(HEADER + b"09:00;100;Widget A;North\n")
+    tail = ingested_prefix(file_path)
+    assert tail is not None
+
+    file_path.write_bytes(HEADER + b"09:00;900;Widget A;North\n10:00;50;Widget B;East\n")
+    assert read_appended(file_path, tail) is None
+    file_path.write_bytes(HEADER)
+    assert read_appended(file_path, tail) is None
@@ -1,5 +1,8 @@
 from unittest.mock import MagicMock
-from datetime import date
+from src.model import SalesDay, HourlySales, Period, RegionDirection
+from src.index import DayStats
+from src.cube import CubeCell, Dimension
+from datetime import date, time
 import pytest
 from pandas import DataFrame
 from src.ui_data_service import UIDataService
@@ -47,3 +50,79 @@ def test_report_detect_outliers(mock_service: MagicMock, mock_report_service: UI
     assert isinstance(result, DataFrame)
     assert len(result) == 1
 
+
+def test_report_day_sales(mock_service: MagicMock, mock_report_service: UIDataService) -> None:
+    mock_service.get_day.return_value = SalesDay(data={
+        time(9, 0): HourlySales(sales_amount=100, product="Widget A", region=RegionDirection.EAST),
+    })
+
+    result = mock_report_service.report_day_sales(date(2025, 7, 5))
+    assert list(result.columns) == ["Hour", "Sales", "Product", "Region"]
+    assert result.iloc[0]["Region"] == "East"
+
+def test_report_day_sales_missing_day(mock_service: MagicMock, mock_report_service: UIDataService) -> None:
+    mock_service.get_day.return_value = None
+    assert mock_report_service.report_day_sales(date(2025, 7, 5)).empty
+
+def test_reports_are_cached_per_store_version(mock_service: MagicMock, mock_report_service: UIDataService) -> None:
+    mock_service.version = 1
+    mock_service.total_price_per_day.return_value = {date(2025, 7, 5): 1000}
+
+    first = mock_report_service.report_total_price_per_day()
+    assert mock_report_service.report_total_price_per_day() is first
+    mock_service.total_price_per_day.assert_called_once()
+
+    mock_service.version = 2
+    assert mock_report_service.report_total_price_per_day() is not first
+    assert mock_service.total_price_per_day.call_count == 2
+
+def test_report_sales_trend_page(mock_service: MagicMock, mock_report_service: UIDataService) -> None:
+    mock_service.trend_page.return_value = [(date(2025, 7, 7), 850), (date(2025, 7, 5), 150)]
+    result = mock_report_service.report_sales_trend_page(page=1, page_size=2)
+    mock_service.trend_page.assert_called_once_with(2, 2)
+    assert list(result["Rank"]) == [3, 4]
+    assert list(result.columns) == ["Rank", "Day", "Sales"]
+
+def test_report_top_and_bottom_days(mock_service: MagicMock, mock_report_service: UIDataService) -> None:
+    mock_service.top_days.return_value = [(date(2025, 7, 7), 850)]
+    mock_service.bottom_days.return_value = [(date(2025, 7, 5), 150), (date(2025, 7, 7), 850)]
+    assert list(mock_report_service.report_top_days(1)["Rank"]) == [1]
+    assert len(mock_report_service.report_bottom_days(2)) == 2
+
+def test_reports_are_cached_per_date_range(mock_service: MagicMock, mock_report_service: UIDataService) -> None:
+    mock_service.version = 1
+    mock_service.total_price_per_day.return_value = {date(2025, 7, 5): 1000}
+    start, end = date(2025, 7, 1), date(2025, 7, 31)
+
+    first = mock_report_service.report_total_price_per_day(start, end)
+    assert mock_report_service.report_total_price_per_day(start, end) is first
+    mock_report_service.report_total_price_per_day()
+
+    assert mock_service.total_price_per_day.call_count == 2
+    mock_service.total_price_per_day.assert_called_with(start=None, end=None)
+
+def test_report_period_sales(mock_service: MagicMock, mock_report_service: UIDataService) -> None:
+    mock_service.period_sales.return_value = {date(2025, 7, 1): DayStats.from_amounts([100, 200])}
+    result = mock_report_service.report_period_sales(Period.MONTH)
+    mock_service.period_sales.assert_called_once_with(Period.MONTH)
+    assert result.to_dict("records") == [
+        {"Period": date(2025, 7, 1), "Total sales": 300, "Avg sales": 150, "Sales count": 2}
+    ]
+
+def test_report_sales_by(mock_service: MagicMock, mock_report_service: UIDataService) -> None:
+    mock_service.sales_by.return_value = {("Widget A", RegionDirection.EAST): CubeCell(2, 300)}
+    result = mock_report_service.report_sales_by([Dimension.PRODUCT, Dimension.REGION])
+    assert result.to_dict("records") == [
+        {"Product": "Widget A", "Region": "East", "Total sales": 300, "Sales count": 2, "Avg sales": 150}
+    ]
+
+def test_hourly_profile_reports(mock_service: MagicMock, mock_report_service: UIDataService) -> None:
+    mock_service.hourly_profile.return_value = {9: (200.0, 100.0), 10: (0.0, 0.0)}
+    mock_service.peak_hours.return_value = [(9, 200.0)]
+    mock_service.hour_anomalies.return_value = {9: (300.0, 1.0)}
+
+    assert list(mock_report_service.report_hourly_profile().columns) == ["Hour", "Avg sales", "Stdev"]
+    assert mock_report_service.report_peak_hours(1).to_dict("records") == [{"Hour": 9, "Avg sales": 200.0}]
+    assert mock_report_service.report_hour_anomalies(date(2025, 7, 5)).to_dict("records") == [
+        {"Hour": 9, "Sales": 300.0, "Score": 1.0}
+    ]
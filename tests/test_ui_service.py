@@ -1,11 +1,16 @@
 from unittest.mock import MagicMock, patch
 from src.ui_service import UiService
 from src.ui_data_service import UIDataService
+from src.model import Period
+from src.cube import Dimension
+from datetime import date
 import pytest
 
 @pytest.fixture
 def mock_service() -> MagicMock:
-    return MagicMock()
+    mock = MagicMock()
+    mock.date_bounds.return_value = None
+    return mock
 
 @pytest.fixture
 def mock_report_service(mock_service: MagicMock) -> UIDataService:
@@ -45,4 +50,71 @@ def test_show_ui_outlier(mock_st: MagicMock, mock_report: MagicMock, mock_ui_ser
     mock_st.sidebar.radio.return_value = "Outlier"
     mock_st.sidebar.button.return_value = True
     mock_ui_service.show_ui()
-    mock_report.assert_called_once()
\ No newline at end of file
+    mock_report.assert_called_once()
+@patch("src.ui_service.UIDataService.report_total_price_per_day")
+@patch("src.ui_service.st")
+def test_show_ui_uses_selected_date_range(
+        mock_st: MagicMock, mock_report: MagicMock, mock_service: MagicMock, mock_ui_service: UiService
+) -> None:
+    mock_service.date_bounds.return_value = (date(2025, 7, 1), date(2025, 7, 31))
+    mock_st.sidebar.radio.return_value = "Daily total sales"
+    mock_st.sidebar.date_input.return_value = (date(2025, 7, 2), date(2025, 7, 9))
+    mock_ui_service.show_ui()
+    mock_report.assert_called_once_with(date(2025, 7, 2), date(2025, 7, 9))
+
+    mock_report.reset_mock()
+    mock_st.sidebar.date_input.return_value = (date(2025, 7, 2),)
+    mock_ui_service.show_ui()
+    mock_report.assert_called_once_with(None, None)
+
+    mock_report.reset_mock()
+    mock_st.sidebar.date_input.return_value = (date(2025, 7, 1), date(2025, 7, 31))
+    mock_ui_service.show_ui()
+    mock_report.assert_called_once_with(None, None)
+
+@pytest.mark.parametrize("choice, period", [
+    ("Weekly sales", Period.WEEK),
+    ("Monthly sales", Period.MONTH),
+    ("Quarterly sales", Period.QUARTER),
+    ("Yearly sales", Period.YEAR),
+])
+@patch("src.ui_service.UIDataService.report_period_sales")
+@patch("src.ui_service.st")
+def test_show_ui_period_sales(
+        mock_st: MagicMock, mock_report: MagicMock, choice: str, period: Period, mock_ui_service: UiService
+) -> None:
+    mock_st.sidebar.radio.return_value = choice
+    mock_ui_service.show_ui()
+    mock_report.assert_called_once_with(period)
+
+@patch("src.ui_service.UIDataService.report_sales_by")
+@patch("src.ui_service.st")
+def test_show_ui_sales_by(mock_st: MagicMock, mock_report: MagicMock, mock_ui_service: UiService) -> None:
+    mock_st.sidebar.radio.return_value = "Sales by product and region"
+    mock_st.multiselect.return_value = [Dimension.REGION]
+    mock_ui_service.show_ui()
+    mock_report.assert_called_once_with([Dimension.REGION], start=None, end=None)
+
+@patch("src.ui_service.UIDataService.report_hour_anomalies")
+@patch("src.ui_service.UIDataService.report_peak_hours")
+@patch("src.ui_service.UIDataService.report_hourly_profile")
+@patch("src.ui_service.st")
+def test_show_ui_hourly_profile(
+        mock_st: MagicMock,
+        mock_profile: MagicMock,
+        mock_peaks: MagicMock,
+        mock_anomalies: MagicMock,
+        mock_service: MagicMock,
+        mock_ui_service: UiService,
+) -> None:
+    mock_service.date_bounds.return_value = (date(2025, 7, 1), date(2025, 7, 31))
+    mock_st.sidebar.radio.return_value = "Hourly profile"
+    mock_st.sidebar.date_input.return_value = (date(2025, 7, 1), date(2025, 7, 31))
+    mock_st.date_input.return_value = date(2025, 7, 4)
+    mock_ui_service.show_ui()
+    mock_profile.assert_called_once()
+    mock_peaks.assert_called_once()
+    mock_anomalies.assert_called_once_with(date(2025, 7, 4))
+    mock_st.date_input.assert_called_once_with(
+        "Hour anomalies of", value=date(2025, 7, 31), min_value=date(2025, 7, 1), max_value=date(2025, 7, 31)
+    )